@@ -29,7 +29,7 @@ __all__ = [
     'QListWidgetItem', 'QTabWidget', 'QTextEdit', 'QUndoView', 'QScrollArea', 
     'QBuffer', 'QIODevice', 'QMimeData', 'QModelIndex', 'QPrinter', 
     'QKeySequence', 'QPointF', 'QPoint', 'QRectF', 'QSize', 'QPixmap', 'QImage', 
-    'QFont', 'QMouseEvent', 'QWheelEvent', 'QIcon', 'QDrag',
+    'QFont', 'QFontMetrics', 'QMouseEvent', 'QWheelEvent', 'QIcon', 'QDrag',
     # Error handling
     'GameQtError', 'GameQtNotImplementedError', 'GameQtExternalError', 
     'GameQtInternalError', 'ErrorCategory', 'get_logger', 'show_error_dialog'
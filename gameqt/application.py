@@ -1,5 +1,8 @@
+import heapq
+import itertools
+import weakref
 import pygame
-from .core import QMouseEvent, Qt, QPointF, QClipboard, QMimeData, QUrl
+from .core import QMouseEvent, QKeyEvent, QFocusEvent, Qt, QPointF, QClipboard, QMimeData, QUrl, Signal
 
 class QDragEnterEvent:
     def __init__(self, pos, mimeData): self._pos, self._mime = pos, mimeData; self._accepted = False
@@ -19,9 +22,17 @@ class QDropEvent:
     def isAccepted(self): return self._accepted
 
 class QApplication:
+    class RepaintMode: Continuous = 0; OnDemand = 1
+    class IdleMode: Poll = 0; Wait = 1
+    _POINTER_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL)
     _instance = None
     _clipboard = None
     _global_style = {}
+    # Computed styles shared between widgets, keyed by style context. Widgets re-derive their
+    # key when the generation moves; a global stylesheet change also drops the table.
+    _style_generation = 0
+    _computed_styles = {}
+    MAX_COMPUTED_STYLES = 4096
     
     DEFAULT_SYSTEM_STYLE = """
     QWidget { 
@@ -86,11 +97,50 @@ class QApplication:
         QApplication._instance = self
         QApplication._clipboard = QClipboard()
         self._windows = []
-        self._shortcuts = []
+        # Shortcut keymap: chord tuple -> owners, plus refcounts of multi-chord prefixes
+        self._keymap = {}
+        self._keymap_prefixes = {}
+        self._pending_chord = ()
         self._popups = [] 
         self._running = False
         self._stylesheet = ""
         
+        # Damage tracking for RepaintMode.OnDemand
+        self._repaint_mode = QApplication.RepaintMode.Continuous
+        self._dirty = True
+        self._dirty_widgets = set()
+        self._repaint_deadline = None
+        
+        # Timer heap of (deadline, seq, timer_id, timer); seq keeps equal deadlines FIFO
+        self._timer_heap = []
+        self._timer_seq = itertools.count()
+        
+        # Event loop pacing
+        self._idle_mode = QApplication.IdleMode.Poll
+        self._frame_rate = 60
+        
+        # MOUSEMOTION coalescing; widgets in _raw_motion_widgets receive every sample. Weak, so
+        # opting out does not keep a widget alive
+        self._compress_mouse_moves = True
+        self._raw_motion_widgets = weakref.WeakSet()
+        
+        # Per-window pointer hit-test indexes, rebuilt when the geometry generation moves
+        self._hit_generation = 0
+        self._hit_indexes = {}
+        # Widget that keeps receiving pointer events outside its rect until it releases
+        # them (a QScrollArea while its scrollbar is dragged)
+        self._pointer_grab = None
+        
+        # Keyboard focus; key events go to the focus widget and bubble through its ancestors.
+        # Without one they go to the active window (last shown, raised or clicked)
+        self._focus_widget = None
+        self._active_window = None
+        self.focusChanged = Signal(object, object)
+        
+        # Backing-store painting redirects QWidget._get_screen to the innermost surface
+        self._paint_targets = []
+        self._hover_widget = None
+        
         # Initialize global style with default system style
         from .utils import QSSParser
         QApplication._global_style = QSSParser.parse(self.DEFAULT_SYSTEM_STYLE)
@@ -109,17 +159,15 @@ class QApplication:
         actual_ss = ss if ss.strip() else self.DEFAULT_SYSTEM_STYLE
         QApplication._global_style = QSSParser.parse(actual_ss)
         
-        # Invalidate ALL widget style caches globally
-        for win in self._windows:
-            self._invalidate_all_styles(win)
-            win.update()
-            
-    def _invalidate_all_styles(self, widget):
-        if hasattr(widget, '_style_cache'):
-            widget._style_cache.clear()
-        if hasattr(widget, '_children'):
-            for child in widget._children:
-                self._invalidate_all_styles(child)
+        # Every resolved value may change; widgets pick up new styles lazily
+        QApplication._invalidate_styles(clear=True)
+        for win in self._windows: win.update()
+
+    @staticmethod
+    def _invalidate_styles(clear=False):
+        """Makes every widget re-derive its computed-style key on next use."""
+        QApplication._style_generation += 1
+        if clear: QApplication._computed_styles = {}
         
     def styleSheet(self):
         return self._stylesheet
@@ -128,14 +176,178 @@ class QApplication:
     def clipboard(): return QApplication._clipboard
     @staticmethod
     def instance(): return QApplication._instance
+    @staticmethod
+    def focusWidget(): return QApplication._instance._focus_widget if QApplication._instance else None
+    @staticmethod
+    def activeWindow():
+        """The window that receives keys when nothing has focus: the last one shown, raised or
+        clicked while still visible, else the topmost visible window."""
+        app = QApplication._instance
+        if app is None: return None
+        win = app._active_window
+        if win is not None and win.isVisible() and win in app._windows: return win
+        return next((w for w in reversed(app._windows) if w.isVisible()), None)
 
     def add_popup(self, popup):
         if popup not in self._popups:
             self._popups.append(popup)
+            self._mark_dirty()
             
     def remove_popup(self, popup):
         if popup in self._popups:
             self._popups.remove(popup)
+            self._mark_dirty()
+
+    def setRepaintMode(self, mode):
+        """Continuous repaints every frame; OnDemand repaints only when something is dirty."""
+        self._repaint_mode = mode
+        self._mark_dirty()
+    def repaintMode(self): return self._repaint_mode
+
+    def setIdleMode(self, mode):
+        """Poll keeps the fixed frame-rate loop; Wait blocks until input or the next deadline."""
+        self._idle_mode = mode
+        if mode == QApplication.IdleMode.Wait:
+            # Waiting only makes sense when idle frames are not repainted
+            self.setRepaintMode(QApplication.RepaintMode.OnDemand)
+    def idleMode(self): return self._idle_mode
+    def setFrameRate(self, fps): self._frame_rate = max(1, int(fps))
+    def frameRate(self): return self._frame_rate
+
+    def setAttribute(self, attribute, on=True):
+        if attribute == Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents:
+            self._compress_mouse_moves = bool(on)
+    def testAttribute(self, attribute):
+        if attribute == Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents:
+            return self._compress_mouse_moves
+        return False
+
+    def _coalesce_mouse_motion(self, events):
+        """Merges each run of MOUSEMOTION events into one, keeping the latest position and
+        button state and summing the relative motion. Samples over widgets that opted out
+        via QWidget.setMouseMoveCompression(False) are delivered unmerged."""
+        if not self._compress_mouse_moves: return events
+        
+        raw_rects = []
+        if self._raw_motion_widgets and any(e.type == pygame.MOUSEMOTION for e in events):
+            for w in list(self._raw_motion_widgets):
+                if not w.isVisible() or not w.window().isVisible(): continue
+                p = w.mapToGlobal(QPointF(0, 0))
+                raw_rects.append(pygame.Rect(p.x(), p.y(), w._rect.width, w._rect.height))
+        
+        result = []
+        pending = None
+        for event in events:
+            if event.type != pygame.MOUSEMOTION:
+                if pending: result.append(pending); pending = None
+                result.append(event)
+            elif raw_rects and any(r.collidepoint(event.pos) for r in raw_rects):
+                if pending: result.append(pending); pending = None
+                result.append(event)
+            elif pending is None:
+                pending = event
+            else:
+                attrs = dict(event.dict)
+                attrs['rel'] = (pending.rel[0] + event.rel[0], pending.rel[1] + event.rel[1])
+                pending = pygame.event.Event(pygame.MOUSEMOTION, attrs)
+        if pending: result.append(pending)
+        return result
+
+    def _mark_dirty(self, widget=None):
+        self._dirty = True
+        if widget is not None: self._dirty_widgets.add(widget)
+
+    def _schedule_repaint(self, delay_ms):
+        """Requests a repaint after delay_ms even if nothing calls update() (e.g. caret blink)."""
+        deadline = pygame.time.get_ticks() + max(0, int(delay_ms))
+        if self._repaint_deadline is None or deadline < self._repaint_deadline:
+            self._repaint_deadline = deadline
+
+    def _register_timer(self, timer):
+        heapq.heappush(self._timer_heap, (timer._deadline, next(self._timer_seq), timer._timer_id, timer))
+
+    def _next_timer_deadline(self):
+        # Drop entries for timers that were stopped or restarted since being queued
+        heap = self._timer_heap
+        while heap and (not heap[0][3]._active or heap[0][2] != heap[0][3]._timer_id):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def _process_timers(self):
+        """Fires every timer that is due, as one batch, and reschedules repeating ones."""
+        now = pygame.time.get_ticks()
+        due = []
+        while True:
+            deadline = self._next_timer_deadline()
+            if deadline is None or deadline > now: break
+            due.append(heapq.heappop(self._timer_heap)[3])
+        if not due: return
+        
+        for timer in due:
+            if timer._single_shot:
+                timer._active = False
+            else:
+                # Keep the cadence, but never schedule in the past after a stall
+                timer._deadline = max(timer._deadline + max(1, timer._interval), now + 1)
+                self._register_timer(timer)
+        for timer in due:
+            timer.timeout.emit()
+        
+        # Slots mutate widget state directly
+        self._dirty = True
+
+    def _process_async_text(self):
+        """Installs text rasterized on worker threads; each finished job posts TEXT_READY_EVENT."""
+        from .utils import text_renderer
+        if text_renderer.has_pending_text() and text_renderer.collect_async_text(): self._dirty = True
+
+    def _next_deadline(self):
+        """Returns the earliest tick (ms) at which the loop has work to do, or None."""
+        deadlines = [d for d in (self._repaint_deadline, self._next_timer_deadline()) if d is not None]
+        return min(deadlines) if deadlines else None
+
+    def _wait_for_events(self):
+        """Blocks until input arrives or the next deadline expires, unless a repaint is pending."""
+        if self._idle_mode == QApplication.IdleMode.Poll or self._needs_repaint():
+            return pygame.event.get()
+        
+        deadline = self._next_deadline()
+        if deadline is None:
+            event = pygame.event.wait()
+        else:
+            timeout = deadline - pygame.time.get_ticks()
+            if timeout <= 0: return pygame.event.get()
+            event = pygame.event.wait(timeout)
+        
+        if event.type == pygame.NOEVENT: return pygame.event.get()
+        return [event] + pygame.event.get()
+
+    def _needs_repaint(self):
+        if self._repaint_mode == QApplication.RepaintMode.Continuous: return True
+        if self._repaint_deadline is not None and pygame.time.get_ticks() >= self._repaint_deadline:
+            self._repaint_deadline = None
+            self._dirty = True
+        return self._dirty
+
+    def _activate_layouts(self):
+        """Layout pass: re-arranges invalidated layouts in every visible window."""
+        for win in self._windows:
+            if win.isVisible(): win._activate_layouts()
+
+    def _paint(self):
+        """Draws all visible windows and popups, then clears the damage state."""
+        self._activate_layouts()
+        for win in self._windows:
+            if win.isVisible(): win._draw_recursive(pygame.Vector2(0,0))
+        
+        # Draw popups last (highest z-order)
+        for popup in self._popups:
+            if hasattr(popup, '_draw_popup_overlay'):
+                popup._draw_popup_overlay()
+        
+        for widget in self._dirty_widgets: widget._dirty = False
+        self._dirty_widgets.clear()
+        self._dirty = False
 
     def setApplicationName(self, name):
         self._app_name = name
@@ -174,7 +386,7 @@ class QApplication:
                                   # Found window, now find specific child?
                                   # For now just send to window or focused widget?
                                   # Let's try to recursively find the deepest child that accepts drops
-                                  target, target_local_pos = self._find_drop_target(win, pygame.Vector2(mouse_pos), win._rect.topleft)
+                                  target, target_local_pos = self._find_drop_target(win, mouse_pos)
                                   if target: break
                         
                         if target:
@@ -202,8 +414,11 @@ class QApplication:
                                             QApplication.clipboard().setText(mime.text())
                 
                 # Forward other events? (Paint)
+            self._process_timers()
+            self._process_async_text()
             
             # Draw everything to keep UI alive
+            self._activate_layouts()
             for win in self._windows:
                  if win.isVisible(): win._draw_recursive(pygame.Vector2(0,0))
             
@@ -220,43 +435,249 @@ class QApplication:
         pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         return result
 
-    def _find_drop_target(self, widget, global_pos, widget_offset):
-        # widget_offset is the absolute position of this widget
-        # Check children first
-        my_local_pos = global_pos - pygame.Vector2(widget_offset)
+    def _hit_index(self, win):
+        from .widgets.hit_test import HitTestIndex
+        cached = self._hit_indexes.get(win)
+        if cached is None or cached[0] != self._hit_generation:
+            cached = (self._hit_generation, HitTestIndex(win))
+            self._hit_indexes[win] = cached
+        return cached[1]
+
+    def _dispatch_pointer_event(self, win, event):
+        """Routes a mouse event to the topmost widget under the cursor and bubbles it up
+        through its ancestors. Returns True if a widget accepted it."""
+        mouse_pos = getattr(event, 'pos', None) or pygame.mouse.get_pos()
+        index = self._hit_index(win)
+        entries = index.entries
+        origin = entries[0][2]
+        
+        # QMainWindow sends pointer events over its menu bar, or while a menu is open, to the bar
+        menu_bar = getattr(win, '_menu_bar', None)
+        if menu_bar and event.type != pygame.MOUSEWHEEL:
+            bar_rect = pygame.Rect(origin.x, origin.y, menu_bar._rect.width, menu_bar._rect.height)
+            if bar_rect.collidepoint(mouse_pos) or getattr(menu_bar, '_active_menu', None):
+                return menu_bar._handle_event(event, origin)
+        
+        chain = index.chain_at(mouse_pos)
+        
+        # Handlers and hover styling change what the widget under the cursor looks like
+        hovered = entries[chain[-1]][0] if chain else None
+        if hovered is not self._hover_widget:
+            if self._hover_widget is not None: self._hover_widget._invalidate_backing_stores()
+            self._hover_widget = hovered
+        if hovered is not None: hovered._invalidate_backing_stores()
         
-        for child in reversed(widget._children):
-            if child.isVisible():
-                 # child rect is relative to widget. QGraphicsScene doesn't have _rect.
-                 if not hasattr(child, '_rect'): continue
-                 
-                 child_abs_pos = pygame.Vector2(widget_offset) + pygame.Vector2(child._rect.topleft)
-                 child_rect_abs = pygame.Rect(child_abs_pos.x, child_abs_pos.y, child._rect.width, child._rect.height)
-                 if child_rect_abs.collidepoint(global_pos):
-                      found, pos = self._find_drop_target(child, global_pos, child_abs_pos)
-                      if found: return found, pos
+        if event.type == pygame.MOUSEMOTION:
+            for i in reversed(chain):
+                cursor = getattr(entries[i][0], '_cursor', None)
+                if cursor:
+                    try: pygame.mouse.set_cursor(cursor)
+                    except: pass
+                    break
         
-        # If no child handles it, check self
-        if widget.acceptDrops():
-             return widget, QPointF(my_local_pos)
+        if event.type == pygame.MOUSEBUTTONDOWN and chain: self._active_window = win
+        focus_before = self._focus_widget
+        handled = self._deliver_pointer_event(index, chain, event, mouse_pos)
         
+        # Click-to-focus, unless a handler already moved focus itself
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 2, 3) and self._focus_widget is focus_before:
+            n = next((n for n, i in enumerate(chain) if entries[i][4]), len(chain) - 1)
+            opaque = entries[chain[n]][0] if chain and entries[chain[n]][4] else None
+            # Inside a widget with its own dispatch (QScrollArea) the hit chain past it is not
+            # reliable, so a focus widget within it is left alone
+            if opaque is None or not opaque.isAncestorOf(self._focus_widget):
+                target = next((entries[i][0] for i in reversed(chain[:n + 1]) if entries[i][0]._focus_policy & Qt.FocusPolicy.ClickFocus), None)
+                self._set_focus_widget(target, Qt.FocusReason.MouseFocusReason)
+        return handled
+
+    def _grab_pointer(self, widget):
+        """Sends pointer events to widget._handle_event first, wherever the cursor is, until
+        _release_pointer(widget). Popups use _popups instead."""
+        self._pointer_grab = widget
+
+    def _release_pointer(self, widget):
+        if self._pointer_grab is widget: self._pointer_grab = None
+
+    def _deliver_pointer_event(self, index, chain, event, mouse_pos):
+        entries = index.entries
+        grab = self._pointer_grab
+        if grab is not None:
+            if not grab.isVisible(): self._pointer_grab = None
+            elif grab.window() is entries[0][0]:
+                parent = grab._parent
+                origin = parent.mapToGlobal(QPointF(0, 0)) if parent else QPointF(0, 0)
+                if grab._handle_event(event, pygame.Vector2(origin.x(), origin.y())): return True
+        
+        # Widgets with their own _handle_event (QScrollArea, QComboBox) dispatch their
+        # subtree themselves: the first one on the chain takes over from there
+        target = next((n for n, i in enumerate(chain) if entries[i][4]), len(chain) - 1)
+        for n in range(target, -1, -1):
+            widget, _, widget_origin, parent, opaque = entries[chain[n]]
+            if opaque: handled = widget._handle_event(event, entries[parent][2] if parent != -1 else pygame.Vector2(0,0))
+            else: handled = widget._handle_own_event(event, widget_origin, mouse_pos)
+            if handled: return True
+        return False
+
+    def _set_focus_widget(self, widget, reason):
+        old = self._focus_widget
+        if widget is old: return
+        self._focus_widget = widget
+        if old is not None:
+            old._focused = False
+            old.focusOutEvent(QFocusEvent(False, reason))
+            old.update()
+        if widget is not None:
+            self._active_window = widget.window()
+            widget._focused = True
+            widget.focusInEvent(QFocusEvent(True, reason))
+            widget.update()
+        self.focusChanged.emit(old, widget)
+
+    def _focus_chain(self, window):
+        """Visible widgets of window that accept Tab focus, in creation (pre-order) order."""
+        chain, stack = [], [window]
+        while stack:
+            w = stack.pop()
+            if w._focus_policy & Qt.FocusPolicy.TabFocus: chain.append(w)
+            stack.extend(c for c in reversed(w._children) if hasattr(c, '_focus_policy') and c.isVisible())
+        return chain
+
+    def _move_focus(self, window, forward):
+        """Moves focus to the next (or previous) widget in window's Tab chain."""
+        chain = self._focus_chain(window)
+        if not chain: return False
+        current = self._focus_widget
+        if current not in chain:
+            target = chain[0] if forward else chain[-1]
+        elif forward:
+            explicit = getattr(current, '_tab_next', None)
+            target = explicit if explicit in chain else chain[(chain.index(current) + 1) % len(chain)]
+        else:
+            target = next((w for w in chain if getattr(w, '_tab_next', None) is current), None)
+            if target is None: target = chain[chain.index(current) - 1]
+        self._set_focus_widget(target, Qt.FocusReason.TabFocusReason if forward else Qt.FocusReason.BacktabFocusReason)
+        return True
+
+    def _dispatch_key_event(self, event, window=None):
+        """Delivers KEYDOWN/KEYUP to the focus widget, bubbling through its ancestors until
+        one accepts it. Tab and Shift+Tab move focus along the window's Tab chain."""
+        if window is None:
+            focus = self._focus_widget
+            window = focus.window() if focus is not None and focus.isVisible() else QApplication.activeWindow()
+        if window is None: return False
+        widget = self._focus_widget
+        if widget is None or widget.window() is not window or not widget.isVisible():
+            # Like window activation in Qt: focus the first widget in the Tab chain
+            chain = self._focus_chain(window)
+            widget = chain[0] if chain else None
+            self._set_focus_widget(widget, Qt.FocusReason.ActiveWindowFocusReason)
+        
+        mods = getattr(event, 'mod', pygame.key.get_mods())
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB and not mods & (pygame.KMOD_CTRL | pygame.KMOD_ALT):
+            return self._move_focus(window, not mods & pygame.KMOD_SHIFT)
+        
+        k_event = QKeyEvent(event.key, mods, getattr(event, 'unicode', ''))
+        if widget is not None: widget._invalidate_backing_stores()
+        while widget is not None:
+            # As in Qt, key events arrive accepted; handlers call ignore() to pass them on
+            k_event.accept()
+            if event.type == pygame.KEYDOWN: widget.keyPressEvent(k_event)
+            else: widget.keyReleaseEvent(k_event)
+            if k_event.isAccepted(): return True
+            widget = widget._parent
+        return False
+
+    def _dispatch_drop_event(self, win, event):
+        """Delivers a drag enter or drop event to the topmost widget under the cursor that
+        accepts drops, bubbling up until one accepts it."""
+        if not win.isVisible(): return False
+        index = self._hit_index(win)
+        for i in reversed(index.chain_at(event.pos())):
+            widget = index.entries[i][0]
+            if not widget.acceptDrops(): continue
+            event.ignore()
+            if isinstance(event, QDragEnterEvent): widget.dragEnterEvent(event)
+            elif isinstance(event, QDropEvent): widget.dropEvent(event)
+            if event.isAccepted(): return True
+        return False
+
+    def _find_drop_target(self, win, global_pos):
+        """Returns the deepest widget under global_pos that accepts drops and the position local to it."""
+        index = self._hit_index(win)
+        for i in reversed(index.chain_at(global_pos)):
+            widget, _, origin, _, _ = index.entries[i]
+            if widget.acceptDrops(): return widget, QPointF(pygame.Vector2(global_pos) - origin)
         return None, None
 
+    def _register_shortcut(self, owner, sequence):
+        chords = tuple(sequence._chords)
+        if not chords: return
+        self._keymap.setdefault(chords, []).append(owner)
+        for i in range(1, len(chords)):
+            self._keymap_prefixes[chords[:i]] = self._keymap_prefixes.get(chords[:i], 0) + 1
+
+    def _unregister_shortcut(self, owner, sequence):
+        chords = tuple(sequence._chords)
+        owners = self._keymap.get(chords)
+        if not owners or owner not in owners: return
+        owners.remove(owner)
+        if not owners: del self._keymap[chords]
+        for i in range(1, len(chords)):
+            count = self._keymap_prefixes.get(chords[:i], 0) - 1
+            if count > 0: self._keymap_prefixes[chords[:i]] = count
+            else: self._keymap_prefixes.pop(chords[:i], None)
+        self._pending_chord = ()
+
+    def _shortcut_is_active(self, owner):
+        if not owner.isEnabled(): return False
+        context = owner._shortcut_context
+        if context == Qt.ShortcutContext.ApplicationShortcut: return True
+        # Nearest widget ancestor of the owner (QAction/QShortcut are plain QObjects)
+        widget = owner.parent()
+        while widget is not None and not hasattr(widget, '_rect'): widget = widget.parent()
+        if widget is None: return True
+        if context == Qt.ShortcutContext.WidgetShortcut: return self._focus_widget is widget
+        if context == Qt.ShortcutContext.WidgetWithChildrenShortcut: return widget.isAncestorOf(self._focus_widget)
+        return widget.window().isVisible()
+
+    def _dispatch_shortcut(self, event):
+        """Looks up a KEYDOWN in the keymap; returns True if it completed or extended a shortcut.
+        Outside a chord, the focus widget is offered the key first and may keep it (Qt's
+        ShortcutOverride), so text fields hold on to typing and editing keys."""
+        from .gui.qkeysequence import MODIFIER_KEYS, normalize_modifiers
+        if not self._keymap or event.key in MODIFIER_KEYS: return False
+        chord = (event.key, normalize_modifiers(event.mod))
+        if not self._pending_chord:
+            if (chord,) not in self._keymap and (chord,) not in self._keymap_prefixes: return False
+            focus = self._focus_widget
+            if focus is not None and focus.isVisible() and focus._overrides_shortcut(QKeyEvent(event.key, chord[1], getattr(event, 'unicode', ''))):
+                return False
+        candidates = [(chord,)]
+        if self._pending_chord: candidates.insert(0, self._pending_chord + (chord,))
+        self._pending_chord = ()
+        for candidate in candidates:
+            for owner in self._keymap.get(candidate, ()):
+                if self._shortcut_is_active(owner):
+                    owner._activate_shortcut()
+                    return True
+            if candidate in self._keymap_prefixes:
+                self._pending_chord = candidate
+                return True
+        return False
+
     def quit(self):
         self._running = False
     def exec(self):
+        from .utils.text_renderer import TEXT_READY_EVENT
         clock = pygame.time.Clock(); self._running = True
         while self._running:
-            events = pygame.event.get()
+            events = self._coalesce_mouse_motion(self._wait_for_events())
             for event in events:
                 if event.type == pygame.QUIT: self._running = False
+                elif event.type == TEXT_READY_EVENT: continue  # Only wakes the loop
                 elif event.type == pygame.KEYDOWN:
-                    # Check shortcuts
-                    for shortcut in self._shortcuts:
-                        if hasattr(shortcut._sequence, 'matches') and shortcut._sequence.matches(event.key, event.mod):
-                            shortcut.activated.emit()
-                            # Should we break here? Usually yes if shortcut is triggered
-                            break
+                    # A key press that completes or extends a shortcut is consumed
+                    if self._dispatch_shortcut(event): continue
                 elif event.type == pygame.VIDEORESIZE:
                     for win in self._windows:
                         from .widgets import QMainWindow
@@ -269,7 +690,7 @@ class QApplication:
                     mime.setUrls([QUrl(event.file)])
                     drop_event = QDropEvent(pygame.mouse.get_pos(), mime)
                     for win in self._windows:
-                        if win.isVisible() and win._handle_drop_event(drop_event, pygame.Vector2(0,0)):
+                        if self._dispatch_drop_event(win, drop_event):
                             break
                 
                 # 1. Handle popups first (highest priority)
@@ -282,24 +703,29 @@ class QApplication:
                 if handled: continue
 
                 # 2. Handle normal windows
-                for win in self._windows:
-                    if win.isVisible(): win._handle_event(event, pygame.Vector2(0,0))
+                if event.type in self._POINTER_EVENTS:
+                    for win in self._windows:
+                        if win.isVisible(): self._dispatch_pointer_event(win, event)
+                elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                    self._dispatch_key_event(event)
+                else:
+                    for win in self._windows:
+                        if win.isVisible(): win._handle_event(event, pygame.Vector2(0,0))
                 
                 # Check for hover/motion globally if needed, or let windows handle it
 
 
+            # Handlers mutate widget state directly, so any input counts as damage
+            if events: self._dirty = True
+            self._process_timers()
+            self._process_async_text()
+
             if not self._windows: break
-            has_visible = False
-            for win in self._windows:
-                if win.isVisible():
-                    has_visible = True
-                    win._draw_recursive(pygame.Vector2(0,0))
+            if not any(win.isVisible() for win in self._windows): break
             
-            # 3. Draw popups last (highest z-order)
-            for popup in self._popups:
-                if hasattr(popup, '_draw_popup_overlay'):
-                    popup._draw_popup_overlay()
-
-            if not has_visible: break
-            pygame.display.flip(); clock.tick(60)
+            if self._needs_repaint():
+                self._paint()
+                pygame.display.flip()
+            # Caps bursts of activity; a blocking wait above already consumed the idle time
+            clock.tick(self._frame_rate)
         pygame.quit(); return 0
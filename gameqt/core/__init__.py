@@ -1,7 +1,8 @@
 from .qt_enums import Qt
 from .qobject import QObject, Signal, pyqtSignal
 from .qrect import QPoint, QPointF, QSize, QRect, QRectF
-from .qevent import QMouseEvent, QWheelEvent, QKeyEvent
+from .qevent import QMouseEvent, QWheelEvent, QKeyEvent, QFocusEvent
 from .qmimedata import QMimeData, QClipboard, QUrl
 from .qshortcut import QShortcut
+from .qtimer import QTimer
 from .dialogs import PyGameModalDialog
@@ -86,7 +86,8 @@ class PyGameModalDialog:
         pygame.draw.rect(screen, (220, 220, 230), title_rect, border_top_left_radius=8, border_top_right_radius=8)
         pygame.draw.line(screen, (180, 180, 190), title_rect.bottomleft, title_rect.bottomright)
         
-        font = pygame.font.SysFont("Arial", 16, bold=True)
+        from ..gui import QFont
+        font = QFont.sys_font("Arial", 16, bold=True)
         txt = font.render(self.title, True, (50, 50, 60))
         screen.blit(txt, (self.rect.x + 10, self.rect.y + 5))
         
@@ -31,6 +31,14 @@ class QWheelEvent:
     def ignore(self): self._accepted = False
     def isAccepted(self): return self._accepted
 
+class QFocusEvent:
+    def __init__(self, got_focus, reason=Qt.FocusReason.OtherFocusReason):
+        self._got_focus = got_focus
+        self._reason = reason
+    def gotFocus(self): return self._got_focus
+    def lostFocus(self): return not self._got_focus
+    def reason(self): return self._reason
+
 class QKeyEvent:
     def __init__(self, key, modifiers=0, text=""):
         self._key = key
@@ -44,18 +52,10 @@ class QKeyEvent:
     def ignore(self): self._accepted = False
     def isAccepted(self): return self._accepted
     def matches(self, sequence_key):
-        import pygame
-        # Check against QKeySequence.StandardKey or an actual QKeySequence
-        # StandardKey constants are expected to be ints: Cut=1, Copy=2, Paste=3
-        relevant_mods = self._modifiers & (pygame.KMOD_CTRL | pygame.KMOD_ALT | pygame.KMOD_SHIFT | pygame.KMOD_META)
-        is_ctrl_only = (relevant_mods == pygame.KMOD_CTRL) or (relevant_mods == pygame.KMOD_META)
-        
-        if sequence_key == 1: # Cut
-            return self._key == pygame.K_x and is_ctrl_only
-        elif sequence_key == 2: # Copy
-            return self._key == pygame.K_c and is_ctrl_only
-        elif sequence_key == 3: # Paste
-            return self._key == pygame.K_v and is_ctrl_only
+        from ..gui.qkeysequence import QKeySequence, normalize_modifiers
+        # StandardKey constants are ints (Cut=1, Copy=2, Paste=3) and accept Ctrl or Meta
+        if isinstance(sequence_key, int):
+            return (self._key, normalize_modifiers(self._modifiers)) in QKeySequence._chords_for_standard_key(sequence_key)
         elif hasattr(sequence_key, 'matches'):
             return sequence_key.matches(self._key, self._modifiers)
         return False
@@ -1,14 +1,25 @@
 import pygame
 from .qobject import QObject, Signal
+from .qt_enums import Qt
 
 class QShortcut(QObject):
     def __init__(self, sequence, parent=None):
         super().__init__(parent)
-        self._sequence = sequence
         self.activated = Signal()
+        self._enabled = True
+        self._shortcut_context = Qt.ShortcutContext.WindowShortcut
+        self._sequence = None
+        self.setKey(sequence)
+    def setKey(self, seq):
         from ..application import QApplication
-        if QApplication._instance:
-            if not hasattr(QApplication._instance, '_shortcuts'):
-                QApplication._instance._shortcuts = []
-            QApplication._instance._shortcuts.append(self)
-    def setKey(self, seq): self._sequence = seq
+        from ..gui.qkeysequence import QKeySequence
+        app = QApplication._instance
+        if app and self._sequence is not None: app._unregister_shortcut(self, self._sequence)
+        self._sequence = QKeySequence._coerce(seq)
+        if app: app._register_shortcut(self, self._sequence)
+    def key(self): return self._sequence
+    def setContext(self, context): self._shortcut_context = context
+    def context(self): return self._shortcut_context
+    def setEnabled(self, e): self._enabled = e
+    def isEnabled(self): return self._enabled
+    def _activate_shortcut(self): self.activated.emit()
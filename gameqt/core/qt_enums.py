@@ -17,6 +17,10 @@ class Qt:
         AlignBottom = 0x0040
         AlignVCenter = 0x0080
         AlignCenter = AlignHCenter | AlignVCenter
+    class ApplicationAttribute: AA_CompressHighFrequencyEvents = 25
+    class FocusPolicy: NoFocus = 0; TabFocus = 1; ClickFocus = 2; StrongFocus = 11; WheelFocus = 15
+    class FocusReason: MouseFocusReason = 0; TabFocusReason = 1; BacktabFocusReason = 2; ActiveWindowFocusReason = 3; PopupFocusReason = 4; ShortcutFocusReason = 5; MenuBarFocusReason = 6; OtherFocusReason = 7
+    class ShortcutContext: WidgetShortcut = 0; WindowShortcut = 1; ApplicationShortcut = 2; WidgetWithChildrenShortcut = 3
     class MouseButton: LeftButton = 0x01; RightButton = 0x02; MidButton = 0x04; NoButton = 0x00
     class DropAction: CopyAction = 1; MoveAction = 2; LinkAction = 4; ActionMask = 255; TargetMoveAction = 32770; IgnoreAction = 0
     DROPFILE = pygame.DROPFILE
@@ -63,6 +67,9 @@ class Qt:
     class TextInteractionFlag: NoTextInteraction = 0; TextEditorInteraction = 1
     class ContextMenuPolicy: CustomContextMenu = 1; PreventContextMenu = 0; DefaultContextMenu = 2
     class TextFormat: PlainText = 0; RichText = 1
+    class TextElideMode: ElideLeft = 0; ElideRight = 1; ElideMiddle = 2; ElideNone = 3
+    class ItemSelectionMode: ContainsItemShape = 0; IntersectsItemShape = 1; ContainsItemBoundingRect = 2; IntersectsItemBoundingRect = 3
+    class SortOrder: AscendingOrder = 0; DescendingOrder = 1
     class GlobalColor:
         white = "#FFFFFF"
         black = "#000000"
@@ -0,0 +1,44 @@
+import pygame
+from .qobject import QObject, Signal
+
+class QTimer(QObject):
+    """Single-shot or repeating timer driven by the QApplication event loop."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timeout = Signal()
+        self._interval = 0
+        self._single_shot = False
+        self._active = False
+        self._deadline = None
+        self._timer_id = 0 # Bumped on every (re)start so stale heap entries are skipped
+    def setInterval(self, msec):
+        self._interval = max(0, int(msec))
+        if self._active: self.start()
+    def interval(self): return self._interval
+    def setSingleShot(self, b): self._single_shot = b
+    def isSingleShot(self): return self._single_shot
+    def isActive(self): return self._active
+    def remainingTime(self):
+        if not self._active: return -1
+        return max(0, self._deadline - pygame.time.get_ticks())
+    def start(self, msec=None):
+        from ..application import QApplication
+        if msec is not None: self._interval = max(0, int(msec))
+        app = QApplication.instance()
+        if not app: return
+        self._active = True
+        self._timer_id += 1
+        self._deadline = pygame.time.get_ticks() + self._interval
+        app._register_timer(self)
+    def stop(self):
+        self._active = False
+        self._timer_id += 1
+        self._deadline = None
+
+    @staticmethod
+    def singleShot(msec, slot):
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(slot)
+        timer.start(msec)
+        return timer
@@ -1,15 +1,136 @@
+import bisect
+import itertools
+import math
 import pygame
-from .core import QObject, Signal, QPointF, QRectF, Qt
+from .core import QObject, Signal, QPointF, QRectF, Qt, QTimer
 from .widgets import QWidget
 from .gui import QPainter, QTransform, QColor, QFont, QPen, QBrush, QTextCursor
 from .application import QApplication
 
+def _polygons_intersect(a, b):
+    """Separating axis test for two convex polygons given as lists of (x, y)."""
+    for poly in (a, b):
+        for i in range(len(poly)):
+            x1, y1 = poly[i]; x2, y2 = poly[(i + 1) % len(poly)]
+            nx, ny = y1 - y2, x2 - x1
+            pa = [nx * x + ny * y for x, y in a]
+            pb = [nx * x + ny * y for x, y in b]
+            if max(pa) < min(pb) or max(pb) < min(pa): return False
+    return True
+
+class SceneIndex:
+    """Uniform grid over scene coordinates. Each item is filed under every cell its scene
+    bounding rect overlaps; items spanning more than LARGE_CELLS cells are kept aside and
+    checked by every query instead."""
+    LARGE_CELLS = 256
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self._cells = {}    # (cx, cy) -> set of items
+        self._entries = {}  # item -> ((x, y, w, h), cell range, or None for large items)
+        self._large = set()
+
+    def __len__(self): return len(self._entries)
+
+    def _cell_range(self, x, y, w, h):
+        cs = self.cell_size
+        return int(x // cs), int(y // cs), int((x + w) // cs), int((y + h) // cs)
+
+    def insert(self, item, rect):
+        cr = self._cell_range(*rect)
+        x0, y0, x1, y1 = cr
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self.LARGE_CELLS:
+            self._large.add(item)
+            cr = None
+        else:
+            cells = self._cells
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None: bucket = cells[(cx, cy)] = set()
+                    bucket.add(item)
+        self._entries[item] = (rect, cr)
+
+    def remove(self, item):
+        """Drops item; returns the rect it was filed under, or None."""
+        entry = self._entries.pop(item, None)
+        if entry is None: return None
+        rect, cr = entry
+        if cr is None: self._large.discard(item)
+        else:
+            x0, y0, x1, y1 = cr
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = self._cells[(cx, cy)]
+                    bucket.discard(item)
+                    if not bucket: del self._cells[(cx, cy)]
+        return rect
+
+    def update(self, item, rect):
+        """Files item under rect; returns its previous rect, or None if it was not indexed."""
+        entry = self._entries.get(item)
+        if entry is not None and entry[1] is not None and entry[1] == self._cell_range(*rect):
+            self._entries[item] = (rect, entry[1])
+            return entry[0]
+        old = self.remove(item)
+        self.insert(item, rect)
+        return old
+
+    def rect(self, item):
+        entry = self._entries.get(item)
+        return entry[0] if entry else None
+
+    def _candidates(self, x0, y0, x1, y1):
+        found = set(self._large)
+        cells = self._cells
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # Query area is larger than the occupied grid (zoomed far out): walk occupied cells
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1: found.update(bucket)
+        else:
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket: found.update(bucket)
+        return found
+
+    def query(self, x, y, w, h):
+        """Items whose rect intersects (x, y, w, h), with the same edge rules as QRectF.intersects."""
+        entries = self._entries
+        result = []
+        for item in self._candidates(*self._cell_range(x, y, w, h)):
+            ix, iy, iw, ih = entries[item][0]
+            if ix + iw <= x or x + w <= ix or iy + ih <= y or y + h <= iy: continue
+            result.append(item)
+        return result
+
+    def query_point(self, x, y):
+        """Items whose rect contains (x, y), edges included as in QRectF.contains."""
+        entries = self._entries
+        result = []
+        cx, cy = int(x // self.cell_size), int(y // self.cell_size)
+        for item in self._candidates(cx, cy, cx, cy):
+            ix, iy, iw, ih = entries[item][0]
+            if ix <= x <= ix + iw and iy <= y <= iy + ih: result.append(item)
+        return result
+
 class QGraphicsScene(QObject):
+    class ItemIndexMethod: BspTreeIndex = 0; NoIndex = -1
+    INDEX_CELL_SIZE = 128  # Grid cell size of the item index, in scene units
+
     def __init__(self, parent=None):
         super().__init__(parent); self.selectionChanged = Signal(); self.items_list, self._bg_brush, self._scene_rect = [], None, QRectF(0,0,800,600); self._views = []
         self._focus_item = None
+        # Paint order kept sorted incrementally: _z_keys[i] is (zValue, insertion seq) of _sorted_items[i]
         self._sorted_items = []
-        self._items_dirty = False
+        self._z_keys = []
+        # Spatial index for culling and hit tests. Items whose geometry or looks changed are
+        # re-filed lazily, right before the next query or paint, which also hands the views
+        # the areas to repaint
+        self._index_method = QGraphicsScene.ItemIndexMethod.BspTreeIndex
+        self._index = SceneIndex(self.INDEX_CELL_SIZE)
+        self._changed = set()
+        self._item_seq = itertools.count()
     
     def focusItem(self): return self._focus_item
     def setFocusItem(self, item): 
@@ -17,36 +138,147 @@ class QGraphicsScene(QObject):
             self._focus_item = item
             if item: item.setFocus()
     def views(self): return self._views
+    def _attach(self, item):
+        """Takes item over from any other scene; False if it is already in this one."""
+        if item._scene is self: return False
+        if item._scene: item._scene.removeItem(item)
+        item._scene = self
+        item._scene_seq = next(self._item_seq)
+        return True
+
     def addItem(self, item): 
-        self.items_list.append(item); item._scene = self
-        self._items_dirty = True
+        if not self._attach(item): return
+        self.items_list.append(item)
+        self._item_changed(item)
+        self._link_z(item)
+
+    def addItems(self, items):
+        """Adds many items at once, merging them into the paint order in a single pass."""
+        new = [item for item in items if self._attach(item)]
+        self.items_list.extend(new)
+        for item in new: self._item_changed(item)
+        # Both runs are sorted already, so timsort merges them in linear time
+        merged = sorted([*zip(self._z_keys, self._sorted_items), *sorted(((i._z, i._scene_seq), i) for i in new)])
+        self._z_keys = [key for key, _ in merged]
+        self._sorted_items = [item for _, item in merged]
         
     def removeItem(self, item): 
-        if item in self.items_list:
+        if item._scene is self:
             self.items_list.remove(item)
+            self._unlink_z(item, item._z)
             setattr(item, '_scene', None)
-            self._items_dirty = True
-            
-    def _invalidate_sort(self):
-        self._items_dirty = True
-        
-    def items(self): 
-        if self._items_dirty:
-            self._sorted_items = sorted(self.items_list, key=lambda i: i.zValue())
-            self._items_dirty = False
-        return self._sorted_items
+            self._changed.discard(item)
+            self._index.remove(item)
+            # Repaint where it was last painted and where it is now, in case it moved since
+            damage = [item._damage_rect, item._paint_rect_tuple()] if item._damage_rect else [item._paint_rect_tuple()]
+            item._damage_rect = None
+            for v in self._views:
+                v._add_damage(damage)
+                v._scene_changed()
+
+    def _link_z(self, item):
+        key = (item._z, item._scene_seq)
+        i = bisect.bisect_right(self._z_keys, key)
+        self._z_keys.insert(i, key)
+        self._sorted_items.insert(i, item)
+
+    def _unlink_z(self, item, z):
+        i = bisect.bisect_left(self._z_keys, (z, item._scene_seq))
+        if i < len(self._sorted_items) and self._sorted_items[i] is item:
+            del self._z_keys[i]
+            del self._sorted_items[i]
+
+    def _item_z_changed(self, item, old_z):
+        self._unlink_z(item, old_z)
+        self._link_z(item)
         
+    def items(self, *args, **kwargs):
+        """All items in paint order (lowest z first, then insertion order). Given a QPointF or
+        QRectF, the visible items at that point or in that area, matched by mode and topmost
+        first unless order is Qt.SortOrder.AscendingOrder."""
+        if args or kwargs: return self._region_items(*args, **kwargs)
+        return list(self._sorted_items)
+
+    def _region_items(self, area, mode=Qt.ItemSelectionMode.IntersectsItemShape, order=Qt.SortOrder.DescendingOrder, deviceTransform=None):
+        # deviceTransform only matters for ItemIgnoresTransformations items, which are not supported
+        if isinstance(area, QRectF):
+            r = area.normalized()
+            found = [i for i in self._items_in_rect(r) if i.isVisible() and i._matches_rect(r, mode)]
+        else:
+            found = [i for i in self._items_at(area) if i.isVisible() and i._matches_point(area, mode)]
+        return found[::-1] if order == Qt.SortOrder.DescendingOrder else found
+
+    def itemAt(self, pos, deviceTransform=None):
+        """Topmost visible item whose shape contains the scene point pos, or None."""
+        return next((i for i in reversed(self._items_at(pos)) if i.isVisible() and i._matches_point(pos, Qt.ItemSelectionMode.IntersectsItemShape)), None)
+
+    def collidingItems(self, item, mode=Qt.ItemSelectionMode.IntersectsItemShape):
+        """Visible items that collide with item (see QGraphicsItem.collidesWithItem), topmost first."""
+        br = item.sceneBoundingRect()
+        candidates = self._items_in_rect(br) if br.width() and br.height() else self._items_at(br.topLeft())
+        return [i for i in reversed(candidates) if i is not item and i.isVisible() and item.collidesWithItem(i, mode)]
+
+    def setItemIndexMethod(self, method):
+        """BspTreeIndex (the default) keeps items in a grid index; NoIndex scans every item,
+        which suits scenes where nearly everything moves each frame."""
+        self._index_method = method
+        self._index = SceneIndex(self.INDEX_CELL_SIZE)
+        self._changed.update(self.items_list)
+    def itemIndexMethod(self): return self._index_method
+
+    def _item_changed(self, item):
+        """Queues item to be re-filed and repainted after its geometry or appearance changed."""
+        if not self._changed:
+            for v in self._views: v._scene_changed()
+        self._changed.add(item)
+
+    def _flush_changes(self):
+        """Re-files changed items and gives the views their old and new areas as damage."""
+        if not self._changed: return
+        indexed = self._index_method != QGraphicsScene.ItemIndexMethod.NoIndex
+        index, damage = self._index, []
+        for item in self._changed:
+            if indexed: index.update(item, item._scene_rect_tuple())
+            rect = item._paint_rect_tuple()
+            if item._damage_rect is not None and item._damage_rect != rect: damage.append(item._damage_rect)
+            damage.append(rect)
+            item._damage_rect = rect
+        self._changed.clear()
+        for v in self._views: v._add_damage(damage)
+
+    def _z_sorted(self, items):
+        """items in paint order: by z-value, then insertion order, like items()."""
+        return sorted(items, key=lambda i: (i._z, i._scene_seq))
+
+    def _items_in_rect(self, rect):
+        """Items whose scene bounding rect intersects rect, in paint order."""
+        if self._index_method == QGraphicsScene.ItemIndexMethod.NoIndex:
+            return [i for i in self._sorted_items if i.sceneBoundingRect().intersects(rect)]
+        self._flush_changes()
+        return self._z_sorted(self._index.query(rect.x(), rect.y(), rect.width(), rect.height()))
+
+    def _items_at(self, pos):
+        """Items whose scene bounding rect contains pos, in paint order."""
+        if self._index_method == QGraphicsScene.ItemIndexMethod.NoIndex:
+            return [i for i in self._sorted_items if i.sceneBoundingRect().contains(pos)]
+        self._flush_changes()
+        return self._z_sorted(self._index.query_point(pos.x(), pos.y()))
+
     def selectedItems(self): return [i for i in self.items_list if i._selected]
     def clear(self): 
-        self.items_list = []; self._sorted_items = []; self._items_dirty = False
+        for item in self.items_list: item._scene = None
+        self.items_list = []; self._sorted_items = []; self._z_keys = []
+        self._index = SceneIndex(self.INDEX_CELL_SIZE)
+        self._changed = set()
+        for v in self._views: v.update()
         self.selectionChanged.emit()
     def clearSelection(self): [setattr(i, '_selected', False) for i in self.items_list]; self.selectionChanged.emit()
-    def setBackgroundBrush(self, brush): self._bg_brush = brush
+    def setBackgroundBrush(self, brush):
+        self._bg_brush = brush
+        for v in self._views: v.update()
     def setSceneRect(self, rect): self._scene_rect = rect
     def mousePressEvent(self, event):
-        pos = event.pos(); clicked_item = None
-        for item in reversed(self.items()):
-            if item.isVisible() and item.sceneBoundingRect().contains(pos): clicked_item = item; break
+        clicked_item = self.itemAt(event.pos())
         
         if clicked_item:
             if not (event.modifiers() & Qt.KeyboardModifier.ControlModifier): self.clearSelection()
@@ -56,27 +288,60 @@ class QGraphicsScene(QObject):
             self.clearSelection()
 
     def keyPressEvent(self, event):
+        # Without a focus item the key is ignored, so it bubbles past the view
         if self._focus_item:
             self._focus_item.keyPressEvent(event)
+        else: event.ignore()
     def keyReleaseEvent(self, event):
         if self._focus_item and hasattr(self._focus_item, 'keyReleaseEvent'):
             self._focus_item.keyReleaseEvent(event)
+        else: event.ignore()
 
 class QGraphicsItem:
     class GraphicsItemFlag: ItemIsMovable = 1; ItemIsSelectable = 2; ItemIsFocusable = 4
+    class CacheMode: NoCache = 0; ItemCoordinateCache = 1; DeviceCoordinateCache = 2
+    PAINT_MARGIN = 1  # Painting may reach this far (plus the pen width) past boundingRect()
+    MAX_CACHE_PIXELS = 2048 * 2048  # Larger caches (deep zoom on a big item) are painted directly
     def __init__(self, parent=None):
         self._pos, self._z, self._visible, self._selected, self._scene = QPointF(0, 0), 0, True, False, None
         self._parent, self._opacity, self._transform = parent, 1.0, QTransform()
         self._flags = 0
         self._rotation = 0.0
-    def setPos(self, *args): self._pos = QPointF(*args) if len(args) == 2 else QPointF(args[0])
+        # Render cache: _cache is (key, surface, offset from pos) as blitted, _cache_base the
+        # logical-size render behind it in ItemCoordinateCache mode
+        self._cache_mode, self._cache_size, self._cache, self._cache_base = QGraphicsItem.CacheMode.NoCache, None, None, None
+        self._cache_version = 0
+        self._damage_rect = None  # Scene area last handed to the views as this item's paint area
+    def setPos(self, *args):
+        self._pos = QPointF(*args) if len(args) == 2 else QPointF(args[0])
+        self.prepareGeometryChange()
+    def prepareGeometryChange(self):
+        """Tells the scene that boundingRect() or pos() changed, so its index re-files the item.
+        Subclasses with their own geometry call this from their setters."""
+        if self._scene: self._scene._item_changed(self)
+    def _scene_rect_tuple(self):
+        br = self.boundingRect()
+        return (self._pos.x() + br.x(), self._pos.y() + br.y(), br.width(), br.height())
+    def _paint_margin(self):
+        pen = getattr(self, '_pen', None)
+        return self.PAINT_MARGIN + (pen._width if pen else 0)
+    def _paint_rect_tuple(self):
+        """The scene area painting may touch: the bounding rect grown by the paint margin."""
+        x, y, w, h = self._scene_rect_tuple()
+        m = self._paint_margin()
+        return (x - m, y - m, w + 2 * m, h + 2 * m)
     def pos(self): return self._pos
     def setZValue(self, z): 
         if self._z != z:
-            self._z = z
-            if self._scene: self._scene._invalidate_sort()
+            old, self._z = self._z, z
+            if self._scene:
+                self._scene._item_z_changed(self, old)
+                self._scene._item_changed(self)
     def zValue(self): return self._z
-    def setVisible(self, v): self._visible = v
+    def setVisible(self, v):
+        if self._visible != v:
+            self._visible = v
+            if self._scene: self._scene._item_changed(self)
     def isVisible(self): return self._visible
     def setSelected(self, s): self._selected = s; (self._scene.selectionChanged.emit() if self._scene else None)
     def setFlag(self, f, enabled=True):
@@ -86,16 +351,83 @@ class QGraphicsItem:
     def flags(self): return self._flags
     def boundingRect(self): return QRectF(0, 0, 0, 0)
     def scene(self): return self._scene
-    def setOpacity(self, o): self._opacity = o
+    def setOpacity(self, o):
+        if self._opacity != o:
+            self._opacity = o
+            if self._scene: self._scene._item_changed(self)
     def opacity(self): return self._opacity
     def transform(self): return self._transform
     def setTransform(self, t, combine=False): self._transform = t
     def scale(self): return 1.0
     def rotation(self): return self._rotation
     def setRotation(self, r): self._rotation = r
+    def setCacheMode(self, mode, logicalCacheSize=None):
+        """Renders the item once into an offscreen surface and blits that until update() or a
+        property setter changes it. DeviceCoordinateCache renders at the view's scale and again
+        after a zoom; ItemCoordinateCache renders at logical size (or logicalCacheSize, a QSize)
+        and rescales that surface instead, trading sharpness for cheaper zooming. Whenever the
+        cache would exceed MAX_CACHE_PIXELS the item is painted directly instead."""
+        self._cache_mode, self._cache_size, self._cache, self._cache_base = mode, logicalCacheSize, None, None
+    def cacheMode(self): return self._cache_mode
+    def _rasterize(self, sx, sy, widget):
+        """Paints the item into a new surface at scale (sx, sy); returns it with the offset of its
+        top-left corner from pos(), in item units."""
+        br = self.boundingRect()
+        margin = self._paint_margin()
+        ox, oy = br.x() - margin, br.y() - margin
+        surface = pygame.Surface(self._cache_extent(sx, sy), pygame.SRCALPHA)
+        painter = QPainter(surface)
+        painter.setTransform(QTransform(sx, 0, 0, sy, -(self._pos.x() + ox) * sx, -(self._pos.y() + oy) * sy))
+        painter._text_lod = getattr(widget, '_zooming', False)
+        opacity, self._opacity = self._opacity, 1.0  # Applied when the cache is blitted
+        try: self.paint(painter, None, widget)
+        finally: self._opacity = opacity
+        return surface, (ox, oy)
+    def _cache_extent(self, sx, sy):
+        """Pixel size of the cache surface at scale (sx, sy)."""
+        br = self.boundingRect()
+        margin = self._paint_margin()
+        return (max(1, int(math.ceil((br.width() + 2 * margin) * abs(sx)))),
+                max(1, int(math.ceil((br.height() + 2 * margin) * abs(sy)))))
+    def _paint_cached(self, painter, widget):
+        m = painter._transform._m
+        sx, sy = m[0], m[4]
+        w, h = self._cache_extent(sx, sy)
+        if w * h > self.MAX_CACHE_PIXELS:
+            self._cache = None
+            self.paint(painter, None, widget)
+            return
+        if self._cache_mode == QGraphicsItem.CacheMode.ItemCoordinateCache:
+            if self._cache_base is None or self._cache_base[0] != self._cache_version:
+                bsx = bsy = 1.0
+                if self._cache_size is not None:
+                    br = self.boundingRect()
+                    if br.width() > 0 and br.height() > 0: bsx, bsy = self._cache_size.width() / br.width(), self._cache_size.height() / br.height()
+                w, h = self._cache_extent(bsx, bsy)
+                if w * h > self.MAX_CACHE_PIXELS:
+                    self._cache = self._cache_base = None
+                    self.paint(painter, None, widget)
+                    return
+                self._cache_base = (self._cache_version, bsx, bsy, *self._rasterize(bsx, bsy, widget))
+            _, bsx, bsy, base, offset = self._cache_base
+            key = (self._cache_version, sx, sy)
+            if self._cache is None or self._cache[0] != key:
+                size = (max(1, round(base.get_width() * sx / bsx)), max(1, round(base.get_height() * sy / bsy)))
+                self._cache = (key, base if size == base.get_size() else pygame.transform.smoothscale(base, size), offset)
+        else:
+            key = (self._cache_version, sx, sy, getattr(widget, '_zooming', False))
+            if self._cache is None or self._cache[0] != key:
+                self._cache = (key, *self._rasterize(sx, sy, widget))
+        _, surface, (ox, oy) = self._cache
+        dest = (math.floor((self._pos.x() + ox) * sx + m[6]), math.floor((self._pos.y() + oy) * sy + m[7]))
+        if painter._opacity < 1.0:
+            surface.set_alpha(int(painter._opacity * 255))
+            painter._device.blit(surface, dest)
+            surface.set_alpha(255)
+        else: painter._device.blit(surface, dest)
     def update(self): 
-        if self._scene:
-            for v in self._scene.views(): v.update()
+        self._cache_version += 1
+        if self._scene: self._scene._item_changed(self)
     def mapToScene(self, *args):
         arg = args[0] if len(args) == 1 else QPointF(*args)
         if isinstance(arg, QRectF):
@@ -108,6 +440,50 @@ class QGraphicsItem:
         return QPointF(arg) - self._pos
     def sceneBoundingRect(self):
         br = self.boundingRect(); return QRectF(self._pos.x() + br.x(), self._pos.y() + br.y(), br.width(), br.height())
+
+    # Shape tests. The default shape is boundingRect(); items with another convex shape set
+    # _rect_shaped = False and override contains(), _shape_intersects() and _shape_polygon().
+    _rect_shaped = True
+    def contains(self, point):
+        """Whether point, in item coordinates, lies inside the item's shape."""
+        return self.boundingRect().contains(point)
+    def _shape_intersects(self, x, y, w, h):
+        """Whether the item's shape meets the rect (x, y, w, h), in item coordinates."""
+        br = self.boundingRect()
+        return not (br.x() + br.width() < x or x + w < br.x() or br.y() + br.height() < y or y + h < br.y())
+    def _shape_polygon(self):
+        """The item's shape as a convex polygon in scene coordinates."""
+        x, y, w, h = self._scene_rect_tuple()
+        return [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+    def _matches_point(self, pos, mode):
+        if mode in (Qt.ItemSelectionMode.ContainsItemBoundingRect, Qt.ItemSelectionMode.IntersectsItemBoundingRect):
+            return self.sceneBoundingRect().contains(pos)
+        return self.contains(QPointF(pos.x() - self._pos.x(), pos.y() - self._pos.y()))
+    def _matches_rect(self, rect, mode):
+        x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
+        ix, iy, iw, ih = self._scene_rect_tuple()
+        if mode in (Qt.ItemSelectionMode.ContainsItemShape, Qt.ItemSelectionMode.ContainsItemBoundingRect):
+            # A convex shape touches every side of its bounding rect, so containment is the same test
+            return x <= ix and y <= iy and ix + iw <= x + w and iy + ih <= y + h
+        if mode == Qt.ItemSelectionMode.IntersectsItemBoundingRect or self._rect_shaped: return True  # Index already tested the rects
+        return self._shape_intersects(x - self._pos.x(), y - self._pos.y(), w, h)
+    def collidesWithItem(self, other, mode=Qt.ItemSelectionMode.IntersectsItemShape):
+        """Whether other collides with this item. Intersects modes accept any overlap; Contains
+        modes require other to lie fully inside this item's shape or bounding rect."""
+        ox, oy, ow, oh = other._scene_rect_tuple()
+        x, y, w, h = self._scene_rect_tuple()
+        if ox + ow < x or x + w < ox or oy + oh < y or y + h < oy: return False
+        if mode == Qt.ItemSelectionMode.IntersectsItemBoundingRect: return True
+        if mode == Qt.ItemSelectionMode.ContainsItemBoundingRect:
+            return x <= ox and y <= oy and ox + ow <= x + w and oy + oh <= y + h
+        px, py = self._pos.x(), self._pos.y()
+        if mode == Qt.ItemSelectionMode.ContainsItemShape:
+            return all(self.contains(QPointF(vx - px, vy - py)) for vx, vy in other._shape_polygon())
+        if other._rect_shaped: return self._shape_intersects(ox - px, oy - py, ow, oh)
+        if self._rect_shaped: return other._shape_intersects(x - other._pos.x(), y - other._pos.y(), w, h)
+        return _polygons_intersect(self._shape_polygon(), other._shape_polygon())
+    def collidingItems(self, mode=Qt.ItemSelectionMode.IntersectsItemShape):
+        return self._scene.collidingItems(self, mode) if self._scene else []
     def setCursor(self, cursor): 
         self._cursor = cursor
         # If hovering, we should apply it, but for now we store it
@@ -141,9 +517,9 @@ class QGraphicsRectItem(QGraphicsItem):
         self._pen = QPen(QColor(0,0,0))
         self._brush = QBrush()
 
-    def setPen(self, pen): self._pen = pen
-    def setBrush(self, brush): self._brush = brush
-    def setRect(self, *args): self._rect = QRectF(*args)
+    def setPen(self, pen): self._pen = pen; self.update()
+    def setBrush(self, brush): self._brush = brush; self.update()
+    def setRect(self, *args): self._rect = QRectF(*args); self.update()
 
     def rect(self): return self._rect
     def boundingRect(self): return self._rect
@@ -166,12 +542,33 @@ class QGraphicsEllipseItem(QGraphicsItem):
         self._pen = QPen(QColor(0,0,0))
         self._brush = QBrush()
 
-    def setPen(self, pen): self._pen = pen
-    def setBrush(self, brush): self._brush = brush
-    def setRect(self, *args): self._rect = QRectF(*args)
+    def setPen(self, pen): self._pen = pen; self.update()
+    def setBrush(self, brush): self._brush = brush; self.update()
+    def setRect(self, *args): self._rect = QRectF(*args); self.update()
 
     def rect(self): return self._rect
     def boundingRect(self): return self._rect
+
+    _rect_shaped = False
+    POLYGON_SEGMENTS = 32  # Ellipse approximation used for ellipse-to-ellipse collisions
+    def _ellipse(self):
+        r = self._rect
+        return r.x() + r.width() / 2, r.y() + r.height() / 2, abs(r.width()) / 2, abs(r.height()) / 2
+    def contains(self, point):
+        cx, cy, rx, ry = self._ellipse()
+        if not rx or not ry: return False
+        dx, dy = (point.x() - cx) / rx, (point.y() - cy) / ry
+        return dx * dx + dy * dy <= 1
+    def _shape_intersects(self, x, y, w, h):
+        # The rect point nearest the centre decides
+        cx, cy, _, _ = self._ellipse()
+        return self.contains(QPointF(min(max(cx, x), x + w), min(max(cy, y), y + h)))
+    def _shape_polygon(self):
+        cx, cy, rx, ry = self._ellipse()
+        cx += self._pos.x(); cy += self._pos.y()
+        n = self.POLYGON_SEGMENTS
+        return [(cx + rx * math.cos(2 * math.pi * k / n), cy + ry * math.sin(2 * math.pi * k / n)) for k in range(n)]
+
     def paint(self, painter, option, widget):
         painter.save()
         painter.setOpacity(self._opacity)
@@ -185,7 +582,7 @@ class QGraphicsPixmapItem(QGraphicsItem):
     class ShapeMode: BoundingRectShape = 1
     def __init__(self, pixmap=None, parent=None): super().__init__(parent); self._pixmap = pixmap
     def pixmap(self): return self._pixmap
-    def setPixmap(self, p): self._pixmap = p
+    def setPixmap(self, p): self._pixmap = p; self.update()
     def setShapeMode(self, mode): 
         self._shape_mode = mode
     def boundingRect(self): return self._pixmap.rect() if self._pixmap else QRectF(0,0,0,0)
@@ -210,11 +607,15 @@ class QGraphicsTextItem(QGraphicsItem):
         return self._cursor_obj
     def setTextCursor(self, cursor): self._cursor_obj = cursor
     def toPlainText(self): return self._text
-    def setDefaultTextColor(self, c): self._color = c
+    def setPlainText(self, text): self._text = text; self.update()
+    def setDefaultTextColor(self, c): self._color = c; self.update()
     def defaultTextColor(self): return self._color
-    def setFont(self, f): self._font = f
+    def setFont(self, f): self._font = f; self.update()
     def font(self): return self._font
-    def boundingRect(self): return QRectF(0,0,100,20)
+    def boundingRect(self):
+        from .utils.text_renderer import get_text_metrics
+        w, h, _, _ = get_text_metrics(self._text, self._font._family, self._font._size)
+        return QRectF(0, 0, w + 2, h + 2)  # The rendered surface, padding included
     def paint(self, painter, option, widget):
         painter.save()
         painter.setOpacity(self._opacity)
@@ -228,6 +629,13 @@ class QGraphicsTextItem(QGraphicsItem):
 class QGraphicsView(QWidget):
     class DragMode: RubberBandDrag = 1; NoDrag = 0
     class ViewportAnchor: AnchorUnderMouse = 1
+    class ViewportUpdateMode: FullViewportUpdate = 0; MinimalViewportUpdate = 1; SmartViewportUpdate = 2; NoViewportUpdate = 3; BoundingRectViewportUpdate = 4
+    ZOOM_SETTLE_MS = 150  # Text is re-rendered at exact sizes once the wheel has been idle this long
+    MAX_DAMAGE_RECTS = 32  # MinimalViewportUpdate repaints the bounding rect of more rects than this
+    BACKGROUND_COLOR = (240, 240, 240)
+    # Regions are painted with this margin, which is then discarded: pygame fills a stroked rect
+    # whose visible part is thinner than twice the pen width, so cut edges must stay out of sight
+    REGION_PAD = 8
     def __init__(self, *args):
         # Support QGraphicsView(parent=None) AND QGraphicsView(scene, parent=None)
         scene = None
@@ -239,6 +647,13 @@ class QGraphicsView(QWidget):
             else:
                 parent = args[0]
         
+        # Items are painted into a persistent viewport surface; scene changes add damage rects
+        # (scene coordinates) and only those areas are repainted
+        self._update_mode = QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate
+        self._viewport_surface = None
+        self._painted_state = None
+        self._damage = []
+        self._full_update = True
         super().__init__(parent); self._scene = None; self.sceneChanged = Signal(); self.joinRequested = Signal()
         if scene: self.setScene(scene)
         
@@ -246,8 +661,30 @@ class QGraphicsView(QWidget):
         self._drag_mode = QGraphicsView.DragMode.NoDrag
         self._rubber_band_rect = None
         self._is_panning = False
+        self._focus_policy = Qt.FocusPolicy.StrongFocus
+        self._zooming = False
+        self._zoom_settle_timer = None
+        self._async_text = False
     def setScene(self, scene):
-        if scene: self._scene = scene; scene._views.append(self)
+        if scene: self._scene = scene; scene._views.append(self); self.update()
+    def setViewportUpdateMode(self, mode):
+        """How scene changes repaint the viewport: MinimalViewportUpdate (the default; Smart
+        behaves the same) repaints each changed area, BoundingRectViewportUpdate the rect around
+        them all, FullViewportUpdate everything, and NoViewportUpdate nothing until update()."""
+        self._update_mode = mode
+        self.update()
+    def viewportUpdateMode(self): return self._update_mode
+    def update(self):
+        self._full_update = True
+        super().update()
+    def _scene_changed(self):
+        # The damage itself arrives through _add_damage when the scene flushes its changes
+        if self._update_mode != QGraphicsView.ViewportUpdateMode.NoViewportUpdate: self._request_repaint()
+    def _add_damage(self, rects):
+        mode = self._update_mode
+        if mode == QGraphicsView.ViewportUpdateMode.NoViewportUpdate: return
+        if mode == QGraphicsView.ViewportUpdateMode.FullViewportUpdate: self._full_update = True
+        elif not self._full_update: self._damage.extend(rects)
     def scene(self): return self._scene
     def viewport(self): return self
     def setRenderHint(self, h, on=True): 
@@ -255,6 +692,10 @@ class QGraphicsView(QWidget):
         if on: self._render_hints.add(h)
         else: self._render_hints.discard(h)
     def setDragMode(self, m): self._drag_mode = m
+    def setAsyncTextRendering(self, on):
+        """Rasterizes new item text on worker threads; placeholders are drawn until it is ready."""
+        self._async_text = on
+    def asyncTextRendering(self): return self._async_text
     def setTransformationAnchor(self, a): self._transformation_anchor = a
     def setResizeAnchor(self, a): self._resize_anchor = a
     def scale(self, sx, sy): self._view_transform.scale(sx, sy)
@@ -277,40 +718,20 @@ class QGraphicsView(QWidget):
     def keyPressEvent(self, event):
         if self._scene:
             self._scene.keyPressEvent(event)
+        else: event.ignore()
     def keyReleaseEvent(self, event):
         if self._scene and hasattr(self._scene, 'keyReleaseEvent'):
             self._scene.keyReleaseEvent(event)
+        else: event.ignore()
     def _draw(self, pos):
         screen = self._get_screen()
         if self._scene and screen:
-            # Viewport Background
-            pygame.draw.rect(screen, (240, 240, 240), (pos.x, pos.y, self._rect.width, self._rect.height))
-            
             # Simple clipping to widget area
             old_clip = screen.get_clip()
             screen.set_clip(pygame.Rect(pos.x, pos.y, self._rect.width, self._rect.height))
-            
-            # Drawing offset includes widget pos AND view transform
-            tx, ty = self._view_transform._m[6], self._view_transform._m[7]
-            total_offset = QPointF(pos.x + tx, pos.y + ty)
-            
-            painter = QPainter(screen)
-            # Apply view transform: Translate AND Scale (m11, m12, m21, m22, dx, dy)
-            m = self._view_transform._m
-            painter.setTransform(QTransform(m[0], m[1], m[3], m[4], pos.x + m[6], pos.y + m[7]))
-            
-            # Viewport culling: Calculate visible rect in scene coordinates
-            visible_rect = QRectF(self.mapToScene(QPointF(0, 0)), self.mapToScene(QPointF(self._rect.width, self._rect.height)))
-            
-            for item in self._scene.items():
-                if item.isVisible():
-                    # Only paint if item's scene bounding rect intersects visible scene area
-                    if item.sceneBoundingRect().intersects(visible_rect):
-                        painter.save()
-                        if hasattr(item, 'opacity'):
-                            painter.setOpacity(item.opacity())
-                        item.paint(painter, None, self)
-                        painter.restore()
+
+            self._paint_viewport()
+            screen.blit(self._viewport_surface, (pos.x, pos.y))
             
             # Draw rubber band
             if self._rubber_band_rect:
@@ -323,6 +744,57 @@ class QGraphicsView(QWidget):
 
             screen.set_clip(old_clip)
 
+    def _damage_regions(self, w, h):
+        """Viewport rects to repaint this frame: all of it after update(), a resize or a pan or
+        zoom, otherwise the scene damage mapped to the viewport and clipped to it."""
+        m = self._view_transform._m
+        state = (w, h, self._zooming, *m)
+        full = self._full_update or state != self._painted_state or self._update_mode == QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+        damage, self._damage, self._full_update, self._painted_state = self._damage, [], False, state
+        bounds = pygame.Rect(0, 0, w, h)
+        if full: return [bounds]
+        sx, sy, tx, ty = m[0], m[4], m[6], m[7]
+        regions = []
+        for x, y, dw, dh in damage:
+            # One extra pixel on each side covers rounding in the painter
+            r = pygame.Rect(math.floor(x * sx + tx) - 1, math.floor(y * sy + ty) - 1, math.ceil(dw * sx) + 3, math.ceil(dh * sy) + 3).clip(bounds)
+            if r.width and r.height: regions.append(r)
+        if len(regions) > 1 and (self._update_mode == QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate or len(regions) > self.MAX_DAMAGE_RECTS):
+            regions = [regions[0].unionall(regions[1:])]
+        return regions
+
+    def _paint_viewport(self):
+        """Brings the persistent viewport surface up to date, repainting only damaged areas."""
+        w, h = max(1, self._rect.width), max(1, self._rect.height)
+        if self._viewport_surface is None or self._viewport_surface.get_size() != (w, h):
+            self._viewport_surface = pygame.Surface((w, h))
+            self._full_update = True
+        self._scene._flush_changes()
+        regions = self._damage_regions(w, h)
+        if not regions: return
+        m = self._view_transform._m
+        pad = self.REGION_PAD
+        for region in regions:
+            area = region.inflate(2 * pad, 2 * pad)
+            scratch = pygame.Surface(area.size)
+            scratch.fill(self.BACKGROUND_COLOR)
+            painter = QPainter(scratch)
+            painter._text_lod = self._zooming
+            if self._async_text: painter._async_text_widget = self
+            # Apply view transform: Translate AND Scale (m11, m12, m21, m22, dx, dy)
+            painter.setTransform(QTransform(m[0], m[1], m[3], m[4], m[6] - area.x, m[7] - area.y))
+            # Culling: only items whose scene bounding rect meets the area, from the index
+            scene_rect = QRectF(self.mapToScene(QPointF(area.x, area.y)), self.mapToScene(QPointF(area.right, area.bottom)))
+            for item in self._scene._items_in_rect(scene_rect):
+                if item.isVisible():
+                    painter.save()
+                    if hasattr(item, 'opacity'):
+                        painter.setOpacity(item.opacity())
+                    if item._cache_mode: item._paint_cached(painter, self)
+                    else: item.paint(painter, None, self)
+                    painter.restore()
+            self._viewport_surface.blit(scratch, region.topleft, pygame.Rect(pad, pad, region.width, region.height))
+
     def mousePressEvent(self, ev):
         # Prepare scene position
         scene_pos = self.mapToScene(ev.pos())
@@ -330,8 +802,8 @@ class QGraphicsView(QWidget):
         # Check if we clicked on an item
         clicked_item = None
         if self._scene:
-             # Hit test in reverse order (topmost first)
-             clicked_item = next((i for i in reversed(self._scene.items()) if i.isVisible() and i.sceneBoundingRect().contains(scene_pos)), None)
+             # Topmost visible item under the cursor
+             clicked_item = self._scene.itemAt(scene_pos)
 
         if clicked_item and (clicked_item.flags() & QGraphicsItem.GraphicsItemFlag.ItemIsMovable or clicked_item.flags() & QGraphicsItem.GraphicsItemFlag.ItemIsSelectable):
              # Clicked on interactable item -> prioritize drag/select over rubberband
@@ -381,7 +853,7 @@ class QGraphicsView(QWidget):
         # Cursor logic
         if self._scene:
             p = self.mapToScene(ev.pos())
-            item = next((i for i in reversed(self._scene.items()) if i.isVisible() and i.sceneBoundingRect().contains(p)), None)
+            item = self._scene.itemAt(p)
             if item and hasattr(item, '_cursor'):
                 pygame.mouse.set_cursor(item._cursor)
             else:
@@ -425,8 +897,8 @@ class QGraphicsView(QWidget):
             if not (ev.modifiers() & Qt.KeyboardModifier.ControlModifier):
                 self._scene.clearSelection()
             
-            for item in self._scene.items():
-                if item.isVisible() and scene_rect.intersects(item.sceneBoundingRect()):
+            for item in self._scene._items_in_rect(scene_rect):
+                if item.isVisible():
                     item.setSelected(True)
         
         # Clear drag state
@@ -481,6 +953,7 @@ class QGraphicsView(QWidget):
             # Adjust translation directly (already in screen space)
             self._view_transform._m[6] += dx
             self._view_transform._m[7] += dy
+            self._begin_zoom_gesture()
         else:
             # --- Scroll vertically (pan) ---
             scroll_speed = 40
@@ -490,3 +963,17 @@ class QGraphicsView(QWidget):
 
         ev.accept()
 
+    def _begin_zoom_gesture(self):
+        """Draws text at quantized sizes until zooming pauses for ZOOM_SETTLE_MS."""
+        self._zooming = True
+        if self._zoom_settle_timer is None:
+            self._zoom_settle_timer = QTimer()
+            self._zoom_settle_timer.setSingleShot(True)
+            self._zoom_settle_timer.timeout.connect(self._end_zoom_gesture)
+        self._zoom_settle_timer.start(self.ZOOM_SETTLE_MS)
+        self.update()
+
+    def _end_zoom_gesture(self):
+        self._zooming = False
+        self.update()
+
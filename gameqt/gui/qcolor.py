@@ -25,8 +25,9 @@ class QColor:
                     return
                 
                 if arg_low in QColor.NAMED_COLORS:
-                    self.r, self.g, self.b = QColor.NAMED_COLORS[arg_low]
-                    self.a = 255
+                    rgba = QColor.NAMED_COLORS[arg_low]
+                    self.r, self.g, self.b = rgba[:3]
+                    self.a = rgba[3] if len(rgba) > 3 else 255
                 else:
                     h = arg.lstrip('#')
                     if len(h) == 6: 
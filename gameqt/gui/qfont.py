@@ -1,7 +1,11 @@
 import pygame
+from collections import OrderedDict
 
 class QFont:
-    _cache = {}
+    _cache = OrderedDict()  # (family, size, bold, italic) -> pygame Font, least recently used first
+    _cache_limit = 64
+    _hits = 0
+    _misses = 0
     
     def __init__(self, family="Arial", size=12): 
         self._family = family
@@ -18,18 +22,50 @@ class QFont:
     def italic(self): return self._italic
     
     def get_sys_font(self):
+        # "Arial" is the default family; it maps to pygame's bundled font
+        return QFont.sys_font(None if self._family == "Arial" else self._family, self._size, self._bold, self._italic)
+
+    @staticmethod
+    def sys_font(family=None, size=12, bold=False, italic=False):
+        """Shared pygame font for (family, size, bold, italic). Every widget gets its fonts
+        here instead of calling pygame.font.SysFont while drawing; the cache is a bounded LRU."""
+        key = (family, size, bold, italic)
+        cache = QFont._cache
+        font = cache.get(key)
+        if font is not None:
+            QFont._hits += 1
+            cache.move_to_end(key)
+            return font
+        QFont._misses += 1
+        font = cache[key] = QFont._load_font(family, size, bold, italic)
+        while len(cache) > QFont._cache_limit: cache.popitem(last=False)
+        return font
+
+    @staticmethod
+    def _load_font(family, size, bold, italic):
         from .qfontdatabase import QFontDatabase
-        key = (self._family, self._size, self._bold)
-        if key not in QFont._cache:
-            custom_path = QFontDatabase.getFontPath(self._family)
-            if custom_path:
-                try:
-                    f = pygame.font.Font(custom_path, self._size)
-                    f.set_bold(self._bold)
-                    QFont._cache[key] = f
-                except Exception as e:
-                    print(f"Failed to load custom font {self._family}: {e}")
-                    QFont._cache[key] = pygame.font.SysFont(None, self._size, self._bold)
-            else:
-                QFont._cache[key] = pygame.font.SysFont(self._family if self._family != "Arial" else None, self._size, self._bold)
-        return QFont._cache[key]
+        custom_path = QFontDatabase.getFontPath(family) if family else None
+        if custom_path:
+            try:
+                f = pygame.font.Font(custom_path, size)
+                f.set_bold(bold); f.set_italic(italic)
+                return f
+            except Exception as e:
+                print(f"Failed to load custom font {family}: {e}")
+                family = None
+        return pygame.font.SysFont(family, size, bold, italic)
+
+    @staticmethod
+    def setCacheLimit(n):
+        QFont._cache_limit = max(1, n)
+        while len(QFont._cache) > QFont._cache_limit: QFont._cache.popitem(last=False)
+    @staticmethod
+    def cacheLimit(): return QFont._cache_limit
+    @staticmethod
+    def cacheStats():
+        """Hit/miss counters and occupancy of the shared font cache."""
+        return {'hits': QFont._hits, 'misses': QFont._misses, 'size': len(QFont._cache), 'limit': QFont._cache_limit}
+    @staticmethod
+    def clearCache():
+        QFont._cache.clear()
+        QFont._hits = QFont._misses = 0
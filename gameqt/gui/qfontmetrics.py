@@ -0,0 +1,45 @@
+from ..core import Qt, QRect
+
+class QFontMetrics:
+    """Measures text in a QFont with the same fonts render_text draws with, without
+    rasterizing anything. Results come from the text renderer's metrics cache."""
+    ELLIPSIS = "…"
+
+    def __init__(self, font): self._font = font
+
+    def _face(self):
+        from ..utils.text_renderer import get_font_face
+        f = self._font
+        return get_font_face(f.family(), f.pointSize(), f.bold(), f.italic())
+
+    def _metrics(self, text):
+        from ..utils.text_renderer import get_text_metrics
+        f = self._font
+        return get_text_metrics(text, f.family(), f.pointSize(), f.bold(), f.italic())
+
+    def ascent(self): return self._face().ascent
+    def descent(self): return self._face().descent
+    def height(self): return self._face().height
+    def lineSpacing(self): return self._face().height + 5  # Line gap used by render_text
+    def horizontalAdvance(self, text): return self._metrics(text)[0]
+    def width(self, text): return self.horizontalAdvance(text)
+
+    def boundingRect(self, text):
+        """Rect of text relative to the baseline of its first line, as in Qt."""
+        w, h, asc, _ = self._metrics(text)
+        return QRect(0, -asc, w, h)
+
+    def elidedText(self, text, mode, width, flags=0):
+        text = str(text)
+        if mode == Qt.TextElideMode.ElideNone or self.horizontalAdvance(text) <= width: return text
+        def candidate(n):
+            if mode == Qt.TextElideMode.ElideLeft: return self.ELLIPSIS + text[len(text) - n:]
+            if mode == Qt.TextElideMode.ElideMiddle: return text[:(n + 1) // 2] + self.ELLIPSIS + text[len(text) - n // 2:]
+            return text[:n] + self.ELLIPSIS
+        # Longest kept prefix/suffix that still fits
+        lo, hi = 0, len(text) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.horizontalAdvance(candidate(mid)) <= width: lo = mid
+            else: hi = mid - 1
+        return candidate(lo) if self.horizontalAdvance(candidate(lo)) <= width else ""
@@ -1,49 +1,93 @@
 import pygame
 
+# Only these modifiers take part in shortcut matching; left/right variants are folded together
+_MODIFIER_GROUPS = (pygame.KMOD_CTRL, pygame.KMOD_ALT, pygame.KMOD_SHIFT, pygame.KMOD_META)
+
+# Keys that only change modifiers; they never start or break a chord
+MODIFIER_KEYS = frozenset((
+    pygame.K_LCTRL, pygame.K_RCTRL, pygame.K_LSHIFT, pygame.K_RSHIFT,
+    pygame.K_LALT, pygame.K_RALT, pygame.K_LMETA, pygame.K_RMETA,
+    pygame.K_CAPSLOCK, pygame.K_NUMLOCK, pygame.K_MODE,
+))
+
+def normalize_modifiers(mods):
+    """Reduces a pygame modifier mask to the CTRL/ALT/SHIFT/META groups."""
+    result = 0
+    for group in _MODIFIER_GROUPS:
+        if mods & group: result |= group
+    return result
+
 class QKeySequence:
     class StandardKey: Cut = 1; Copy = 2; Paste = 3
+    _STANDARD_KEYS = {
+        StandardKey.Cut: ("Ctrl+X", "Meta+X"),
+        StandardKey.Copy: ("Ctrl+C", "Meta+C"),
+        StandardKey.Paste: ("Ctrl+V", "Meta+V"),
+    }
+    _standard_chords = {}  # StandardKey -> frozenset of (key, mods)
+
     def __init__(self, key_str):
         self._key_str = key_str
-        self._keys = []
-        self._modifiers = 0
-        
-        parts = key_str.split('+')
-        for p in parts:
+        self._chords = []
+
+        # "Ctrl+K, Ctrl+C" is a two-key chord sequence
+        for part in key_str.split(', '):
+            chord = self._parse_chord(part)
+            if chord: self._chords.append(chord)
+
+        # First chord, kept for code that inspects these directly
+        self._keys = [self._chords[0][0]] if self._chords else []
+        self._modifiers = self._chords[0][1] if self._chords else 0
+
+    @staticmethod
+    def _parse_chord(text):
+        key = None
+        modifiers = 0
+        for p in text.split('+'):
             p = p.strip().upper()
-            if p == 'CTRL': self._modifiers |= pygame.KMOD_CTRL
-            elif p == 'ALT': self._modifiers |= pygame.KMOD_ALT
-            elif p == 'SHIFT': self._modifiers |= pygame.KMOD_SHIFT
-            elif p == 'META': self._modifiers |= pygame.KMOD_META
+            if not p: continue
+            if p == 'CTRL': modifiers |= pygame.KMOD_CTRL
+            elif p == 'ALT': modifiers |= pygame.KMOD_ALT
+            elif p == 'SHIFT': modifiers |= pygame.KMOD_SHIFT
+            elif p == 'META': modifiers |= pygame.KMOD_META
             else:
                 # Try to find the key in pygame constants
-                try: 
+                try:
                     k_attr = f"K_{p.lower()}" if len(p) == 1 else f"K_{p}"
-                    
-                    if k_attr == "K_DELETE": k_attr = "K_DELETE"
-                    elif k_attr == "K_DEL": k_attr = "K_DELETE"
-                    elif k_attr == "K_RETURN": k_attr = "K_RETURN"
+
+                    if k_attr == "K_DEL": k_attr = "K_DELETE"
                     elif k_attr == "K_ENTER": k_attr = "K_RETURN"
-                    
-                    self._keys.append(getattr(pygame, k_attr))
+
+                    key = getattr(pygame, k_attr)
                 except AttributeError:
                     print(f"[gui.QKeySequence] Unknown key sequence part: {p}")
-    
+        if key is None: return None
+        return (key, modifiers)
+
+    @staticmethod
+    def _coerce(value):
+        """Returns a QKeySequence for a QKeySequence, string or StandardKey value."""
+        if isinstance(value, QKeySequence): return value
+        if isinstance(value, int): return QKeySequence(QKeySequence._STANDARD_KEYS.get(value, ("",))[0])
+        return QKeySequence(str(value))
+
+    @staticmethod
+    def _chords_for_standard_key(standard_key):
+        if standard_key not in QKeySequence._standard_chords:
+            QKeySequence._standard_chords[standard_key] = frozenset(
+                QKeySequence._parse_chord(s) for s in QKeySequence._STANDARD_KEYS.get(standard_key, ()))
+        return QKeySequence._standard_chords[standard_key]
+
+    def count(self): return len(self._chords)
+    def isEmpty(self): return not self._chords
+    def toString(self): return self._key_str
+
     def matches(self, key, mods):
-        # Simplistic check
-        if not self._keys: return False
-        
-        # Check if the right modifiers are pressed (ignore non-essential ones like numlock if possible, but PyGame KMODs can be strict)
-        # We need to check if the required modifiers are present, and NO unwanted modifiers are present.
-        required_mods = self._modifiers
-        
-        # We generally only care about CTRL, ALT, SHIFT, META
-        relevant_mask = pygame.KMOD_CTRL | pygame.KMOD_ALT | pygame.KMOD_SHIFT | pygame.KMOD_META
-        actual_mods = mods & relevant_mask
-        
-        return key == self._keys[0] and required_mods == actual_mods
+        """True if a single key press completes this (single-chord) sequence."""
+        return len(self._chords) == 1 and self._chords[0] == (key, normalize_modifiers(mods))
 
     @staticmethod
-    def matches_static(k1, k2): 
+    def matches_static(k1, k2):
         # k1 and k2 are likely QKeySequence or strings
         s1 = k1._key_str if hasattr(k1, '_key_str') else str(k1)
         s2 = k2._key_str if hasattr(k2, '_key_str') else str(k2)
@@ -1,3 +1,4 @@
+import math
 import pygame
 from ..core import Qt, QPointF
 from .qcolor import QColor
@@ -6,6 +7,13 @@ from .qtransform import QTransform
 from .qpen import QPen
 from .qbrush import QBrush
 
+LOD_STEPS_PER_OCTAVE = 2
+
+def lod_font_size(size):
+    """Smallest quantized pixel size >= size, with two buckets per doubling."""
+    size = max(4.0, float(size))
+    return int(math.ceil(2 ** (math.ceil(math.log2(size) * LOD_STEPS_PER_OCTAVE - 1e-9) / LOD_STEPS_PER_OCTAVE)))
+
 class QPainter:
     class RenderHint: Antialiasing = 1; SmoothPixmapTransform = 2
     def __init__(self, device=None): 
@@ -16,6 +24,8 @@ class QPainter:
         self._transform = QTransform()
         self._state_stack = []  # Stack for save/restore
         self._opacity = 1.0
+        self._text_lod = False  # Set by QGraphicsView during zoom gestures
+        self._async_text_widget = None  # Widget to repaint when background-rendered text is ready
 
     def setOpacity(self, opacity): self._opacity = opacity
     def opacity(self): return self._opacity
@@ -26,6 +36,38 @@ class QPainter:
         if hasattr(c, 'to_pygame'): c = c.to_pygame() # Handle QColor passed directly
         if len(c) < 4: c = (*c, 255)
         return (c[0], c[1], c[2], int(c[3] * self._opacity))
+    def _pen_rgba(self):
+        """Pen color for text. Opacity is applied when blitting, so a fade reuses one render."""
+        c = self._pen._color
+        c = c.to_pygame() if hasattr(c, 'to_pygame') else c
+        return tuple(c) if len(c) == 4 else (*c, 255)
+    def _blit_text(self, surface, pos):
+        # Floor like the shapes do; blit truncates toward zero, which shifts negative positions
+        pos = (math.floor(pos[0]), math.floor(pos[1]))
+        # Text surfaces are shared through the render cache; restore their alpha after use
+        if self._opacity < 1.0:
+            surface.set_alpha(int(self._opacity * 255))
+            self._device.blit(surface, pos)
+            surface.set_alpha(255)
+        else: self._device.blit(surface, pos)
+    def _render_text(self, text, size):
+        from ..utils.text_renderer import render_text, render_text_async
+        if self._async_text_widget is not None:
+            return render_text_async(text, self._font._family, size, self._pen_rgba(), widget=self._async_text_widget)
+        return render_text(text, self._font._family, size, self._pen_rgba())
+    def _text_surface(self, text, sy):
+        """Rendered text at the font size scaled by sy. In level-of-detail mode the text is
+        rendered at a quantized size and bitmap-scaled, so continuous zooming reuses a few
+        rasters instead of producing a new font size every step."""
+        size = self._font._size * sy
+        if not self._text_lod:
+            return self._render_text(text, max(4, int(size)))
+        bucket = lod_font_size(size)
+        surface = self._render_text(text, bucket)
+        scale = max(4.0, size) / bucket
+        if scale == 1.0: return surface
+        w, h = surface.get_size()
+        return pygame.transform.smoothscale(surface, (max(1, round(w * scale)), max(1, round(h * scale))))
     def save(self):
         # Save current state
         self._state_stack.append({
@@ -88,7 +130,7 @@ class QPainter:
         tx, ty = self._transform._m[6], self._transform._m[7]
         sx, sy = self._transform._m[0], self._transform._m[4]
         
-        nx, ny = int(x * sx + tx), int(y * sy + ty)
+        nx, ny = math.floor(x * sx + tx), math.floor(y * sy + ty)
         nw, nh = int(w * sx), int(h * sy)
         r = pygame.Rect(nx, ny, nw, nh)
         
@@ -118,7 +160,7 @@ class QPainter:
         tx, ty = self._transform._m[6], self._transform._m[7]
         sx, sy = self._transform._m[0], self._transform._m[4]
         
-        nx, ny = int(x * sx + tx), int(y * sy + ty)
+        nx, ny = math.floor(x * sx + tx), math.floor(y * sy + ty)
         nw, nh = int(w * sx), int(h * sy)
         r = pygame.Rect(nx, ny, nw, nh)
         
@@ -143,7 +185,7 @@ class QPainter:
         tx, ty = self._transform._m[6], self._transform._m[7]
         sx, sy = self._transform._m[0], self._transform._m[4]
         
-        nx, ny = int(x * sx + tx), int(y * sy + ty)
+        nx, ny = math.floor(x * sx + tx), math.floor(y * sy + ty)
         nw, nh = int(w * sx), int(h * sy)
         r = pygame.Rect(nx, ny, nw, nh)
         
@@ -226,7 +268,7 @@ class QPainter:
         
         tx, ty = self._transform._m[6], self._transform._m[7]
         sx, sy = self._transform._m[0], self._transform._m[4]
-        nx, ny = int(x * sx + tx), int(y * sy + ty)
+        nx, ny = math.floor(x * sx + tx), math.floor(y * sy + ty)
         nw, nh = int(w * sx), int(h * sy)
         r = pygame.Rect(nx, ny, nw, nh)
         
@@ -247,7 +289,7 @@ class QPainter:
             
     def drawPolygon(self, points):
         if not self._device: return
-        pts = [(p.x(), p.y()) for p in [self._transform.map(p) for p in points]]
+        pts = [(math.floor(p.x()), math.floor(p.y())) for p in [self._transform.map(p) for p in points]]
         
         # Calculate bounding rect for temp surface
         if not pts: return
@@ -291,7 +333,7 @@ class QPainter:
                 w = rect.width() if hasattr(rect, 'width') and callable(rect.width) else getattr(rect, 'width', 0)
                 h = rect.height() if hasattr(rect, 'height') and callable(rect.height) else getattr(rect, 'height', 0)
                 
-                nx, ny = int(x * sx + tx), int(y * sy + ty)
+                nx, ny = math.floor(x * sx + tx), math.floor(y * sy + ty)
                 nw, nh = max(1, int(w * sx)), max(1, int(h * sy))
                 
                 # Get scaled surface (cached in QPixmap)
@@ -309,7 +351,7 @@ class QPainter:
             x, y, pixmap = args
             if pixmap.surface:
                 # Calculate target position and size
-                nx, ny = int(x * sx + tx), int(y * sy + ty)
+                nx, ny = math.floor(x * sx + tx), math.floor(y * sy + ty)
                 nw = max(1, int(pixmap.width() * sx))
                 nh = max(1, int(pixmap.height() * sy))
                 
@@ -326,31 +368,22 @@ class QPainter:
     def drawText(self, *args):
         if not self._device: return
         # Handle different signatures: drawText(rect, flags, text) or drawText(x, y, text)
-        from ..utils.text_renderer import render_text
         # Get transform parameters
         tx, ty = self._transform._m[6], self._transform._m[7]
         sx, sy = self._transform._m[0], self._transform._m[4]
-        
-        # Calculate effective font size
-        # We use sy (vertical scale) as the primary scale for font size
-        effective_size = max(4, int(self._font._size * sy))
-        effective_font_family = self._font._family
+        # The font size scales with sy (vertical scale)
         
         if len(args) == 3:
             if isinstance(args[0], (int, float)):
                 # drawText(x, y, text)
                 x, y, text = args
                 nx, ny = x * sx + tx, y * sy + ty
-                color = self._apply_opacity(self._pen._color)
-                surface = render_text(str(text), effective_font_family, effective_size, color)
-                if self._opacity < 1.0: surface.set_alpha(int(self._opacity * 255))
-                self._device.blit(surface, (nx, ny))
+                surface = self._text_surface(str(text), sy)
+                self._blit_text(surface, (nx, ny))
             else:
                 # drawText(rect, flags, text)
                 rect, flags, text = args
-                color = self._apply_opacity(self._pen._color)
-                surface = render_text(str(text), effective_font_family, effective_size, color)
-                if self._opacity < 1.0: surface.set_alpha(int(self._opacity * 255))
+                surface = self._text_surface(str(text), sy)
                 r = rect.toRect() if hasattr(rect, 'toRect') else rect
                 
                 # ...
@@ -375,13 +408,11 @@ class QPainter:
                 if flags & Qt.AlignmentFlag.AlignBottom: draw_y = nry + nrh - th
                 elif flags & Qt.AlignmentFlag.AlignVCenter: draw_y = nry + (nrh - th) // 2
                 
-                self._device.blit(surface, (draw_x, draw_y))
+                self._blit_text(surface, (draw_x, draw_y))
 
         elif len(args) == 2:
             # drawText(point, text)
             point, text = args
             nx, ny = point.x() * sx + tx, point.y() * sy + ty
-            color = self._apply_opacity(self._pen._color)
-            surface = render_text(str(text), effective_font_family, effective_size, color)
-            if self._opacity < 1.0: surface.set_alpha(int(self._opacity * 255))
-            self._device.blit(surface, (nx, ny))
+            surface = self._text_surface(str(text), sy)
+            self._blit_text(surface, (nx, ny))
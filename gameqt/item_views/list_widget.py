@@ -1,5 +1,6 @@
 import pygame
 from ..core import Signal, Qt
+from ..gui import QFont
 from ..application import QApplication
 from .abstract_item_view import QAbstractItemView, QAbstractItemModel
 
@@ -56,10 +57,10 @@ class QListWidget(QAbstractItemView):
     def _draw(self, pos):
         super()._draw(pos)
         if not QApplication._instance or not QApplication._instance._windows: return
-        screen = QApplication._instance._windows[0]._screen
+        screen = self._get_screen()
         if not screen: return
         
-        font = pygame.font.SysFont("Arial", 12)
+        font = QFont.sys_font("Arial", 12)
         item_w, item_h = 110, 160
         margin = 10
         
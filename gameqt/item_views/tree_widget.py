@@ -1,5 +1,6 @@
 import pygame
 from ..core import Qt, Signal
+from ..gui import QFont
 from ..application import QApplication
 from .abstract_item_view import QAbstractItemView, QHeaderView, QStyleOptionViewItem
 
@@ -119,10 +120,11 @@ class QTreeWidget(QAbstractItemView):
         screen = self._get_screen()
         if not screen: return
         
-        from ..gui import QPainter, QColor
+        from ..gui import QPainter
+        from ..utils import QSSParser
         painter = QPainter(screen)
         
-        font = pygame.font.SysFont("Arial", 12)
+        font = QFont.sys_font("Arial", 12)
         header_h = 25
         item_h = 22
         
@@ -140,18 +142,11 @@ class QTreeWidget(QAbstractItemView):
         app_style = QApplication._global_style
         if app_style and "QHeaderView::section" in app_style:
             h_style = app_style["QHeaderView::section"]
-            if 'background-color' in h_style:
-                try: header_bg = QColor(h_style['background-color']).to_pygame()
-                except: pass
-            if 'color' in h_style:
-                try: header_text_color = QColor(h_style['color']).to_pygame()
-                except: pass
-            if 'border-right' in h_style:
-                parts = h_style['border-right'].split()
-                for p in parts:
-                    if p.startswith('#') or p in QColor.NAMED_COLORS:
-                        try: header_border_color = QColor(p).to_pygame()
-                        except: pass
+            typed = QSSParser.typed_value
+            header_bg = typed('background-color', h_style.get('background-color')) or header_bg
+            header_text_color = typed('color', h_style.get('color')) or header_text_color
+            border_right = typed('border-right', h_style.get('border-right'))
+            if border_right and border_right.color: header_border_color = border_right.color
         
         pygame.draw.rect(screen, header_bg, (pos.x, pos.y, self._rect.width, header_h))
         pygame.draw.line(screen, header_border_color,
@@ -230,11 +225,7 @@ class QTreeWidget(QAbstractItemView):
                 else:
                     # Default drawing
                     if is_selected:
-                        sel_bg = (0, 120, 215)
-                        sel_bg_str = self._get_style_property('background-color', pseudo='selected', sub_element='item')
-                        if sel_bg_str:
-                            try: sel_bg = QColor(sel_bg_str).to_pygame()
-                            except: pass
+                        sel_bg = self._get_style_value('background-color', pseudo='selected', sub_element='item') or (0, 120, 215)
                         pygame.draw.rect(screen, sel_bg, cell_rect)
                         text_color = (255, 255, 255)
                     else:
@@ -1,5 +1,6 @@
 import pygame
 from ..core import Qt, QSize
+from ..gui import QFont
 from ..widgets import QWidget
 
 def _get_text(item):
@@ -8,6 +9,10 @@ def _get_text(item):
         return t() if callable(t) else str(t)
     return str(getattr(item, '_text', ''))
 
+def _text_width(item):
+    """Heuristic width for text widgets, measured with the shared default font."""
+    return QFont.sys_font(None, 18).size(_get_text(item))[0] + 20
+
 class QVBoxLayout:
     def __init__(self, parent=None):
         self.items, self._parent = [], parent
@@ -19,7 +24,7 @@ class QVBoxLayout:
             w._set_parent(self._parent)
             if self._parent.isVisible(): w.show()
     def removeWidget(self, w):
-        if w in self.items: self.items.remove(w)
+        if w in self.items: self.items.remove(w); self.invalidate()
     def _set_parent(self, p):
         self._parent = p
         for item in self.items:
@@ -27,20 +32,25 @@ class QVBoxLayout:
     def addLayout(self, l):
         self.items.append(l); l._parent = self._parent
         if self._parent and hasattr(l, '_set_parent'): l._set_parent(self._parent)
+        self.invalidate()
     def addItem(self, i): 
         self.items.append(i)
         if hasattr(i, '_set_parent'): i._set_parent(self._parent)
+        self.invalidate()
     def addStretch(self, s=0): 
         # Add a stretchable spacer
         spacer = type('Spacer', (), {'isVisible': lambda self: True, 'stretch': s, 'size': 0})()
-        self.items.append(spacer)
+        self.items.append(spacer); self.invalidate()
     def addSpacing(self, size):
         # Add a fixed size spacer
         spacer = type('Spacer', (), {'isVisible': lambda self: True, 'stretch': 0, 'size': size})()
-        self.items.append(spacer)
+        self.items.append(spacer); self.invalidate()
 
-    def setContentsMargins(self, left, top, right, bottom): self._margins = (left, top, right, bottom)
-    def setSpacing(self, s): self._spacing = s
+    def setContentsMargins(self, left, top, right, bottom): self._margins = (left, top, right, bottom); self.invalidate()
+    def setSpacing(self, s): self._spacing = s; self.invalidate()
+    def invalidate(self):
+        """Marks this layout for re-arrangement in the next layout pass."""
+        if self._parent is not None and hasattr(self._parent, '_invalidate_layout'): self._parent._invalidate_layout()
     def arrange(self, rect):
         visible_items = [i for i in self.items if getattr(i, 'isVisible', lambda: True)()]
         if not visible_items: return
@@ -99,8 +109,7 @@ class QVBoxLayout:
                     if sh: w = sh.width()
                 elif hasattr(item, 'text'):
                     # Heuristic for labels/buttons
-                    font = pygame.font.SysFont(None, 18)
-                    w = font.size(_get_text(item))[0] + 20
+                    w = _text_width(item)
                 
                 w = min(content_w, w)
                 
@@ -121,9 +130,8 @@ class QVBoxLayout:
             item_rect = pygame.Rect(x, curr_y, w, h)
             item._rect = item_rect
             
-            # Pass relative rect to nested layouts
-            if hasattr(item, '_layout') and item._layout: item._layout.arrange(pygame.Rect(0, 0, item_rect.width, item_rect.height))
-            elif hasattr(item, 'arrange'): item.arrange(item_rect)
+            # Nested layouts share our coordinates; widgets arrange their own layout in the layout pass
+            if hasattr(item, 'arrange'): item.arrange(item_rect)
             
             curr_y += h + spacing
 
@@ -138,7 +146,7 @@ class QHBoxLayout:
             w._set_parent(self._parent)
             if self._parent.isVisible(): w.show()
     def removeWidget(self, w):
-        if w in self.items: self.items.remove(w)
+        if w in self.items: self.items.remove(w); self.invalidate()
     def _set_parent(self, p):
         self._parent = p
         for item in self.items:
@@ -146,20 +154,25 @@ class QHBoxLayout:
     def addLayout(self, l):
         self.items.append(l); l._parent = self._parent
         if self._parent and hasattr(l, '_set_parent'): l._set_parent(self._parent)
+        self.invalidate()
     def addItem(self, i):
         self.items.append(i)
         if hasattr(i, '_set_parent'): i._set_parent(self._parent)
+        self.invalidate()
     def addStretch(self, s=0): 
         # Add a stretchable spacer
         spacer = type('Spacer', (), {'isVisible': lambda self: True, 'stretch': s, 'size': 0})()
-        self.items.append(spacer)
+        self.items.append(spacer); self.invalidate()
     def addSpacing(self, size):
         # Add a fixed size spacer
         spacer = type('Spacer', (), {'isVisible': lambda self: True, 'stretch': 0, 'size': size})()
-        self.items.append(spacer)
+        self.items.append(spacer); self.invalidate()
 
-    def setContentsMargins(self, left, top, right, bottom): self._margins = (left, top, right, bottom)
-    def setSpacing(self, s): self._spacing = s
+    def setContentsMargins(self, left, top, right, bottom): self._margins = (left, top, right, bottom); self.invalidate()
+    def setSpacing(self, s): self._spacing = s; self.invalidate()
+    def invalidate(self):
+        """Marks this layout for re-arrangement in the next layout pass."""
+        if self._parent is not None and hasattr(self._parent, '_invalidate_layout'): self._parent._invalidate_layout()
     def arrange(self, rect):
         visible_items = [i for i in self.items if getattr(i, 'isVisible', lambda: True)()]
         if not visible_items: return
@@ -172,9 +185,7 @@ class QHBoxLayout:
         for item in visible_items:
             class_name = item.__class__.__name__
             if class_name in ('QPushButton', 'QLabel', 'QLineEdit', 'QCheckBox'): 
-                 font = pygame.font.SysFont(None, 18)
-                 w = font.size(_get_text(item))[0] + 20
-                 fixed_w += w
+                 fixed_w += _text_width(item)
             elif class_name == 'Spacer':
                 if getattr(item, 'stretch', 0) == 0: 
                     fixed_w += getattr(item, 'size', 10)
@@ -192,8 +203,7 @@ class QHBoxLayout:
             class_name = item.__class__.__name__
             w = (int(unit_w) if expandable_count > 0 else (available_w // len(visible_items))) # fallback
             if class_name in ('QPushButton', 'QLabel', 'QLineEdit', 'QCheckBox'):
-                font = pygame.font.SysFont(None, 18)
-                w = font.size(_get_text(item))[0] + 20
+                w = _text_width(item)
             elif class_name == 'Spacer':
                 w = int(unit_w * item.stretch) if item.stretch > 0 else getattr(item, 'size', 10)
                 
@@ -209,8 +219,7 @@ class QHBoxLayout:
             # Vertical alignment within the row (simple)
             item_rect = pygame.Rect(curr_x, y, w, h)
             item._rect = item_rect
-            # Pass relative rect to nested layouts
-            if hasattr(item, '_layout') and item._layout: item._layout.arrange(pygame.Rect(0, 0, item_rect.width, item_rect.height))
-            elif hasattr(item, 'arrange'): item.arrange(item_rect)
+            # Nested layouts share our coordinates; widgets arrange their own layout in the layout pass
+            if hasattr(item, 'arrange'): item.arrange(item_rect)
             
             curr_x += w + spacing
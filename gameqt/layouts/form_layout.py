@@ -15,14 +15,17 @@ class QFormLayout:
     def setLabelWidth(self, width):
         """Set the width for all labels."""
         self._label_width = width
+        self.invalidate()
         
     def setRowMinimumHeight(self, row, height):
         """Set minimum height for a specific row."""
         self._row_heights[row] = height
+        self.invalidate()
         
     def setRowSpacing(self, row, spacing):
         """Set custom spacing after a specific row."""
         self._row_spacing[row] = spacing
+        self.invalidate()
 
     def addRow(self, label, field):
         if isinstance(label, str):
@@ -35,9 +38,11 @@ class QFormLayout:
         if self._parent:
             if label_widget: label_widget._set_parent(self._parent)
             if field: field._set_parent(self._parent)
+        self.invalidate()
             
     def removeWidget(self, w):
         self.rows = [(l, f) for l, f in self.rows if l != w and f != w]
+        self.invalidate()
 
     def _set_parent(self, p):
         self._parent = p
@@ -45,8 +50,11 @@ class QFormLayout:
             if label and hasattr(label, '_set_parent'): label._set_parent(p)
             if field and hasattr(field, '_set_parent'): field._set_parent(p)
 
-    def setContentsMargins(self, left, top, right, bottom): self._margins = (left, top, right, bottom)
-    def setSpacing(self, s): self._spacing = s
+    def setContentsMargins(self, left, top, right, bottom): self._margins = (left, top, right, bottom); self.invalidate()
+    def setSpacing(self, s): self._spacing = s; self.invalidate()
+    def invalidate(self):
+        """Marks this layout for re-arrangement in the next layout pass."""
+        if self._parent is not None and hasattr(self._parent, '_invalidate_layout'): self._parent._invalidate_layout()
 
     def _calculate_row_height(self, row_idx, label, field):
         """Calculate dynamic height based on content."""
@@ -83,10 +91,7 @@ class QFormLayout:
                 label_rect = pygame.Rect(rect.x + margins[0], curr_y, label_w, h)
                 label._rect = label_rect
                 if getattr(label, 'isVisible', lambda: True)():
-                    if hasattr(label, '_layout') and label._layout: 
-                        label._layout.arrange(pygame.Rect(0, 0, label_rect.width, label_rect.height))
-                    elif hasattr(label, 'arrange'): 
-                        label.arrange(label_rect)
+                    if hasattr(label, 'arrange'): label.arrange(label_rect)
             
             # Field rect
             if field:
@@ -99,9 +104,6 @@ class QFormLayout:
                 field_rect = pygame.Rect(rect.x + margins[0] + label_w + self._spacing, curr_y, field_w, h)
                 field._rect = field_rect
                 if getattr(field, 'isVisible', lambda: True)():
-                    if hasattr(field, '_layout') and field._layout: 
-                        field._layout.arrange(pygame.Rect(0, 0, field_rect.width, field_rect.height))
-                    elif hasattr(field, 'arrange'): 
-                        field.arrange(field_rect)
+                    if hasattr(field, 'arrange'): field.arrange(field_rect)
             
             curr_y += h + spacing
@@ -21,10 +21,12 @@ class QGridLayout:
     def setRowMinimumHeight(self, row, height):
         """Set minimum height for a specific row."""
         self._row_heights[row] = height
+        self.invalidate()
         
     def setColumnMinimumWidth(self, col, width):
         """Set minimum width for a specific column."""
         self._col_widths[col] = width
+        self.invalidate()
         
     def addWidget(self, w, row=None, col=None, rowSpan=1, colSpan=1, alignment=0):
         """Add widget at specified position, or auto-insert if row/col are None."""
@@ -64,10 +66,12 @@ class QGridLayout:
             self._next_row = row + 1
             
         if hasattr(item, '_set_parent'): item._set_parent(self._parent)
+        self.invalidate()
         
     def removeWidget(self, w):
         to_del = [k for k, v in self.items.items() if v['widget'] == w]
         for k in to_del: del self.items[k]
+        self.invalidate()
 
     def _set_parent(self, p):
         self._parent = p
@@ -75,8 +79,11 @@ class QGridLayout:
             w = info['widget']
             if hasattr(w, '_set_parent'): w._set_parent(p)
             
-    def setContentsMargins(self, left, top, right, bottom): self._margins = (left, top, right, bottom)
-    def setSpacing(self, s): self._spacing = s
+    def setContentsMargins(self, left, top, right, bottom): self._margins = (left, top, right, bottom); self.invalidate()
+    def setSpacing(self, s): self._spacing = s; self.invalidate()
+    def invalidate(self):
+        """Marks this layout for re-arrangement in the next layout pass."""
+        if self._parent is not None and hasattr(self._parent, '_invalidate_layout'): self._parent._invalidate_layout()
     
     def arrange(self, rect):
         if not self.items: return
@@ -122,5 +129,4 @@ class QGridLayout:
             item_rect = pygame.Rect(x, y, width, height)
             w._rect = item_rect
             
-            if hasattr(w, '_layout') and w._layout: w._layout.arrange(pygame.Rect(0, 0, width, height))
-            elif hasattr(w, 'arrange'): w.arrange(item_rect)
+            if hasattr(w, 'arrange'): w.arrange(item_rect)
@@ -102,29 +102,26 @@ class QSplitter(QWidget):
                     self._handle_rects.append(h_rect)
                     curr += self._handle_width
 
+    def _activate_layouts(self):
+        self._update_geometries()
+        super()._activate_layouts()
+
     def _draw_recursive(self, offset=pygame.Vector2(0,0)):
         if not self.isVisible(): return
         
-        self._update_geometries()
-        
         super()._draw_recursive(offset)
         
         my_pos = offset + pygame.Vector2(self._rect.topleft)
         screen = self._get_screen()
         if not screen: return
         
-        from ..gui import QColor
         # Draw handles with QSS support
         for i, h_rect in enumerate(self._handle_rects):
             # Check for hover or dragging to set pseudo-state
             is_active = (self._dragging_index == i or self._hover_index == i)
             pseudo = "hover" if is_active else None
             
-            bg_str = self._get_style_property('background-color', pseudo=pseudo, sub_element='handle')
-            handle_color = (200, 200, 205)
-            if bg_str:
-                try: handle_color = QColor(bg_str).to_pygame()
-                except: pass
+            handle_color = self._get_style_value('background-color', pseudo=pseudo, sub_element='handle') or (200, 200, 205)
             
             r = pygame.Rect(my_pos.x + h_rect.x, my_pos.y + h_rect.y, h_rect.width, h_rect.height)
             pygame.draw.rect(screen, handle_color, r)
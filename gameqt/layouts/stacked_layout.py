@@ -22,9 +22,12 @@ class QStackedLayout:
                 self.items[self._current_index].hide()
             self._current_index = index
             self.items[index].show()
+            self.invalidate()
+    def invalidate(self):
+        """Marks this layout for re-arrangement in the next layout pass."""
+        if self._parent is not None and hasattr(self._parent, '_invalidate_layout'): self._parent._invalidate_layout()
     def arrange(self, rect):
         if 0 <= self._current_index < len(self.items):
             w = self.items[self._current_index]
             w._rect = rect
-            if hasattr(w, '_layout') and w._layout: w._layout.arrange(pygame.Rect(0, 0, rect.width, rect.height))
-            elif hasattr(w, 'arrange'): w.arrange(rect)
+            if hasattr(w, 'arrange'): w.arrange(rect)
@@ -1,5 +1,6 @@
 import pygame
 from .core import QObject, Signal, Qt, QMouseEvent
+from .gui import QFont
 from .widgets import QWidget
 from .application import QApplication
 
@@ -9,31 +10,21 @@ class QMenuBar(QWidget):
     def addMenu(self, title):
         m = QMenu(title, self); self._menus.append(m); return m
     def _draw(self, pos):
-        screen = pygame.display.get_surface()
+        screen = self._get_screen()
         if not screen: return
         
         # 1. Base QSS Drawing (background/border)
         super()._draw(pos)
         
         # QMenuBar often has a specific border-bottom in themes
-        from .gui import QColor
-        bb = self._get_style_property('border-bottom')
+        bb = self._get_style_value('border-bottom')
         if bb:
-            border_color = (180, 180, 180)
-            parts = bb.split()
-            for p in parts:
-                if p.startswith('#') or p in QColor.NAMED_COLORS:
-                    try: border_color = QColor(p).to_pygame()
-                    except: pass
+            border_color = bb.color or (180, 180, 180)
             pygame.draw.line(screen, border_color, (pos.x, pos.y + self._rect.height - 1), (pos.x + self._rect.width, pos.y + self._rect.height - 1))
         
-        text_color_str = self._get_style_property('color')
-        text_color = (30, 30, 35)
-        if text_color_str:
-            try: text_color = QColor(text_color_str).to_pygame()
-            except: pass
+        text_color = self._get_style_value('color') or (30, 30, 35)
             
-        font = pygame.font.SysFont(None, 20)
+        font = QFont.sys_font(None, 20)
         curr_x_local = 12
         self._menu_rects = []
         for m in self._menus:
@@ -51,12 +42,7 @@ class QMenuBar(QWidget):
             if is_active or is_hovered:
                 # Use sub_element='item' for QMenuBar::item
                 pseudo = 'selected' if is_active or is_hovered else None
-                sel_bg_str = self._get_style_property('background-color', pseudo=pseudo, sub_element='item')
-                
-                sel_bg = (200, 210, 230)
-                if sel_bg_str:
-                    try: sel_bg = QColor(sel_bg_str).to_pygame()
-                    except: pass
+                sel_bg = self._get_style_value('background-color', pseudo=pseudo, sub_element='item') or (200, 210, 230)
                 pygame.draw.rect(screen, sel_bg, (pos.x + item_rect_local.x, pos.y, item_rect_local.width, item_rect_local.height))
             
             screen.blit(txt_surface, (pos.x + curr_x_local, pos.y + (self._rect.height - th) // 2))
@@ -237,6 +223,9 @@ class QMenu(QWidget):
             
             # Redraw
             app = QApplication.instance()
+            app._process_timers()
+            app._process_async_text()
+            app._activate_layouts()
             for win in app._windows:
                 if win.isVisible(): win._draw_recursive(pygame.Vector2(0,0))
             for popup in app._popups:
@@ -286,33 +275,16 @@ class QMenu(QWidget):
         if not screen or not self._actions: return
         w, h = 200, len(self._actions) * 28
         
-        from .gui import QColor
-        bg_color_str = self._get_style_property('background-color')
-        bg_color = (255, 255, 255)
-        if bg_color_str:
-            try: bg_color = QColor(bg_color_str).to_pygame()
-            except: pass
-            
-        text_color_str = self._get_style_property('color')
-        text_color = (45, 45, 50)
-        if text_color_str:
-            try: text_color = QColor(text_color_str).to_pygame()
-            except: pass
-            
-        border_color = (160, 160, 170)
-        border_str = self._get_style_property('border')
-        if border_str:
-            parts = border_str.split()
-            for p in parts:
-                if p.startswith('#') or p in QColor.NAMED_COLORS:
-                    try: border_color = QColor(p).to_pygame()
-                    except: pass
+        bg_color = self._get_style_value('background-color') or (255, 255, 255)
+        text_color = self._get_style_value('color') or (45, 45, 50)
+        border = self._get_style_value('border')
+        border_color = (border and border.color) or (160, 160, 170)
 
         # Draw main background
         pygame.draw.rect(screen, bg_color, (pos.x, pos.y, w, h))
         pygame.draw.rect(screen, border_color, (pos.x, pos.y, w, h), 1)
         
-        font = pygame.font.SysFont(None, 18)
+        font = QFont.sys_font(None, 18)
         mouse_pos = pygame.mouse.get_pos()
         
         for i, a in enumerate(self._actions):
@@ -330,19 +302,10 @@ class QMenu(QWidget):
                 
                 if is_hovered or is_active_parent:
                     # Selection/Hover style via sub_element='item'
-                    sel_bg_str = self._get_style_property('background-color', pseudo='selected', sub_element='item')
-                    sel_color_str = self._get_style_property('color', pseudo='selected', sub_element='item')
-                    
-                    sel_bg = (0, 120, 215)
-                    if sel_bg_str:
-                        try: sel_bg = QColor(sel_bg_str).to_pygame()
-                        except: pass
-                    
-                    sel_color = (255, 255, 255)
-                    if sel_color_str:
-                        try: sel_color = QColor(sel_color_str).to_pygame()
-                        except: pass
-                    else:
+                    sel_bg = self._get_style_value('background-color', pseudo='selected', sub_element='item') or (0, 120, 215)
+                    sel_color = self._get_style_value('color', pseudo='selected', sub_element='item')
+                    if not sel_color:
+                        sel_color = (255, 255, 255)
                         # Fallback: contrast check
                         if (sel_bg[0]*0.299 + sel_bg[1]*0.587 + sel_bg[2]*0.114) > 186:
                             sel_color = (0, 0, 0)
@@ -475,8 +438,21 @@ class QAction(QObject):
         self._visible = True
         self._checkable = False
         self._checked = False
+        self._shortcut_context = Qt.ShortcutContext.WindowShortcut
     def setShortcut(self, s): 
-        self._shortcut = s
+        from .gui.qkeysequence import QKeySequence
+        app = QApplication._instance
+        if app and self._shortcut is not None: app._unregister_shortcut(self, self._shortcut)
+        self._shortcut = QKeySequence._coerce(s) if s else None
+        if app and self._shortcut is not None: app._register_shortcut(self, self._shortcut)
+    def shortcut(self): return self._shortcut
+    def setShortcutContext(self, context): self._shortcut_context = context
+    def shortcutContext(self): return self._shortcut_context
+    def trigger(self):
+        if not self._enabled: return
+        if self._checkable: self.setChecked(not self._checked)
+        self.triggered.emit()
+    def _activate_shortcut(self): self.trigger()
     def setEnabled(self, e): 
         self._enabled = e
     def setVisible(self, v): 
@@ -125,7 +125,7 @@ class QDrag:
             return app.startDrag(self)
         return 0
 
-from .qss_parser import QSSParser
+from .qss_parser import QSSParser, CompiledStyleSheet, ComputedStyle
 
 class QUndoView(QWidget):
     def __init__(self, stack=None, parent=None): 
@@ -1,5 +1,86 @@
-
 import re
+import itertools
+from collections import namedtuple
+
+_serials = itertools.count(1)
+
+BorderSpec = namedtuple('BorderSpec', 'width style color')  # color is None when unspecified
+
+COLOR_PROPERTIES = frozenset(('color', 'background-color', 'border-color', 'selection-color',
+                              'selection-background-color', 'alternate-background-color', 'gridline-color'))
+LENGTH_PROPERTIES = frozenset(('border-radius', 'border-width', 'padding', 'margin', 'spacing', 'font-size',
+                               'width', 'height', 'min-width', 'min-height', 'max-width', 'max-height'))
+BORDER_PROPERTIES = frozenset(('border', 'border-top', 'border-bottom', 'border-left', 'border-right'))
+BORDER_STYLES = frozenset(('none', 'solid', 'dashed', 'dotted', 'double', 'groove', 'ridge', 'inset', 'outset'))
+_LENGTH_RE = re.compile(r'(-?\d+(?:\.\d+)?)\s*(px|pt)?')
+
+class StyleRule:
+    """One compiled selector of a QSS block, e.g. 'QGroupBox QPushButton::menu-indicator:hover'."""
+    __slots__ = ('selector', 'type_name', 'sub_element', 'pseudo', 'ancestors', 'specificity', 'order', 'props')
+
+    def __init__(self, selector, props, order):
+        parts = [p for p in selector.split() if p != '>']
+        self.selector, self.props, self.order = selector, props, order
+        self.type_name, self.sub_element, self.pseudo = QSSParser.parse_compound(parts[-1])
+        self.ancestors = tuple(parts[:-1])
+        # One point per named type, sub-element and pseudo-state; ties go to the later rule
+        spec = 0
+        for part in parts:
+            type_name, sub, pseudo = QSSParser.parse_compound(part)
+            spec += (type_name != '*') + (sub is not None) + (pseudo is not None)
+        self.specificity = spec
+
+    def matches_ancestors(self, ancestors):
+        """ancestors lists the class-name sets of the widget's parents, nearest first."""
+        i = 0
+        for anc in reversed(self.ancestors):
+            while i < len(ancestors) and anc != '*' and anc not in ancestors[i]: i += 1
+            if i >= len(ancestors): return False
+            i += 1
+        return True
+
+class CompiledStyleSheet(dict):
+    """Parsed stylesheet. As a dict it maps selector text to merged properties; lookups go
+    through rules indexed by the (type, sub-element, pseudo-state) of their rightmost part."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.rules = []
+        self._index = {}
+        self.serial = next(_serials)  # Identifies this sheet in computed-style keys
+
+    def add_rule(self, selector, props):
+        rule = StyleRule(selector, props, len(self.rules))
+        self.rules.append(rule)
+        self._index.setdefault((rule.type_name, rule.sub_element, rule.pseudo), []).append(rule)
+        self.setdefault(selector, {}).update(props)
+
+    def lookup(self, prop, type_names, ancestors, pseudo=None, sub_element=None):
+        """Value of prop from the most specific matching rule, or None.
+
+        type_names are the widget's class names (its MRO) and ancestors the class-name sets of
+        its parents, nearest first. Only rules whose sub-element and pseudo-state equal the
+        requested ones are candidates."""
+        best, best_key = None, None
+        for name in list(type_names) + ['*']:
+            for rule in self._index.get((name, sub_element, pseudo), ()):
+                if prop not in rule.props: continue
+                key = (rule.specificity, rule.order)
+                if best_key is not None and key <= best_key: continue
+                if rule.ancestors and not rule.matches_ancestors(ancestors): continue
+                best, best_key = rule.props[prop], key
+        return best
+
+class ComputedStyle:
+    """Resolved property values shared by every widget with the same style key: class,
+    local stylesheet and the same chain of ancestor classes and stylesheets. Values are
+    resolved on first use and never change afterwards; a stylesheet change produces new keys
+    rather than mutating existing styles."""
+    __slots__ = ('key', '_values')
+
+    def __init__(self, key):
+        self.key = key
+        self._values = {}  # (prop, pseudo, sub_element) -> value
 
 class QSSParser:
     """
@@ -8,31 +89,89 @@ class QSSParser:
     """
     @staticmethod
     def parse(qss_text):
+        styles = CompiledStyleSheet()
         if not qss_text:
-            return {}
-            
+            return styles
+
         # Detect if it's just a set of rules (no blocks)
         if '{' not in qss_text:
-            return {"*": QSSParser.parse_rules(qss_text)}
+            styles.add_rule("*", QSSParser.parse_rules(qss_text))
+            return styles
 
         # Remove comments: /* ... */
         qss_text = re.sub(r'/\*.*?\*/', '', qss_text, flags=re.DOTALL)
-        
-        styles = {}
+
         # Find blocks: selectors { rules }
         blocks = re.findall(r'([^{]+)\s*\{\s*([^}]+)\s*\}', qss_text)
-        
+
         for selectors, rules in blocks:
             parsed_rules = QSSParser.parse_rules(rules)
             for selector in selectors.split(','):
                 selector = selector.strip()
                 if not selector: continue
-                if selector not in styles:
-                    styles[selector] = {}
-                styles[selector].update(parsed_rules)
-        
+                styles.add_rule(selector, parsed_rules)
+
         return styles
 
+    _typed_cache = {}
+
+    @staticmethod
+    def typed_value(prop, raw):
+        """Converts a raw property value once into the form draw code uses: an RGBA tuple for
+        colors, int pixels for lengths, a BorderSpec for borders, a bool for font-weight and a
+        comma-separated family list for font-family. Other properties stay strings."""
+        if raw is None: return None
+        key = (prop, raw)
+        try: return QSSParser._typed_cache[key]
+        except KeyError: pass
+        if prop in COLOR_PROPERTIES: val = QSSParser.parse_color(raw)
+        elif prop in LENGTH_PROPERTIES: val = QSSParser.parse_length(raw)
+        elif prop in BORDER_PROPERTIES: val = QSSParser.parse_border(raw)
+        elif prop == 'font-weight': val = 'bold' in raw or any(w in raw for w in ('600', '700', '800', '900'))
+        elif prop == 'font-family': val = ','.join(f.strip().strip('\'"') for f in raw.split(',') if f.strip())
+        else: val = raw
+        QSSParser._typed_cache[key] = val
+        return val
+
+    @staticmethod
+    def parse_color(raw):
+        from ..gui import QColor
+        try: return tuple(QColor(raw.strip()).to_pygame())
+        except Exception: return None
+
+    @staticmethod
+    def parse_length(raw):
+        """'5px' -> 5, '10pt' -> 13, '7' -> 7; the first value of shorthands like '4px 8px'."""
+        m = _LENGTH_RE.search(raw)
+        if not m: return None
+        v = float(m.group(1))
+        return int(round(v * 96 / 72)) if m.group(2) == 'pt' else int(v)
+
+    @staticmethod
+    def parse_border(raw):
+        """'1px solid #a0a0aa' -> BorderSpec(1, 'solid', (160, 160, 170, 255))."""
+        width, style, color = 1, 'solid', None
+        for token in raw.split():
+            if token in BORDER_STYLES: style = token
+            elif token[0].isdigit(): width = QSSParser.parse_length(token) or 0
+            else: color = QSSParser.parse_color(token)
+        if style == 'none': width = 0
+        return BorderSpec(width, style, color)
+
+    @staticmethod
+    def parse_compound(part):
+        """Splits 'QSplitter::handle:hover' into ('QSplitter', 'handle', 'hover')."""
+        pseudo = None
+        if ':' in part:
+            idx = part.rfind(':')
+            if idx > 0 and part[idx-1] != ':' and (idx == len(part)-1 or part[idx+1] != ':'):
+                pseudo = part[idx+1:]
+                part = part[:idx]
+        if '::' in part:
+            type_name, sub = part.split('::', 1)
+            return (type_name or '*'), sub, pseudo
+        return part, None, pseudo
+
     @staticmethod
     def parse_rules(rules_text):
         """Parses a string of rules like 'color: red; margin: 5px' into a dict."""
@@ -2,6 +2,12 @@ import pygame
 from PIL import Image, ImageDraw, ImageFont
 import os
 import re
+import json
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from ..gui import QFont
 
 # Common emoji font paths
 EMOJI_FONTS = [
@@ -28,25 +34,175 @@ for path in REGULAR_FONTS:
         _regular_font_path = path
         break
 
+class SurfaceCache:
+    """LRU of rendered surfaces bounded by their pixel memory (width * height * 4 bytes)."""
+    def __init__(self, budget):
+        self._entries = OrderedDict()  # key -> (surface, nbytes), least recently used first
+        self.budget, self.bytes = budget, 0
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, surf):
+        nbytes = surf.get_width() * surf.get_height() * 4
+        if nbytes > self.budget: return  # Would evict everything else; draw it uncached
+        old = self._entries.pop(key, None)
+        if old: self.bytes -= old[1]
+        self._entries[key] = (surf, nbytes)
+        self.bytes += nbytes
+        self._shrink()
+
+    def set_budget(self, budget):
+        self.budget = max(0, int(budget))
+        self._shrink()
+
+    def _shrink(self):
+        while self.bytes > self.budget and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {'entries': len(self._entries), 'bytes': self.bytes, 'budget': self.budget,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def peek(self, key):
+        """The cached surface without counting a hit or refreshing its age."""
+        entry = self._entries.get(key)
+        return entry[0] if entry else None
+
+    def __len__(self): return len(self._entries)
+    def __contains__(self, key): return key in self._entries
+
+RENDER_CACHE_BUDGET = 32 * 1024 * 1024  # bytes
+MASK_CACHE_BUDGET = 8 * 1024 * 1024     # bytes
+
 # Caches for performance optimization
 _variant_cache = {}  # (path, bold, italic) -> resolved_path
 _font_cache = {}     # (path, target_h) -> ImageFont
-_render_cache = {}   # (text, font_family, font_size, color_tuple, bold, italic) -> pygame.Surface
+_render_cache = SurfaceCache(RENDER_CACHE_BUDGET)  # (text, font_family, font_size, color_tuple, bold, italic) -> pygame.Surface
+_mask_cache = SurfaceCache(MASK_CACHE_BUDGET)      # (text, font_family, font_size, bold, italic) -> coverage mask
+
+def set_render_cache_budget(nbytes):
+    """Caps the memory held by cached text surfaces; least recently drawn text is evicted first."""
+    _render_cache.set_budget(nbytes)
+
+def render_cache_budget(): return _render_cache.budget
+
+def render_cache_stats():
+    """Entries, bytes used, budget, hits, misses and evictions of the text surface cache."""
+    return _render_cache.stats()
+
+def set_mask_cache_budget(nbytes):
+    """Caps the memory held by coverage masks, which are kept apart from the colored surfaces."""
+    _mask_cache.set_budget(nbytes)
+
+def mask_cache_stats():
+    """Entries, bytes used, budget, hits, misses and evictions of the coverage mask cache."""
+    return _mask_cache.stats()
+
+def clear_render_cache():
+    global _worker_font_generation
+    _render_cache.clear()
+    _mask_cache.clear()
+    _sync_only.clear()
+    _worker_font_generation += 1  # Workers drop their font copies on their next job
 
 def has_emoji(text):
     """Check if text contains high-surrogate emojis (U+10000+)."""
     return any(ord(c) > 0xFFFF for c in text)
 
+def _default_calibration_cache_path():
+    """font_calibration.json under $XDG_CACHE_HOME (~/.cache when unset or relative)."""
+    base = os.environ.get("XDG_CACHE_HOME", "")
+    if not os.path.isabs(base): base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "gameqt", "font_calibration.json")
+
+# On-disk calibration table: font path -> {"mtime": ..., "sizes": {target_h: point size}}.
+# None disables it; see set_calibration_cache_path().
+CALIBRATION_CACHE_PATH = _default_calibration_cache_path()
+_calibration = None  # Loaded on the first calibration cache miss
+_calibration_dirty = False
+
+def _calibration_table():
+    global _calibration
+    if _calibration is None:
+        _calibration = {}
+        if CALIBRATION_CACHE_PATH:
+            try:
+                with open(CALIBRATION_CACHE_PATH, 'r') as f: table = json.load(f)
+                if isinstance(table, dict): _calibration = table
+            except (OSError, ValueError): pass
+    return _calibration
+
+def _calibrated_size(path, target_h):
+    """Point size stored for (path, target_h), or None if unknown or the file changed."""
+    entry = _calibration_table().get(path)
+    try:
+        if entry and entry['mtime'] == os.path.getmtime(path): return entry['sizes'].get(str(target_h))
+    except (OSError, KeyError, TypeError): pass
+    return None
+
+def _record_calibration(path, target_h, size):
+    global _calibration_dirty
+    table = _calibration_table()
+    try: mtime = os.path.getmtime(path)
+    except OSError: return
+    entry = table.get(path)
+    if not isinstance(entry, dict) or entry.get('mtime') != mtime:
+        entry = table[path] = {'mtime': mtime, 'sizes': {}}
+    entry['sizes'][str(target_h)] = size
+    _calibration_dirty = True
+
+def save_calibration_table():
+    """Writes new calibration results to CALIBRATION_CACHE_PATH. Called at exit."""
+    global _calibration_dirty
+    if not _calibration_dirty or not CALIBRATION_CACHE_PATH: return
+    try:
+        os.makedirs(os.path.dirname(CALIBRATION_CACHE_PATH), exist_ok=True)
+        tmp = CALIBRATION_CACHE_PATH + '.tmp'
+        with open(tmp, 'w') as f: json.dump(_calibration, f)
+        os.replace(tmp, CALIBRATION_CACHE_PATH)
+        _calibration_dirty = False
+    except OSError: pass
+
+atexit.register(save_calibration_table)
+
+def set_calibration_cache_path(path):
+    """Moves the on-disk calibration table; None keeps calibration in memory only."""
+    global CALIBRATION_CACHE_PATH, _calibration, _calibration_dirty
+    save_calibration_table()
+    CALIBRATION_CACHE_PATH, _calibration, _calibration_dirty = path, None, False
+
 def get_calibrated_font(path, target_h):
-    """Binary search for exact pixel height (ascent + descent). Cached."""
+    """Binary search for exact pixel height (ascent + descent). Cached in memory and on disk."""
     if not path or not os.path.exists(path): return ImageFont.load_default()
     target_h = max(1, int(target_h))
     
     key = (path, target_h)
     if key in _font_cache: return _font_cache[key]
+
+    size = _calibrated_size(path, target_h)
+    if size is not None:
+        try:
+            res = _font_cache[key] = ImageFont.truetype(path, size)
+            return res
+        except Exception: pass
     
     low, high = 1, 500
     best_f = None
+    res = None
     for _ in range(10):
         mid = (low + high) // 2
         if mid < 1: mid = 1
@@ -57,17 +213,18 @@ def get_calibrated_font(path, target_h):
             if h < target_h: low = mid + 1; best_f = f
             elif h > target_h: high = mid - 1
             else: 
-                _font_cache[key] = f
-                return f
+                res = f
+                break
         except: 
             low = mid + 1
             if low > high: break
     
-    res = best_f
+    if not res: res = best_f
     if not res:
         try: res = ImageFont.truetype(path, target_h)
         except: res = ImageFont.load_default()
     
+    if isinstance(res, ImageFont.FreeTypeFont) and res.path == path: _record_calibration(path, target_h, res.size)
     _font_cache[key] = res
     return res
 
@@ -121,73 +278,93 @@ def find_font_variant(path, bold=False, italic=False):
     _variant_cache[key] = res
     return res
 
-def get_text_metrics(text, font_family, font_size, bold=False, italic=False):
-    """Returns (width, height, ascent, descent). Multiline aware."""
+class FontFace:
+    """A resolved font file at one pixel height: the calibrated Pillow font, its emoji
+    companion and an advance-width table for measuring text without rasterizing it."""
+    def __init__(self, path, font_size):
+        self.font = get_calibrated_font(path, font_size)
+        self.ascent, self.descent = self.font.getmetrics()
+        self.height = self.ascent + self.descent
+        self._emoji_font = None
+        self._advances = {}  # char -> px
+
+    def emoji_font(self):
+        if self._emoji_font is None:
+            self._emoji_font = get_calibrated_font(_emoji_font_path, self.height) if _emoji_font_path else ImageFont.load_default()
+        return self._emoji_font
+
+    def advance(self, text):
+        """Width of non-emoji text as the sum of per-character advances."""
+        adv, total = self._advances, 0.0
+        for ch in text:
+            w = adv.get(ch)
+            if w is None: w = adv[ch] = self.font.getlength(ch)
+            total += w
+        return total
+
+    def line_width(self, line):
+        if not has_emoji(line): return self.advance(line)
+        total_w = 0
+        emoji_pattern = r'[\ud800-\udbff][\udc00-\udfff]'
+        last_idx = 0
+        for match in re.finditer(emoji_pattern, line):
+            if match.start() > last_idx:
+                total_w += self.font.getlength(line[last_idx:match.start()])
+            total_w += self.emoji_font().getlength(match.group())
+            last_idx = match.end()
+        if last_idx < len(line):
+            total_w += self.font.getlength(line[last_idx:])
+        return total_w
+
+_faces = {}  # (path, target_h, bold, italic) -> FontFace
+_metrics_cache = OrderedDict()  # (text, FontFace) -> (width, height, ascent, descent)
+METRICS_CACHE_SIZE = 4096
+
+def get_font_face(font_family, font_size, bold=False, italic=False):
+    """The FontFace for a family (application fonts first, then the regular fallback). Cached."""
     from ..gui.qfontdatabase import QFontDatabase
-    pil_reg_font_path = _regular_font_path
-    custom_path = QFontDatabase.getFontPath(font_family)
-    if custom_path: pil_reg_font_path = custom_path
-    
-    pil_reg_font_path = find_font_variant(pil_reg_font_path, bold, italic)
-    reg_f = get_calibrated_font(pil_reg_font_path, font_size)
-    r_asc, r_desc = reg_f.getmetrics()
-    target_h = r_asc + r_desc
-    
-    emo_f = ImageFont.load_default()
-    if _emoji_font_path:
-        emo_f = get_calibrated_font(_emoji_font_path, target_h)
-            
-    dummy = Image.new('RGBA', (1, 1))
-    draw = ImageDraw.Draw(dummy)
-    
-    lines = str(text).split('\n')
-    max_w = 0
+    key = (QFontDatabase.getFontPath(font_family) or _regular_font_path, max(1, int(font_size)), bold, italic)
+    face = _faces.get(key)
+    if face is None: face = _faces[key] = FontFace(find_font_variant(key[0], bold, italic), key[1])
+    return face
+
+def get_text_metrics(text, font_family, font_size, bold=False, italic=False):
+    """Returns (width, height, ascent, descent). Multiline aware. Cached."""
+    face = get_font_face(font_family, font_size, bold, italic)
+    key = (str(text), face)
+    res = _metrics_cache.get(key)
+    if res is not None:
+        _metrics_cache.move_to_end(key)
+        return res
+    lines = key[0].split('\n')
     spacing = 5
-    
-    def measure_line(line):
-        if not has_emoji(line):
-            return draw.textlength(line, font=reg_f)
-        else:
-            total_w = 0
-            emoji_pattern = r'[\ud800-\udbff][\udc00-\udfff]'
-            last_idx = 0
-            for match in re.finditer(emoji_pattern, line):
-                if match.start() > last_idx:
-                    total_w += draw.textlength(line[last_idx:match.start()], font=reg_f)
-                total_w += draw.textlength(match.group(), font=emo_f)
-                last_idx = match.end()
-            if last_idx < len(line):
-                total_w += draw.textlength(line[last_idx:], font=reg_f)
-            return total_w
-
-    for line in lines:
-        max_w = max(max_w, measure_line(line))
-        
-    total_h = target_h * len(lines) + (spacing * (len(lines) - 1) if len(lines) > 1 else 0)
-    return int(max_w), int(total_h), r_asc, r_desc
+    max_w = max(face.line_width(line) for line in lines)
+    total_h = face.height * len(lines) + (spacing * (len(lines) - 1) if len(lines) > 1 else 0)
+    res = _metrics_cache[key] = (int(max_w), int(total_h), face.ascent, face.descent)
+    if len(_metrics_cache) > METRICS_CACHE_SIZE: _metrics_cache.popitem(last=False)
+    return res
 
 def render_text(text, font_family, font_size, color, bold=False, italic=False):
-    """Renders text to a pygame surface using Pillow. Fully cached."""
+    """Renders text to a pygame surface using Pillow. Fully cached. Text without emoji is
+    a tinted copy of its render_text_mask(), so new colors never re-rasterize it."""
     # Ensure color is hashable tuple
     color_tup = tuple(color) if hasattr(color, '__iter__') else color
     cache_key = (str(text), font_family, font_size, color_tup, bold, italic)
-    if cache_key in _render_cache:
-        return _render_cache[cache_key]
+    cached = _render_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
+        if not has_emoji(str(text)):
+            # Rasterized once as coverage; each color is only a tinted copy
+            res = tint_surface(render_text_mask(text, font_family, font_size, bold, italic), color_tup)
+            _render_cache.put(cache_key, res)
+            return res
+
         w, h, asc, desc = get_text_metrics(text, font_family, font_size, bold, italic)
-        from ..gui.qfontdatabase import QFontDatabase
-        
-        pil_reg_font_path = _regular_font_path
-        custom_path = QFontDatabase.getFontPath(font_family)
-        if custom_path: pil_reg_font_path = custom_path
-        
-        pil_reg_font_path = find_font_variant(pil_reg_font_path, bold, italic)
-        reg_f = get_calibrated_font(pil_reg_font_path, font_size)
-        r_asc, r_desc = reg_f.getmetrics()
-        target_h = r_asc + r_desc
-        emo_f = ImageFont.load_default()
-        if _emoji_font_path: emo_f = get_calibrated_font(_emoji_font_path, target_h)
+        face = get_font_face(font_family, font_size, bold, italic)
+        reg_f, r_asc, target_h = face.font, face.ascent, face.height
+        emo_f = face.emoji_font()
         
         padding = 1
         spacing = 5
@@ -227,10 +404,234 @@ def render_text(text, font_family, font_size, color, bold=False, italic=False):
             curr_y += target_h + spacing
             
         res = pygame.image.fromstring(surf_img.tobytes("raw", "RGBA"), surf_img.size, "RGBA")
-        _render_cache[cache_key] = res
+        _render_cache.put(cache_key, res)
         return res
     except Exception as e:
-        font = pygame.font.SysFont(None, font_size)
-        font.set_bold(bold)
-        font.set_italic(italic)
+        font = QFont.sys_font(None, font_size, bold, italic)
         return font.render(str(text), True, color)
+
+def render_text_mask(text, font_family, font_size, bold=False, italic=False):
+    """White text whose alpha is the glyph coverage, for tint_surface(). Emoji-free text
+    only; color emoji cannot be tinted. Cached in their own LRU, apart from the colored renders."""
+    text = str(text)
+    cache_key = (text, font_family, font_size, bold, italic)
+    cached = _mask_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if _text_backend == 'atlas':
+        res = get_glyph_atlas(font_family, font_size, bold, italic).render(text)
+    else:
+        w, h, _, _ = get_text_metrics(text, font_family, font_size, bold, italic)
+        face = get_font_face(font_family, font_size, bold, italic)
+        data, size = _rasterize_mask(text, w, h, face.font, face.height)
+        res = pygame.image.fromstring(data, size, 'RGBA')
+    _mask_cache.put(cache_key, res)
+    return res
+
+def _rasterize_mask(text, w, h, font, line_height, padding=1, spacing=5):
+    """Pillow-only part of render_text_mask: RGBA bytes and size of the coverage mask."""
+    mask = Image.new('L', (max(1, w + padding*2), max(1, h + padding*2)), 0)
+    draw = ImageDraw.Draw(mask)
+    curr_y = padding
+    for line in text.split('\n'):
+        draw.text((padding, curr_y), line, font=font, fill=255)
+        curr_y += line_height + spacing
+    white = Image.new('L', mask.size, 255)
+    return Image.merge('RGBA', (white, white, white, mask)).tobytes(), mask.size
+
+def tint_surface(mask, color):
+    """Copy of a white coverage mask in color; an alpha in color scales the coverage."""
+    surf = mask.copy()
+    surf.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+    return surf
+
+class GlyphAtlas:
+    """Glyphs of one font at one pixel height, rasterized once as white coverage into a
+    shared surface. Strings are assembled by blitting glyphs at their advances plus the
+    font's pair kerning."""
+    WIDTH = 1024
+
+    def __init__(self, font):
+        self.font = font
+        self.ascent, self.descent = font.getmetrics()
+        self.height = self.ascent + self.descent
+        self.surface = pygame.Surface((max(self.WIDTH, self.height * 4), max(1, self.height) + 2), pygame.SRCALPHA)
+        self.surface.fill((255, 255, 255, 0))
+        self._x = self._y = self._shelf_h = 0  # Next free slot on the current shelf
+        self.glyphs = {}    # char -> (atlas rect or None, dx, dy, advance)
+        self._kerning = {}  # (left, right) -> px
+
+    def glyph(self, ch):
+        g = self.glyphs.get(ch)
+        if g is None: g = self.glyphs[ch] = self._rasterize(ch)
+        return g
+
+    def kerning(self, left, right):
+        k = self._kerning.get((left, right))
+        if k is None:
+            k = self._kerning[(left, right)] = self.font.getlength(left + right) - self.glyph(left)[3] - self.glyph(right)[3]
+        return k
+
+    def _rasterize(self, ch):
+        advance = self.font.getlength(ch)
+        l, t, r, b = self.font.getbbox(ch)
+        w, h = r - l, b - t
+        if w <= 0 or h <= 0: return None, 0, 0, advance  # Whitespace
+        mask = Image.new('L', (w, h), 0)
+        ImageDraw.Draw(mask).text((-l, -t), ch, font=self.font, fill=255)
+        white = Image.new('L', (w, h), 255)
+        glyph = pygame.image.fromstring(Image.merge('RGBA', (white, white, white, mask)).tobytes(), (w, h), 'RGBA')
+        rect = self._allocate(w, h)
+        self.surface.blit(glyph, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        return rect, l, t, advance
+
+    def _allocate(self, w, h):
+        """Shelf packing: glyphs fill rows left to right; the atlas doubles in height when full."""
+        width = self.surface.get_width()
+        if self._x + w > width: self._x, self._y, self._shelf_h = 0, self._y + self._shelf_h + 1, 0
+        if self._y + h > self.surface.get_height():
+            grown = pygame.Surface((max(width, w), max(self._y + h, self.surface.get_height() * 2)), pygame.SRCALPHA)
+            grown.fill((255, 255, 255, 0))
+            grown.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.surface = grown
+        rect = pygame.Rect(self._x, self._y, w, h)
+        self._x += w + 1
+        self._shelf_h = max(self._shelf_h, h)
+        return rect
+
+    def layout(self, line):
+        """[(x, glyph)] for the visible glyphs of line, and its total advance."""
+        placed, x, prev = [], 0.0, None
+        for ch in line:
+            g = self.glyph(ch)
+            if prev is not None: x += self.kerning(prev, ch)
+            if g[0] is not None: placed.append((x, g))
+            x += g[3]
+            prev = ch
+        return placed, x
+
+    def render(self, text, color=None, spacing=5, padding=1):
+        """The string as a surface in color, or as a white coverage mask if color is None.
+        The surface spans the padded advances and every placed glyph rect, so overhanging
+        glyphs ('J', italics) are not clipped; an overhang past the left or top padding
+        moves the pen origin by that much."""
+        lines = [self.layout(line) for line in text.split('\n')]
+        glyphs, y = [], 0
+        for placed, _ in lines:
+            for x, (rect, dx, dy, _) in placed: glyphs.append((int(round(x)) + dx, y + dy, rect))
+            y += self.height + spacing
+        w = int(max(width for _, width in lines))
+        h = self.height * len(lines) + spacing * (len(lines) - 1)
+        left = min([-padding] + [gx for gx, _, _ in glyphs])
+        top = min([-padding] + [gy for _, gy, _ in glyphs])
+        right = max([w + padding] + [gx + rect.width for gx, _, rect in glyphs])
+        bottom = max([h + padding] + [gy + rect.height for _, gy, rect in glyphs])
+        surf = pygame.Surface((max(1, right - left), max(1, bottom - top)), pygame.SRCALPHA)
+        surf.fill((255, 255, 255, 0))
+        for gx, gy, rect in glyphs:
+            surf.blit(self.surface, (gx - left, gy - top), rect, special_flags=pygame.BLEND_RGBA_MAX)
+        if color is not None: surf.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+        return surf
+
+_atlases = {}  # FontFace -> GlyphAtlas
+_text_backend = 'pillow'
+
+def get_glyph_atlas(font_family, font_size, bold=False, italic=False):
+    face = get_font_face(font_family, font_size, bold, italic)
+    atlas = _atlases.get(face)
+    if atlas is None: atlas = _atlases[face] = GlyphAtlas(face.font)
+    return atlas
+
+def set_text_backend(name):
+    """'pillow' rasterizes every new string; 'atlas' blits per-glyph rasters from a GlyphAtlas.
+    Strings containing emoji always use Pillow."""
+    global _text_backend
+    if name not in ('pillow', 'atlas'): raise ValueError(f"Unknown text backend: {name}")
+    if name != _text_backend: clear_render_cache()
+    _text_backend = name
+
+def text_backend(): return _text_backend
+
+# Background rasterization. Pillow releases the GIL while drawing glyphs, so uncached text
+# can be rasterized on worker threads; the UI thread only converts finished bytes.
+TEXT_WORKERS = 2
+TEXT_READY_EVENT = pygame.event.custom_type()  # Posted by workers to wake the event loop
+_executor = None
+_pending = {}                # mask cache key -> _TextJob
+_sync_only = OrderedDict()   # mask keys whose background rasterization failed -> None
+SYNC_ONLY_SIZE = 1024
+_worker_local = threading.local()
+WORKER_FONT_CACHE_SIZE = 32  # Font copies kept per worker thread
+_worker_font_generation = 0
+
+class _TextJob:
+    __slots__ = ('future', 'widgets')
+    def __init__(self, future):
+        self.future, self.widgets = future, set()
+
+def _worker_font(font):
+    """A private copy of font for this worker; FreeType faces must not be shared between threads."""
+    fonts = getattr(_worker_local, 'fonts', None)
+    if fonts is None or _worker_local.generation != _worker_font_generation:
+        fonts = _worker_local.fonts = OrderedDict()
+        _worker_local.generation = _worker_font_generation
+    key = (font.path, font.size)
+    f = fonts.get(key)
+    if f is None:
+        f = fonts[key] = ImageFont.truetype(font.path, font.size)
+        if len(fonts) > WORKER_FONT_CACHE_SIZE: fonts.popitem(last=False)
+    else:
+        fonts.move_to_end(key)
+    return f
+
+def _rasterize_in_worker(text, w, h, font, line_height):
+    try: return _rasterize_mask(text, w, h, _worker_font(font), line_height)
+    finally:
+        try: pygame.event.post(pygame.event.Event(TEXT_READY_EVENT))
+        except pygame.error: pass
+
+def render_text_async(text, font_family, font_size, color, bold=False, italic=False, widget=None):
+    """render_text that never rasterizes on the calling thread. Uncached emoji-free text is
+    queued to a worker pool; meanwhile this returns the same text at the nearest cached size,
+    scaled, or a blank surface of the final size. widget is repainted when the text is ready."""
+    text = str(text)
+    color_tup = tuple(color) if hasattr(color, '__iter__') else color
+    mask_key = (text, font_family, font_size, bold, italic)
+    if (_text_backend == 'atlas' or has_emoji(text) or mask_key in _mask_cache or mask_key in _sync_only
+            or (text, font_family, font_size, color_tup, bold, italic) in _render_cache):
+        return render_text(text, font_family, font_size, color, bold, italic)
+
+    w, h, _, _ = get_text_metrics(text, font_family, font_size, bold, italic)
+    job = _pending.get(mask_key)
+    if job is None:
+        face = get_font_face(font_family, font_size, bold, italic)
+        if not isinstance(getattr(face.font, 'path', None), str):
+            return render_text(text, font_family, font_size, color, bold, italic)
+        global _executor
+        if _executor is None: _executor = ThreadPoolExecutor(TEXT_WORKERS, thread_name_prefix='gameqt-text')
+        job = _pending[mask_key] = _TextJob(_executor.submit(_rasterize_in_worker, text, w, h, face.font, face.height))
+    if widget is not None: job.widgets.add(widget)
+
+    size = (max(1, w + 2), max(1, h + 2))
+    for d in (1, -1, 2, -2, 3, -3):
+        near = _render_cache.peek((text, font_family, font_size + d, color_tup, bold, italic))
+        if near is not None: return pygame.transform.smoothscale(near, size)
+    return pygame.Surface(size, pygame.SRCALPHA)
+
+def collect_async_text():
+    """Moves finished background rasters into the mask cache and repaints the widgets
+    that drew placeholders. Called from the event loop; returns True if any arrived."""
+    done = [key for key, job in _pending.items() if job.future.done()]
+    for key in done:
+        job = _pending.pop(key)
+        try: data, size = job.future.result()
+        except Exception:
+            _sync_only[key] = None
+            if len(_sync_only) > SYNC_ONLY_SIZE: _sync_only.popitem(last=False)
+        else:
+            _mask_cache.put(key, pygame.image.fromstring(data, size, 'RGBA'))
+        for widget in job.widgets: widget.update()
+    return bool(done)
+
+def has_pending_text(): return bool(_pending)
@@ -0,0 +1,54 @@
+import pygame
+
+class HitTestIndex:
+    """Flattened view of a window's visible widget tree for pointer hit tests.
+
+    Entries are stored in paint (pre-order) order with their global rect clipped to
+    the parent, and bucketed on a coarse grid, so finding the widget under a point
+    only checks the handful of widgets overlapping that grid cell. The index is
+    rebuilt by QApplication when the geometry generation changes."""
+    CELL_SIZE = 64
+
+    def __init__(self, window):
+        from .qwidget import QWidget
+        self._base_handler = QWidget._handle_event
+        self.entries = []  # (widget, global rect, origin, parent entry index, opaque)
+        self._cells = {}
+        self._bounds = None
+        self._add(window, pygame.Vector2(0, 0), None, -1)
+
+    def _add(self, widget, offset, clip, parent):
+        from .qwidget import QWidget
+        origin = offset + pygame.Vector2(widget._rect.topleft)
+        rect = pygame.Rect(origin.x, origin.y, widget._rect.width, widget._rect.height)
+        if clip is not None: rect = rect.clip(clip)
+        else: self._bounds = rect
+        # Widgets with their own _handle_event keep the recursive dispatch for their subtree
+        opaque = type(widget)._handle_event is not self._base_handler
+        index = len(self.entries)
+        self.entries.append((widget, rect, origin, parent, opaque))
+        if rect.width > 0 and rect.height > 0:
+            c = self.CELL_SIZE
+            for cx in range(rect.left // c, (rect.right - 1) // c + 1):
+                for cy in range(rect.top // c, (rect.bottom - 1) // c + 1):
+                    self._cells.setdefault((cx, cy), []).append(index)
+        for child in widget._children:
+            if isinstance(child, QWidget) and child.isVisible():
+                self._add(child, origin, rect, index)
+
+    def entry_at(self, pos):
+        """Index of the topmost entry containing pos, or -1."""
+        x, y = int(pos[0]), int(pos[1])
+        for index in reversed(self._cells.get((x // self.CELL_SIZE, y // self.CELL_SIZE), ())):
+            if self.entries[index][1].collidepoint(x, y): return index
+        return -1
+
+    def chain_at(self, pos):
+        """Entry indices from the window down to the topmost widget under pos."""
+        chain = []
+        index = self.entry_at(pos)
+        while index != -1:
+            chain.append(index)
+            index = self.entries[index][3]
+        chain.reverse()
+        return chain
@@ -11,7 +11,7 @@ class QCheckBox(QWidget):
         self.stateChanged = Signal(int)
         self._rect.height = 25
     def text(self): return self._text
-    def setChecked(self, b): self._checked = b; self.stateChanged.emit(Qt.CheckState.Checked if b else Qt.CheckState.Unchecked)
+    def setChecked(self, b): self._checked = b; self.update(); self.stateChanged.emit(Qt.CheckState.Checked if b else Qt.CheckState.Unchecked)
     def isChecked(self): return self._checked
     def _draw(self, pos):
         screen = self._get_screen()
@@ -1,5 +1,6 @@
 import pygame
 from ..core import PyGameModalDialog
+from ..gui import QFont
 
 class QColorDialog(PyGameModalDialog):
     def __init__(self, *args, **kwargs):
@@ -34,7 +35,7 @@ class QColorDialog(PyGameModalDialog):
     def draw(self, screen):
         super().draw(screen)
         y = self.rect.y + 50
-        font = pygame.font.SysFont(None, 20)
+        font = QFont.sys_font(None, 20)
         for i, (label, val) in enumerate([("R", self.r), ("G", self.g), ("B", self.b)]):
             txt = font.render(f"{label}: {val}", True, (0,0,0))
             screen.blit(txt, (self.rect.x + 20, y))
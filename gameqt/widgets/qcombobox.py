@@ -1,5 +1,6 @@
 import pygame
 from ..core import Signal
+from ..gui import QFont
 from .qwidget import QWidget
 
 class QComboBox(QWidget):
@@ -20,6 +21,7 @@ class QComboBox(QWidget):
     def setCurrentIndex(self, index):
         if 0 <= index < len(self._items):
             self._current_index = index
+            self.update()
             self.currentIndexChanged.emit(index)
     def _draw(self, pos):
         from ..application import QApplication
@@ -33,7 +35,7 @@ class QComboBox(QWidget):
         pygame.draw.polygon(screen, (80, 80, 80), [(arrow_x, arrow_y - 2), (arrow_x + 10, arrow_y - 2), (arrow_x + 5, arrow_y + 4)])
         
         txt_str = self.currentText()
-        font = pygame.font.SysFont(None, 18)
+        font = QFont.sys_font(None, 18)
         txt = font.render(txt_str, True, (20, 20, 20))
         screen.blit(txt, (pos.x + 5, pos.y + (self._rect.height - txt.get_height())//2))
         
@@ -61,7 +63,7 @@ class QComboBox(QWidget):
         pygame.draw.rect(screen, (245, 245, 250), popup_rect)
         pygame.draw.rect(screen, (150, 150, 150), popup_rect, 1)
         
-        font = pygame.font.SysFont(None, 18)
+        font = QFont.sys_font(None, 18)
         mouse_pos = pygame.mouse.get_pos()
         
         for i, item in enumerate(self._items):
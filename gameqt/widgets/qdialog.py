@@ -1,5 +1,6 @@
 import pygame
 from ..core import Qt
+from ..gui import QFont
 from ..application import QApplication
 from .qwidget import QWidget
 
@@ -25,13 +26,10 @@ class QDialog(QWidget):
         if w < 100: w = 600
         if h < 100: h = 500
         
-        self._rect.x = (sw - w) // 2
-        self._rect.y = (sh - h) // 2
-        self._rect.width, self._rect.height = w, h
+        self._rect = pygame.Rect((sw - w) // 2, (sh - h) // 2, w, h)
         
-        # Adjust layout if present. Area for children is inside margins
-        content_rect = pygame.Rect(0, 30, w, h - 30)
-        if self._layout: self._layout.arrange(content_rect)
+        # Adjust layout if present. Area for children is below the title bar
+        self._activate_layouts()
         
         # Ensure screen is up to date before capturing background
         if QApplication._instance and QApplication._instance._windows:
@@ -57,7 +55,13 @@ class QDialog(QWidget):
                         if hasattr(self, '_close_btn_rect') and self._close_btn_rect.collidepoint(event.pos):
                             self.reject()
                     # Pass event to this widget (tree). Offset is 0 for top-level.
-                    self._handle_event(event, pygame.Vector2(0,0))
+                    app = QApplication._instance
+                    if app and event.type in app._POINTER_EVENTS: app._dispatch_pointer_event(self, event)
+                    elif app and event.type in (pygame.KEYDOWN, pygame.KEYUP): app._dispatch_key_event(event, self)
+                    else: self._handle_event(event, pygame.Vector2(0,0))
+            if QApplication._instance:
+                QApplication._instance._process_timers()
+                QApplication._instance._process_async_text()
             
             # Draw
             screen.blit(bg, (0, 0))
@@ -76,7 +80,7 @@ class QDialog(QWidget):
             pygame.draw.rect(screen, (220, 220, 230), title_rect, border_top_left_radius=8, border_top_right_radius=8)
             pygame.draw.line(screen, (180, 180, 190), title_rect.bottomleft, title_rect.bottomright)
             
-            font = pygame.font.SysFont("Arial", 16, bold=True)
+            font = QFont.sys_font("Arial", 16, bold=True)
             txt = font.render(getattr(self, '_window_title', "Dialog"), True, (50, 50, 60))
             screen.blit(txt, (self._rect.x + 10, self._rect.y + 5))
             
@@ -107,7 +111,8 @@ class QDialog(QWidget):
                              (circle_center[0] + s, circle_center[1] - s),
                              (circle_center[0] - s, circle_center[1] + s), 2)
 
-            # Children are already positioned relative to (0, 30) by layout arrange call
+            # Children are positioned relative to (0, 30) by the layout pass
+            self._activate_layouts()
             self._draw_recursive_children(pygame.Vector2(self._rect.topleft))
             
             pygame.display.flip()
@@ -116,6 +121,8 @@ class QDialog(QWidget):
         self.close()
         return self._result
 
+    def _layout_rect(self): return pygame.Rect(0, 30, self._rect.width, self._rect.height - 30)
+
     def _draw_recursive_children(self, offset):
         for child in self._children:
              child._draw_recursive(offset)
@@ -132,5 +139,6 @@ class QDialog(QWidget):
         
     def setWindowFlags(self, flags): self._window_flags = flags
     def setMinimumSize(self, w, h): 
-        self._rect.width = max(self._rect.width, w)
-        self._rect.height = max(self._rect.height, h)
+        # A new rect through the setter, so the hit-test index sees the growth
+        r = self._rect
+        self._rect = pygame.Rect(r.x, r.y, max(r.width, w), max(r.height, h))
@@ -1,6 +1,7 @@
 import pygame
 import os
 from ..core import PyGameModalDialog
+from ..gui import QFont
 
 class QFileDialog:
     @staticmethod
@@ -68,7 +69,7 @@ class FileDialog(PyGameModalDialog):
     def draw(self, screen):
         super().draw(screen)
         
-        font = pygame.font.SysFont("Arial", 14)
+        font = QFont.sys_font("Arial", 14)
         
         # Path Bar
         pygame.draw.rect(screen, (255, 255, 255), (self.rect.x + 10, self.rect.y + 40, self.rect.width - 20, 25))
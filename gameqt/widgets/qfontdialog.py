@@ -34,7 +34,7 @@ class QFontDialog(PyGameModalDialog):
         return QFont(self.selected_font, self.size)
     def draw(self, screen):
         super().draw(screen)
-        font = pygame.font.SysFont(None, 18)
+        font = QFont.sys_font(None, 18)
         for i, f in enumerate(self.fonts):
             y = self.rect.y + 50 + i*15
             color = (0, 120, 215) if f == self.selected_font else (0,0,0)
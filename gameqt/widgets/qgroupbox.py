@@ -1,5 +1,5 @@
 import pygame
-from ..application import QApplication
+from ..gui import QFont
 from .qwidget import QWidget
 
 class QGroupBox(QWidget):
@@ -7,9 +7,9 @@ class QGroupBox(QWidget):
         super().__init__(parent); self._title = title
     def setTitle(self, t): self._title = t
     def _draw(self, pos):
-        screen = QApplication.instance()._windows[0]._screen
+        screen = self._get_screen()
         pygame.draw.rect(screen, (150, 150, 160), (pos.x, pos.y + 10, self._rect.width, self._rect.height - 10), 1)
-        font = pygame.font.SysFont(None, 16, bold=True)
+        font = QFont.sys_font(None, 16, bold=True)
         txt = font.render(self._title, True, (50, 50, 60))
         pygame.draw.rect(screen, (230, 230, 235), (pos.x + 10, pos.y, txt.get_width() + 4, 20))
         screen.blit(txt, (pos.x + 12, pos.y + 2))
@@ -12,7 +12,8 @@ class QLabel(QWidget):
         self._word_wrap = False
     def setText(self, text): 
         self._text = str(text) if text is not None else ""
-        self._calculate_natural_size()
+        self.updateGeometry()
+        self.update()
     def update(self):
         super().update()
         self._calculate_natural_size()
@@ -28,6 +29,7 @@ class QLabel(QWidget):
     def setTextFormat(self, fmt):
         self._text_format = fmt
         self._calculate_natural_size()
+        self.updateGeometry()
     def setOpenExternalLinks(self, open): self._open_external_links = open
     def _calculate_natural_size(self):
         text = self._text
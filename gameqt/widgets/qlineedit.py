@@ -1,5 +1,6 @@
 import pygame
-from ..core import Signal, Qt
+from ..core import Signal, Qt, QTimer
+from ..gui import QFont
 from ..application import QApplication
 from .qwidget import QWidget
 
@@ -19,11 +20,24 @@ class QLineEdit(QWidget):
         self.textChanged = Signal(str)
         self._rect.height = 30 # Default height
         self._placeholder = ""
+        self._caret_visible = True
+        self._blink_timer = QTimer()
+        self._blink_timer.setInterval(500)
+        self._blink_timer.timeout.connect(self._blink_caret)
+        self._focus_policy = Qt.FocusPolicy.StrongFocus
     def setReadOnly(self, b): self._read_only = b
     def isReadOnly(self): return self._read_only
-    def setText(self, text): self._text = text; self.textChanged.emit(text)
+    def setText(self, text): self._text = text; self.updateGeometry(); self.update(); self.textChanged.emit(text)
     def text(self): return self._text
     def setPlaceholderText(self, text): self._placeholder = text
+    def focusInEvent(self, ev):
+        self._caret_visible = True
+        self._blink_timer.start()
+    def focusOutEvent(self, ev):
+        self._blink_timer.stop()
+    def _blink_caret(self):
+        self._caret_visible = not self._caret_visible
+        self.update()
     def _draw(self, pos):
         # 1. Base QSS drawing (Background/Border) handles :focus pseudo-state
         super()._draw(pos)
@@ -55,7 +69,7 @@ class QLineEdit(QWidget):
             text_color = (150, 150, 150)
             is_placeholder = True
             
-        font = pygame.font.SysFont(None, 18)
+        font = QFont.sys_font(None, 18)
         
         # Draw selection
         if self._focused and self._selection_start != -1 and self._selection_end != -1:
@@ -68,12 +82,12 @@ class QLineEdit(QWidget):
         txt = font.render(display_text, True, text_color)
         screen.blit(txt, (pos.x + 5, pos.y + (self._rect.height - txt.get_height())//2))
         
-        if self._focused and not is_placeholder and (pygame.time.get_ticks() // 500) % 2 == 0:
+        if self._focused and not is_placeholder and self._caret_visible:
             cursor_x = pos.x + 5 + font.size(display_text[:self._cursor_index])[0]
             pygame.draw.line(screen, text_color, (cursor_x, pos.y + 5), (cursor_x, pos.y + self._rect.height - 5), 1)
     def mousePressEvent(self, ev):
-        self._focused = True
-        font = pygame.font.SysFont(None, 18)
+        self.setFocus(Qt.FocusReason.MouseFocusReason)
+        font = QFont.sys_font(None, 18)
         local_x = ev.pos().x() - 5
         # Find cursor index based on click
         best_idx = 0
@@ -95,7 +109,7 @@ class QLineEdit(QWidget):
 
     def mouseMoveEvent(self, ev):
         if pygame.mouse.get_pressed()[0] and self._focused:
-            font = pygame.font.SysFont(None, 18)
+            font = QFont.sys_font(None, 18)
             local_x = ev.pos().x() - 5
             best_idx = 0
             min_diff = 1000000
@@ -109,71 +123,75 @@ class QLineEdit(QWidget):
                 self._selection_start = self._cursor_index
             self._cursor_index = best_idx
             self._selection_end = self._cursor_index
-    def _handle_event(self, event, offset):
-        super()._handle_event(event, offset)
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            my_pos = offset + pygame.Vector2(self._rect.topleft)
-            mouse_rect = pygame.Rect(my_pos.x, my_pos.y, self._rect.width, self._rect.height)
-            if not mouse_rect.collidepoint(pygame.mouse.get_pos()):
-                self._focused = False
-        if self._focused and event.type == pygame.KEYDOWN and not self._read_only:
-            mods = pygame.key.get_mods()
-            is_ctrl = mods & (pygame.KMOD_CTRL | pygame.KMOD_META)
-            
-            if event.key == pygame.K_BACKSPACE:
-                if self._selection_start != -1 and self._selection_end != -1:
-                    s1, s2 = min(self._selection_start, self._selection_end), max(self._selection_start, self._selection_end)
-                    self._text = self._text[:s1] + self._text[s2:]
-                    self._cursor_index = s1
-                    self._selection_start = self._selection_end = -1
-                elif self._cursor_index > 0:
-                    self._text = self._text[:self._cursor_index-1] + self._text[self._cursor_index:]
-                    self._cursor_index -= 1
-                self.textChanged.emit(self._text)
-            elif event.key == pygame.K_DELETE:
-                 if self._selection_start != -1 and self._selection_end != -1:
-                    s1, s2 = min(self._selection_start, self._selection_end), max(self._selection_start, self._selection_end)
-                    self._text = self._text[:s1] + self._text[s2:]
-                    self._cursor_index = s1
-                    self._selection_start = self._selection_end = -1
-                 elif self._cursor_index < len(self._text):
-                     self._text = self._text[:self._cursor_index] + self._text[self._cursor_index+1:]
-                 self.textChanged.emit(self._text)
-            elif event.key == pygame.K_LEFT:
-                if self._cursor_index > 0: self._cursor_index -= 1
-                if not (mods & pygame.KMOD_SHIFT): self._selection_start = self._selection_end = -1
-            elif event.key == pygame.K_RIGHT:
-                if self._cursor_index < len(self._text): self._cursor_index += 1
-                if not (mods & pygame.KMOD_SHIFT): self._selection_start = self._selection_end = -1
-            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                self.returnPressed.emit()
-            elif event.key == pygame.K_v and is_ctrl:
-                try:
-                    pasted = QApplication.clipboard().text()
-                    if pasted:
-                         self._text = self._text[:self._cursor_index] + pasted + self._text[self._cursor_index:]
-                         self._cursor_index += len(pasted)
-                         self.textChanged.emit(self._text)
-                except: pass
-            elif event.key == pygame.K_c and is_ctrl:
-                if self._selection_start != -1 and self._selection_end != -1:
-                    s1, s2 = min(self._selection_start, self._selection_end), max(self._selection_start, self._selection_end)
-                    QApplication.clipboard().setText(self._text[s1:s2])
-            elif event.key == pygame.K_a and is_ctrl:
-                self._selection_start = 0
-                self._selection_end = len(self._text)
-                self._cursor_index = len(self._text)
-            elif event.unicode and event.unicode.isprintable():
-                # Replace selection if any
-                if self._selection_start != -1 and self._selection_end != -1:
-                    s1, s2 = min(self._selection_start, self._selection_end), max(self._selection_start, self._selection_end)
-                    self._text = self._text[:s1] + event.unicode + self._text[s2:]
-                    self._cursor_index = s1 + 1
-                    self._selection_start = self._selection_end = -1
-                else:
-                    self._text = self._text[:self._cursor_index] + event.unicode + self._text[self._cursor_index:]
-                    self._cursor_index += 1
-                self.textChanged.emit(self._text)
-        elif self._focused and event.type == pygame.KEYDOWN and self._read_only:
-            if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                self.returnPressed.emit()
+    def _overrides_shortcut(self, ev):
+        return not self._read_only and self._is_text_editing_key(ev)
+
+    def keyPressEvent(self, ev):
+        if self._read_only:
+            if ev.key() in (pygame.K_RETURN, pygame.K_KP_ENTER): self.returnPressed.emit(); ev.accept()
+            else: ev.ignore()
+            return
+        # Keep the caret solid while typing
+        self._caret_visible = True
+        self._blink_timer.start()
+        mods = ev.modifiers()
+        is_ctrl = mods & (pygame.KMOD_CTRL | pygame.KMOD_META)
+        key, text = ev.key(), ev.text()
+        ev.accept()
+        
+        if key == pygame.K_BACKSPACE:
+            if self._selection_start != -1 and self._selection_end != -1:
+                s1, s2 = min(self._selection_start, self._selection_end), max(self._selection_start, self._selection_end)
+                self._text = self._text[:s1] + self._text[s2:]
+                self._cursor_index = s1
+                self._selection_start = self._selection_end = -1
+            elif self._cursor_index > 0:
+                self._text = self._text[:self._cursor_index-1] + self._text[self._cursor_index:]
+                self._cursor_index -= 1
+            self.textChanged.emit(self._text)
+        elif key == pygame.K_DELETE:
+             if self._selection_start != -1 and self._selection_end != -1:
+                s1, s2 = min(self._selection_start, self._selection_end), max(self._selection_start, self._selection_end)
+                self._text = self._text[:s1] + self._text[s2:]
+                self._cursor_index = s1
+                self._selection_start = self._selection_end = -1
+             elif self._cursor_index < len(self._text):
+                 self._text = self._text[:self._cursor_index] + self._text[self._cursor_index+1:]
+             self.textChanged.emit(self._text)
+        elif key == pygame.K_LEFT:
+            if self._cursor_index > 0: self._cursor_index -= 1
+            if not (mods & pygame.KMOD_SHIFT): self._selection_start = self._selection_end = -1
+        elif key == pygame.K_RIGHT:
+            if self._cursor_index < len(self._text): self._cursor_index += 1
+            if not (mods & pygame.KMOD_SHIFT): self._selection_start = self._selection_end = -1
+        elif key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            self.returnPressed.emit()
+        elif key == pygame.K_v and is_ctrl:
+            try:
+                pasted = QApplication.clipboard().text()
+                if pasted:
+                     self._text = self._text[:self._cursor_index] + pasted + self._text[self._cursor_index:]
+                     self._cursor_index += len(pasted)
+                     self.textChanged.emit(self._text)
+            except: pass
+        elif key == pygame.K_c and is_ctrl:
+            if self._selection_start != -1 and self._selection_end != -1:
+                s1, s2 = min(self._selection_start, self._selection_end), max(self._selection_start, self._selection_end)
+                QApplication.clipboard().setText(self._text[s1:s2])
+        elif key == pygame.K_a and is_ctrl:
+            self._selection_start = 0
+            self._selection_end = len(self._text)
+            self._cursor_index = len(self._text)
+        elif text and text.isprintable():
+            # Replace selection if any
+            if self._selection_start != -1 and self._selection_end != -1:
+                s1, s2 = min(self._selection_start, self._selection_end), max(self._selection_start, self._selection_end)
+                self._text = self._text[:s1] + text + self._text[s2:]
+                self._cursor_index = s1 + 1
+                self._selection_start = self._selection_end = -1
+            else:
+                self._text = self._text[:self._cursor_index] + text + self._text[self._cursor_index:]
+                self._cursor_index += 1
+            self.textChanged.emit(self._text)
+        else:
+            ev.ignore()
@@ -27,8 +27,8 @@ class QMainWindow(QWidget):
             from ..menus import QMenuBar
             self.setMenuBar(QMenuBar(self))
         return self._menu_bar
-    def _draw_recursive(self, offset=pygame.Vector2(0,0)):
-        if not self.isVisible(): return
+    def _activate_layouts(self):
+        """Docks the menu bar and status bar and gives the central widget the rest."""
         menu_h = 35 if self._menu_bar and self._menu_bar.isVisible() else 0
         status_h = 25 if self._status_bar and self._status_bar.isVisible() else 0
         
@@ -38,9 +38,11 @@ class QMainWindow(QWidget):
             cw, ch = self._rect.width, self._rect.height - menu_h - status_h
             if self._central_widget._rect.size != (cw, ch):
                 self._central_widget.resize(cw, ch)
-            self._central_widget._rect.x = 0
-            self._central_widget._rect.y = menu_h
-        
+            if self._central_widget._rect.topleft != (0, menu_h): self._central_widget.move(0, menu_h)
+        super()._activate_layouts()
+    def _draw_recursive(self, offset=pygame.Vector2(0,0)):
+        if not self.isVisible(): return
+        if self._draw_backing_store(offset): return
         my_pos = offset + pygame.Vector2(self._rect.topleft)
         self._draw(my_pos)
         
@@ -52,7 +54,7 @@ class QMainWindow(QWidget):
         # Draw menu bar LAST so dropdowns appear on top
         if self._menu_bar: self._menu_bar._draw_recursive(my_pos)
     def _draw(self, pos):
-        screen = self._screen or (self.window()._screen if self.window() else None)
+        screen = self._get_screen()
         if not screen: return
         
         from ..gui import QColor
@@ -1,5 +1,6 @@
 import pygame
 from ..core import PyGameModalDialog
+from ..gui import QFont
 
 class QMessageBox(PyGameModalDialog):
     class StandardButton: 
@@ -57,7 +58,7 @@ class QMessageBox(PyGameModalDialog):
     def draw(self, screen):
         super().draw(screen)
         
-        font = pygame.font.SysFont("Arial", 14)
+        font = QFont.sys_font("Arial", 14)
         
         # Text wrapping
         words = self._text.split(' ')
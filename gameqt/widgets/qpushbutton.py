@@ -10,7 +10,7 @@ class QPushButton(QWidget):
         self._pressed = False
         self.clicked = Signal()
         
-    def setText(self, text): self._text = text; self.update()
+    def setText(self, text): self._text = text; self.updateGeometry(); self.update()
     def text(self): return self._text
     
     def sizeHint(self):
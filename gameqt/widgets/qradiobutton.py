@@ -17,6 +17,7 @@ class QRadioButton(QWidget):
             for child in self._parent._children:
                 if isinstance(child, QRadioButton) and child != self:
                     child.setChecked(False)
+        self.update()
         self.toggled.emit(b)
     def isChecked(self): return self._checked
     def _draw(self, pos):
@@ -1,5 +1,6 @@
 import pygame
 from .qwidget import QWidget
+from ..application import QApplication
 from ..core import QWheelEvent, QPoint
 
 class QScrollArea(QWidget):
@@ -45,20 +46,30 @@ class QScrollArea(QWidget):
         
         return self._scroll_widget._rect.height
     
+    def _fit_scroll_widget(self):
+        """Sizes the content widget to the viewport width and its natural height. Returns
+        True when its size changed."""
+        w = self._scroll_widget
+        size = (self._rect.width - 12, max(self._get_content_height(), self._rect.height))  # Leave space for scrollbar
+        if w._rect.size == size: return False
+        w._rect = pygame.Rect(w._rect.x, w._rect.y, size[0], size[1])
+        return True
+
+    def _activate_layouts(self):
+        if self._scroll_widget: self._fit_scroll_widget()
+        super()._activate_layouts()
+        # Arranging the content can change its natural height; settle it in the same pass
+        if self._scroll_widget and self._fit_scroll_widget(): super()._activate_layouts()
+
     def _draw_recursive(self, offset=pygame.Vector2(0,0)):
         if not self.isVisible(): return
+        if self._draw_backing_store(offset): return
         my_pos = offset + pygame.Vector2(self._rect.topleft)
         self._draw(my_pos)
         
         if self._scroll_widget:
-            # Resize child width to match
-            self._scroll_widget._rect.width = self._rect.width - 12  # Leave space for scrollbar
-            
-            # Calculate and set content height
-            content_h = self._get_content_height()
-            self._scroll_widget._rect.height = max(content_h, self._rect.height)
-            
-            from ..application import QApplication
+            # Sized by the layout pass in _activate_layouts
+            content_h = self._scroll_widget._rect.height
             screen = self._get_screen()
             if not screen: return
             
@@ -115,11 +126,14 @@ class QScrollArea(QWidget):
                         self._dragging_scrollbar = True
                         self._drag_start_y = mouse_pos[1]
                         self._drag_start_scroll_y = self._scroll_y
+                    # Keep receiving motion and the release outside our rect
+                    if QApplication._instance: QApplication._instance._grab_pointer(self)
                 return True
 
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self._dragging_scrollbar:
                 self._dragging_scrollbar = False
+                if QApplication._instance: QApplication._instance._release_pointer(self)
                 return True
 
         elif event.type == pygame.MOUSEMOTION:
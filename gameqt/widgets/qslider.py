@@ -8,7 +8,7 @@ class QSlider(QWidget):
     def setRange(self, mi, ma): self._min, self._max = mi, ma
     def setMinimum(self, v): self._min = v
     def setMaximum(self, v): self._max = v
-    def setValue(self, v): self._val = v; self.valueChanged.emit(v)
+    def setValue(self, v): self._val = v; self.update(); self.valueChanged.emit(v)
     def value(self): return self._val
     def setOrientation(self, o): self._orientation = o
     def setSingleStep(self, s): self._single_step = s
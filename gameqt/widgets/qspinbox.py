@@ -1,5 +1,6 @@
 import pygame
 from ..core import Signal
+from ..gui import QFont
 from .qwidget import QWidget
 
 class QSpinBox(QWidget):
@@ -14,6 +15,7 @@ class QSpinBox(QWidget):
         v = max(self._min, min(self._max, v))
         if self._value != v:
             self._value = v
+            self.update()
             self.valueChanged.emit(v)
     def value(self): return self._value
     def setRange(self, mi, ma): self._min, self._max = mi, ma
@@ -23,7 +25,7 @@ class QSpinBox(QWidget):
         if not screen: return
         pygame.draw.rect(screen, (255, 255, 255), (pos.x, pos.y, self._rect.width - 20, self._rect.height))
         pygame.draw.rect(screen, (180, 180, 180), (pos.x, pos.y, self._rect.width - 20, self._rect.height), 1)
-        font = pygame.font.SysFont(None, 18)
+        font = QFont.sys_font(None, 18)
         txt = font.render(str(self._value), True, (20, 20, 20))
         screen.blit(txt, (pos.x + 5, pos.y + (self._rect.height - txt.get_height())//2))
         
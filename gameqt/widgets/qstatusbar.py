@@ -1,4 +1,5 @@
 import pygame
+from ..core import QTimer
 from .qwidget import QWidget
 from .qlabel import QLabel
 
@@ -8,10 +9,20 @@ class QStatusBar(QWidget):
         self._rect.height = 25
         self._message_label = QLabel("", self)
         self._message_label._rect = pygame.Rect(5, 5, 200, 15)
+        self._message_timer = QTimer()
+        self._message_timer.setSingleShot(True)
+        self._message_timer.timeout.connect(self.clearMessage)
         
     def showMessage(self, text, timeout=0):
         self._message_label.setText(text)
-        # Timeout not implemented in this simple version
+        self._message_label.update()
+        if timeout > 0: self._message_timer.start(timeout)
+        else: self._message_timer.stop()
+    def clearMessage(self):
+        self._message_timer.stop()
+        self._message_label.setText("")
+        self._message_label.update()
+    def currentMessage(self): return self._message_label.text()
         
     def addPermanentWidget(self, widget):
         widget._set_parent(self)
@@ -33,7 +44,7 @@ class QStatusBar(QWidget):
         current_x = 220
         for child in self._children:
             if child == self._message_label: continue
-            child._rect.x = current_x
+            if child._rect.x != current_x: child.move(current_x, child._rect.y)
             current_x += child._rect.width + 5
         
     def _draw(self, pos):
@@ -1,4 +1,5 @@
 import pygame
+from ..gui import QFont
 from .qwidget import QWidget
 
 class QTabWidget(QWidget):
@@ -32,7 +33,7 @@ class QTabWidget(QWidget):
         screen = self._get_screen()
         if not screen: return
         
-        font = pygame.font.SysFont("Arial", 16)
+        font = QFont.sys_font("Arial", 16)
         x_offset = pos.x + 10
         tab_height = 30
         
@@ -62,7 +63,7 @@ class QTabWidget(QWidget):
         tab_h = 30
         if y > tab_h: return
         
-        font = pygame.font.SysFont("Arial", 14)
+        font = QFont.sys_font("Arial", 14)
         curr_x = 10
         for i, tab in enumerate(self._tabs):
             text = font.render(tab['label'], True, (0,0,0))
@@ -79,19 +80,14 @@ class QTabWidget(QWidget):
                 tab['widget'].show()
                 # Resize child to fit content area (below tabs)
                 # The widget itself is positioned at (0, 31) relative to QTabWidget
-                w, h = self._rect.width, self._rect.height - 31
-                tab['widget']._rect = pygame.Rect(0, 31, w, h)
-                
-                # trigger layout if needed - arrange relative to the widget's own origin (0,0)
-                if tab['widget']._layout: 
-                    tab['widget']._layout.arrange(pygame.Rect(0, 0, w, h))
+                # Its layout is arranged by the next layout pass
+                tab['widget']._rect = pygame.Rect(0, 31, self._rect.width, self._rect.height - 31)
             else:
                 tab['widget'].hide()
 
-    def _draw_recursive(self, offset=pygame.Vector2(0,0)):
-        # Ensure correct child sizing before draw
+    def _activate_layouts(self):
+        # Fit the current page to the content area before its layout runs
         if 0 <= self._current_index < len(self._tabs):
             w = self._tabs[self._current_index]['widget']
             w._rect = pygame.Rect(0, 31, self._rect.width, self._rect.height - 31)
-            
-        super()._draw_recursive(offset)
+        super()._activate_layouts()
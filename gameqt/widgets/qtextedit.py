@@ -1,11 +1,10 @@
 import pygame
-from ..core import Signal
+from ..core import Signal, Qt
+from ..gui import QFont
 from .qwidget import QWidget
 
 from html.parser import HTMLParser
 
-_font_cache = {}
-
 class RichTextParser(HTMLParser):
     def __init__(self):
         super().__init__()
@@ -108,6 +107,7 @@ class QTextEdit(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._html = ""; self._plain_text = ""; self._lines = []; self._focused = False; self._read_only = False
+        self._focus_policy = Qt.FocusPolicy.StrongFocus
         self._scroll_y = 0
         self.textChanged = Signal()
         
@@ -153,24 +153,12 @@ class QTextEdit(QWidget):
 
     def _draw(self, pos):
         from ..application import QApplication
-        from ..gui import QColor
         if not QApplication._instance or not QApplication._instance._windows: return
         screen = self._get_screen()
         
-        bg_color_str = self._get_style_property('background-color')
-        bg_color = (255, 255, 255)
-        if bg_color_str:
-            try: bg_color = QColor(bg_color_str).to_pygame()
-            except: pass
-            
-        border_color = (170, 170, 180)
-        border_str = self._get_style_property('border')
-        if border_str:
-            parts = border_str.split()
-            for p in parts:
-                if p.startswith('#') or p in QColor.NAMED_COLORS:
-                    try: border_color = QColor(p).to_pygame()
-                    except: pass
+        bg_color = self._get_style_value('background-color') or (255, 255, 255)
+        border = self._get_style_value('border')
+        border_color = (border and border.color) or (170, 170, 180)
 
         # Clear background for rich text
         pygame.draw.rect(screen, bg_color, (pos.x, pos.y, self._rect.width, self._rect.height))
@@ -193,10 +181,7 @@ class QTextEdit(QWidget):
                         f_size = span.get('size', 14)
                         bold = span.get('bold', False)
                         italic = span.get('italic', False)
-                        f_key = ("Arial", f_size, bold, italic)
-                        if f_key not in _font_cache:
-                            _font_cache[f_key] = pygame.font.SysFont("Arial", f_size, bold=bold, italic=italic)
-                        font = _font_cache[f_key]
+                        font = QFont.sys_font("Arial", f_size, bold=bold, italic=italic)
                         span['surf'] = font.render(span['text'], True, span.get('color', (0,0,0)))
                     
                     txt = span['surf']
@@ -216,28 +201,33 @@ class QTextEdit(QWidget):
         max_scroll = max(0, content_h - self._rect.height + 20)
         self._scroll_y = max(0, min(max_scroll, self._scroll_y - (delta / 120.0) * 40))
         ev.accept()
-    def mousePressEvent(self, ev): self._focused = True
-    def _handle_event(self, event, offset):
-        if super()._handle_event(event, offset): return True
-        if self._focused and not self._read_only and event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_BACKSPACE:
-                if self._plain_text:
-                    self._plain_text = self._plain_text[:-1]
-                    self._lines = self._plain_text.split('\n'); self.textChanged.emit()
-                    self._doc_lines = [[{'text': line, 'bold': False, 'italic': False, 'color': (0,0,0), 'size': 14}] for line in self._lines]
-            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                self._plain_text += '\n'; self._lines = self._plain_text.split('\n'); self.textChanged.emit()
-                self._doc_lines = [[{'text': line, 'bold': False, 'italic': False, 'color': (0,0,0), 'size': 14}] for line in self._lines]
-            elif event.key == pygame.K_v and (event.mod & (pygame.KMOD_CTRL | pygame.KMOD_META)):
-                # Paste from clipboard if possible
-                try:
-                    from ..application import QApplication
-                    pasted = QApplication.clipboard().text()
-                    if pasted:
-                        self._plain_text += pasted; self._lines = self._plain_text.split('\n'); self.textChanged.emit()
-                        self._doc_lines = None # Force re-calculation in _draw
-                except: pass
-            elif event.unicode and event.unicode.isprintable():
-                self._plain_text += event.unicode; self._lines = self._plain_text.split('\n'); self.textChanged.emit()
+    def mousePressEvent(self, ev): self.setFocus(Qt.FocusReason.MouseFocusReason)
+    def _overrides_shortcut(self, ev):
+        return not self._read_only and self._is_text_editing_key(ev)
+
+    def keyPressEvent(self, ev):
+        if self._read_only: ev.ignore(); return
+        key, text = ev.key(), ev.text()
+        if key == pygame.K_BACKSPACE:
+            if self._plain_text:
+                self._plain_text = self._plain_text[:-1]
+                self._lines = self._plain_text.split('\n'); self.textChanged.emit()
                 self._doc_lines = [[{'text': line, 'bold': False, 'italic': False, 'color': (0,0,0), 'size': 14}] for line in self._lines]
-        return False
+        elif key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            self._plain_text += '\n'; self._lines = self._plain_text.split('\n'); self.textChanged.emit()
+            self._doc_lines = [[{'text': line, 'bold': False, 'italic': False, 'color': (0,0,0), 'size': 14}] for line in self._lines]
+        elif key == pygame.K_v and (ev.modifiers() & (pygame.KMOD_CTRL | pygame.KMOD_META)):
+            # Paste from clipboard if possible
+            try:
+                from ..application import QApplication
+                pasted = QApplication.clipboard().text()
+                if pasted:
+                    self._plain_text += pasted; self._lines = self._plain_text.split('\n'); self.textChanged.emit()
+                    self._doc_lines = None # Force re-calculation in _draw
+            except: pass
+        elif text and text.isprintable():
+            self._plain_text += text; self._lines = self._plain_text.split('\n'); self.textChanged.emit()
+            self._doc_lines = [[{'text': line, 'bold': False, 'italic': False, 'color': (0,0,0), 'size': 14}] for line in self._lines]
+        else:
+            ev.ignore(); return
+        ev.accept()
@@ -1,5 +1,4 @@
 import pygame
-from ..application import QApplication
 from .qwidget import QWidget
 from .qpushbutton import QPushButton
 
@@ -14,6 +13,6 @@ class QToolBar(QWidget):
         # Layout? For now manual
         btn._rect = pygame.Rect(len(self._children)*85 - 80, 5, 80, 30)
     def _draw(self, pos):
-        screen = QApplication.instance()._windows[0]._screen
+        screen = self._get_screen()
         pygame.draw.rect(screen, (210, 210, 215), (pos.x, pos.y, self._rect.width, self._rect.height))
         pygame.draw.line(screen, (160, 160, 170), (pos.x, pos.y + self._rect.height - 1), (pos.x + self._rect.width, pos.y + self._rect.height - 1))
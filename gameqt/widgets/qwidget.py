@@ -4,6 +4,25 @@ import sys
 from ..core import QObject, Signal, QMouseEvent, QWheelEvent, QPoint, QSize, Qt, PyGameModalDialog
 from ..application import QApplication
 
+_INHERITABLE = frozenset(('font-size', 'font-family', 'font-weight', 'color', 'text-align'))
+# Keys a text-entry widget keeps from shortcuts: unmodified editing keys, and Ctrl/Meta+A/C/V/X/Y/Z
+_EDITING_KEYS = frozenset((pygame.K_BACKSPACE, pygame.K_DELETE, pygame.K_LEFT, pygame.K_RIGHT,
+                           pygame.K_UP, pygame.K_DOWN, pygame.K_HOME, pygame.K_END))
+_EDITING_CTRL_KEYS = frozenset((pygame.K_a, pygame.K_c, pygame.K_v, pygame.K_x, pygame.K_y, pygame.K_z))
+_class_names_cache = {}
+_class_name_sets = {}
+
+def _class_names(cls):
+    """Class names along cls's MRO, most derived first; the type selectors it matches."""
+    names = _class_names_cache.get(cls)
+    if names is None: names = _class_names_cache[cls] = tuple(c.__name__ for c in cls.__mro__ if c is not object)
+    return names
+
+def _class_name_set(cls):
+    names = _class_name_sets.get(cls)
+    if names is None: names = _class_name_sets[cls] = frozenset(_class_names(cls))
+    return names
+
 class QWidget(QObject):
     def __init__(self, parent=None):
         from ..gui import QFont
@@ -17,11 +36,79 @@ class QWidget(QObject):
         self._frame_shape = 0  # Qt.FrameShape.NoFrame
         self._window_flags = 0  # No flags by default
         self._cursor = None
+        self._focus_policy = Qt.FocusPolicy.NoFocus
+        self._focused = False # Mirrors QApplication.focusWidget() for drawing and QSS :focus
+        self._backing_store_enabled = False
+        self._backing_store = None
+        self._backing_store_dirty = True
+        self._painting_backing_store = False
+        self._layout_dirty = True
+        self._style, self._style_generation = None, -1
+        self._request_repaint()
+    @property
+    def _rect(self): return self._geom_rect
+    @_rect.setter
+    def _rect(self, r):
+        old = self.__dict__.get('_geom_rect')
+        self._geom_rect = r
+        if old != r:
+            if old is None or old.size != r.size: self._layout_dirty = True
+            self._geometry_changed()
+    def _geometry_changed(self):
+        """Invalidates the pointer hit-test index after a geometry, visibility or parent change."""
+        if QApplication._instance: QApplication._instance._hit_generation += 1
+        self._invalidate_backing_stores()
     def update(self):
+        self._request_repaint()
         for child in self._children: 
             if hasattr(child, 'update'): child.update()
+    def updateGeometry(self):
+        """Notifies the parent's layout that this widget's size hint or visibility changed."""
+        self._invalidate_layout()
+        if self._parent is not None and hasattr(self._parent, '_invalidate_layout'): self._parent._invalidate_layout()
+    def _invalidate_layout(self):
+        """Schedules this widget's layout for the layout pass that runs before the next paint."""
+        self._layout_dirty = True
+        self._request_repaint()
+    def _layout_rect(self): return pygame.Rect(0, 0, self._rect.width, self._rect.height)
+    def _activate_layouts(self):
+        """Arranges invalidated layouts top-down, so children are visited after their parent
+        has assigned their geometry. Runs once per frame before painting."""
+        if self._layout_dirty:
+            self._layout_dirty = False
+            if self._layout and hasattr(self._layout, 'arrange'): self._layout.arrange(self._layout_rect())
+        for child in self._children:
+            if hasattr(child, '_activate_layouts') and child.isVisible(): child._activate_layouts()
+    def _request_repaint(self):
+        """Marks this widget dirty so the event loop repaints in RepaintMode.OnDemand."""
+        self._dirty = True
+        self._invalidate_backing_stores()
+        if QApplication._instance: QApplication._instance._mark_dirty(self)
+    def setBackingStoreEnabled(self, enabled):
+        """Renders this widget and its children into an offscreen surface that is blitted each
+        frame and only redrawn after update(), a style or geometry change, or input."""
+        self._backing_store_enabled = enabled
+        self._backing_store = None
+        self._backing_store_dirty = True
+        self._request_repaint()
+    def isBackingStoreEnabled(self): return self._backing_store_enabled
+    def _invalidate_backing_stores(self):
+        # Any cached ancestor's surface contains this widget
+        w = self
+        while w is not None:
+            if getattr(w, '_backing_store_enabled', False): w._backing_store_dirty = True
+            w = w._parent
     def setAcceptDrops(self, b): self._accept_drops = b
     def acceptDrops(self): return self._accept_drops
+    def setMouseMoveCompression(self, enabled):
+        """When disabled, this widget receives every MOUSEMOTION sample instead of one per frame."""
+        app = QApplication._instance
+        if not app: return
+        if enabled: app._raw_motion_widgets.discard(self)
+        else: app._raw_motion_widgets.add(self)
+    def mouseMoveCompression(self):
+        app = QApplication._instance
+        return not (app and self in app._raw_motion_widgets)
     def dragEnterEvent(self, event): 
         # Default implementation: accept nothing
         pass
@@ -36,6 +123,46 @@ class QWidget(QObject):
         pass
     def wheelEvent(self, event):
         pass
+    def keyPressEvent(self, event):
+        event.ignore()
+    def keyReleaseEvent(self, event):
+        event.ignore()
+    def _overrides_shortcut(self, event):
+        """Qt's ShortcutOverride: True if this focus widget takes event as a key press even
+        though it matches a shortcut. Offered before the keymap is consulted."""
+        return False
+    @staticmethod
+    def _is_text_editing_key(event):
+        """Typing and editing keys that text-entry widgets claim over shortcuts."""
+        mods = event.modifiers()
+        if not mods & (pygame.KMOD_CTRL | pygame.KMOD_ALT | pygame.KMOD_META):
+            return event.key() in _EDITING_KEYS or bool(event.text() and event.text().isprintable())
+        return not mods & pygame.KMOD_ALT and event.key() in _EDITING_CTRL_KEYS
+    def focusInEvent(self, event):
+        pass
+    def focusOutEvent(self, event):
+        pass
+    def setFocusPolicy(self, policy): self._focus_policy = policy
+    def focusPolicy(self): return self._focus_policy
+    def setFocus(self, reason=Qt.FocusReason.OtherFocusReason):
+        if QApplication._instance: QApplication._instance._set_focus_widget(self, reason)
+    def clearFocus(self):
+        if self.hasFocus(): QApplication._instance._set_focus_widget(None, Qt.FocusReason.OtherFocusReason)
+    def hasFocus(self): return bool(QApplication._instance) and QApplication._instance._focus_widget is self
+    def focusNextChild(self): return self.focusNextPrevChild(True)
+    def focusPreviousChild(self): return self.focusNextPrevChild(False)
+    def focusNextPrevChild(self, next):
+        if not QApplication._instance: return False
+        return QApplication._instance._move_focus(self.window(), next)
+    @staticmethod
+    def setTabOrder(first, second):
+        """Makes Tab move focus from first to second."""
+        first._tab_next = second
+    def isAncestorOf(self, child):
+        while child is not None:
+            if child is self: return True
+            child = child._parent
+        return False
     def setWindowTitle(self, title):
         self._window_title = title
         from .qmainwindow import QMainWindow
@@ -43,7 +170,11 @@ class QWidget(QObject):
     def resize(self, w, h): 
         self._rect.width, self._rect.height = w, h
         self._resized = True
-        if hasattr(self, '_layout') and self._layout: self._layout.arrange(pygame.Rect(0, 0, w, h))
+        self._geometry_changed()
+        self._request_repaint()
+        if self._layout:
+            self._layout.arrange(self._layout_rect())
+            self._layout_dirty = False
     def setGeometry(self, *args):
         if len(args) == 1:
             r = args[0]
@@ -58,11 +189,17 @@ class QWidget(QObject):
             x, y, w, h = args
         self._rect = pygame.Rect(x, y, w, h)
         self._resized = True
-        if hasattr(self, '_layout') and self._layout: self._layout.arrange(pygame.Rect(0, 0, self._rect.width, self._rect.height))
+        self._request_repaint()
+        if self._layout:
+            self._layout.arrange(self._layout_rect())
+            self._layout_dirty = False
     def rect(self): 
         from ..core import QRect
         return QRect(0, 0, self._rect.width, self._rect.height)
-    def move(self, x, y): self._rect.x, self._rect.y = x, y
+    def move(self, x, y): 
+        self._rect.x, self._rect.y = x, y
+        self._geometry_changed()
+        self._request_repaint()
     def setMinimumSize(self, w, h): self._min_size = (w, h)
     def minimumSize(self): return getattr(self, '_min_size', (0, 0))
     def setFrameShape(self, shape): 
@@ -75,6 +212,7 @@ class QWidget(QObject):
     def setFont(self, font):
         """Set the font for this widget."""
         self._font = font
+        self._font_explicit = True
         if hasattr(self, 'update'): self.update()
     def font(self):
         """Returns the font for this widget, respecting QSS properties."""
@@ -82,27 +220,14 @@ class QWidget(QObject):
             from ..gui import QFont
             self._font = QFont()
         
-        # Check for QSS overrides
-        fs = self._get_style_property('font-size')
-        if fs:
-            try:
-                # Handle '12px', '12pt', or just '12'
-                size = int(re.search(r'\d+', fs).group())
-                self._font.setPointSize(size)
-            except: pass
-            
-        ff = self._get_style_property('font-family')
-        if ff:
-            # Strip quotes if present
-            ff = ff.strip("'\"")
-            self._font._family = ff
-            
-        fw = self._get_style_property('font-weight')
-        if fw:
-            bold = 'bold' in fw.lower() or any(x in fw for x in ['600','700','800','900'])
-            if hasattr(self._font, 'setBold'): self._font.setBold(bold)
-            elif hasattr(self._font, '_bold'): self._font._bold = bold # Fallback if setBold missing
-            
+        # QSS font properties apply unless a font was set explicitly with setFont()
+        if getattr(self, '_font_explicit', False): return self._font
+        size = self._get_style_value('font-size')
+        if size: self._font.setPointSize(size)
+        family = self._get_style_value('font-family')
+        if family: self._font._family = family
+        bold = self._get_style_value('font-weight')
+        if bold is not None: self._font.setBold(bold)
         return self._font
     def setWindowFlags(self, flags):
         """Set window flags (Dialog, FramelessWindowHint, etc.)."""
@@ -120,6 +245,8 @@ class QWidget(QObject):
         return curr
     def _get_screen(self):
         if not QApplication._instance: return None
+        # Drawing into a backing store redirects every widget in the subtree
+        if QApplication._instance._paint_targets: return QApplication._instance._paint_targets[-1]
         win = self.window()
         screen = getattr(win, '_screen', None)
         if not screen and QApplication._instance._windows: screen = getattr(QApplication._instance._windows[0], '_screen', None)
@@ -152,160 +279,164 @@ class QWidget(QObject):
         self._stylesheet = ss
         self._parsed_styles = QSSParser.parse(ss)
         
-        # Invalidate style cache recursively for this subtree
-        self._reset_style_cache()
+        # Styles of this subtree are re-derived lazily
+        QApplication._invalidate_styles()
 
         # Notify of style change for dynamic updates (fonts, etc.)
         if hasattr(self, '_calculate_natural_size'):
             self._calculate_natural_size()
+        self.updateGeometry()
         self.update()
 
-    def _reset_style_cache(self):
-        if hasattr(self, '_style_cache'): self._style_cache.clear()
-        for child in self._children:
-            if hasattr(child, '_reset_style_cache'):
-                child._reset_style_cache()
+    def _computed_style(self):
+        """The shared ComputedStyle for this widget's style context, re-derived from the
+        parent's when the style generation moved."""
+        if self._style_generation == QApplication._style_generation: return self._style
+        from ..utils import ComputedStyle
+        parent_key = self._parent._computed_style().key if hasattr(self._parent, '_computed_style') else None
+        local = getattr(self, '_parsed_styles', None)
+        local_key = (local.serial, tuple(getattr(self, '_active_pseudos', ()))) if local else None
+        key = (type(self), local_key, parent_key)
+        table = QApplication._computed_styles
+        style = table.get(key)
+        if style is None:
+            if len(table) >= QApplication.MAX_COMPUTED_STYLES: table.clear()
+            style = table[key] = ComputedStyle(key)
+        self._style, self._style_generation = style, QApplication._style_generation
+        return style
 
     def _get_style_property(self, prop, pseudo=None, sub_element=None):
-        """Resolves a style property checking local, parent, and global stylesheets. Cached."""
-        if not hasattr(self, '_style_cache'): self._style_cache = {}
+        """Resolves a style property checking local, parent, and global stylesheets. Cached in
+        the computed style shared by widgets with the same style context."""
+        values = self._computed_style()._values
         cache_key = (prop, pseudo, sub_element)
-        if cache_key in self._style_cache:
-            return self._style_cache[cache_key]
+        if cache_key in values: return values[cache_key]
+        res = values[cache_key] = self._resolve_style_property(prop, pseudo, sub_element)
+        return res
 
-        inheritable = ['font-size', 'font-family', 'font-weight', 'color', 'text-align']
-        
-        mro_names = [cls.__name__ for cls in self.__class__.mro() if cls.__name__ != 'object']
-        parent_chain = []
+    def _get_style_value(self, prop, pseudo=None, sub_element=None):
+        """Typed form of _get_style_property (see QSSParser.typed_value), converted once per
+        computed style so draw code does no string parsing."""
+        values = self._computed_style()._values
+        cache_key = (prop, pseudo, sub_element, True)
+        if cache_key in values: return values[cache_key]
+        from ..utils import QSSParser
+        res = values[cache_key] = QSSParser.typed_value(prop, self._get_style_property(prop, pseudo, sub_element))
+        return res
+
+    def _resolve_style_property(self, prop, pseudo, sub_element):
+        type_names = _class_names(type(self))
+        ancestors = []  # Class-name sets of the parents, nearest first
         curr = self._parent
         while curr:
-            parent_chain.insert(0, [cls.__name__ for cls in curr.__class__.mro() if cls.__name__ != 'object'])
+            ancestors.append(_class_name_set(type(curr)))
             curr = curr._parent
 
-        def find_in_stylesheet(styles, cls_mro, p_chain):
-            """Helper to find best matching style for this widget in a given parsed QSS dict."""
-            best_val = None
-            best_spec = -1
-            for cls_name in cls_mro:
-                for sel in styles:
-                    parts = sel.split()
-                    last_part = parts[-1]
-                    
-                    # Parsing sel last_part
-                    s_pseudo = None
-                    rem = last_part
-                    if ':' in rem:
-                        idx = rem.rfind(':')
-                        if idx > 0 and rem[idx-1] != ':' and (idx == len(rem)-1 or rem[idx+1] != ':'):
-                             s_pseudo = rem[idx+1:]
-                             rem = rem[:idx]
-                    s_sub = rem.split('::')[1] if '::' in rem else None
-                    s_cls = rem.split('::')[0] if '::' in rem else rem
-                    
-                    if s_cls in (cls_name, "*") and s_sub == sub_element and s_pseudo == pseudo:
-                        if len(parts) > 1:
-                            # Descendant
-                            match = True
-                            curr_p_idx = len(p_chain) - 1
-                            for anc_sel in reversed(parts[:-1]):
-                                found = False
-                                while curr_p_idx >= 0:
-                                    if anc_sel in p_chain[curr_p_idx]:
-                                        found = True; curr_p_idx -= 1; break
-                                    curr_p_idx -= 1
-                                if not found: match = False; break
-                            if match and prop in styles[sel]:
-                                if len(parts) > best_spec:
-                                    best_val = styles[sel][prop]; best_spec = len(parts)
-                        else:
-                            if prop in styles[sel] and best_spec <= 1:
-                                best_val = styles[sel][prop]; best_spec = 1
-            return best_val
-
         # 1. Local overrides (Directly set on this instance via setStyleSheet)
         if hasattr(self, '_parsed_styles') and self._parsed_styles:
             # Check for flat properties first (selector "*")
             if "*" in self._parsed_styles and prop in self._parsed_styles["*"]:
                 if not sub_element and (not pseudo or pseudo in getattr(self, '_active_pseudos', [])):
                     res = self._parsed_styles["*"][prop]
-                    self._style_cache[cache_key] = res
                     return res
             # Check for selector matches in local stylesheet
-            res = find_in_stylesheet(self._parsed_styles, mro_names, parent_chain)
+            res = self._parsed_styles.lookup(prop, type_names, ancestors, pseudo, sub_element)
             if res:
-                self._style_cache[cache_key] = res
                 return res
 
         # 2. Walk up parent hierarchy for local/regional stylesheets and inheritable properties
         curr = self._parent
-        curr_p_chain = list(parent_chain)
         while curr:
             if hasattr(curr, '_parsed_styles') and curr._parsed_styles:
                 # A. Check for selector matches in parent's stylesheet for THIS widget
-                # When checking parent styles, parent_chain for THIS widget vs parent is same
-                res = find_in_stylesheet(curr._parsed_styles, mro_names, curr_p_chain[:len(curr_p_chain)-1])
+                res = curr._parsed_styles.lookup(prop, type_names, ancestors, pseudo, sub_element)
                 if res:
-                    self._style_cache[cache_key] = res
                     return res
                 
                 # B. Inheritable flat properties from parent
-                if prop in inheritable and "*" in curr._parsed_styles and prop in curr._parsed_styles["*"]:
+                if prop in _INHERITABLE and "*" in curr._parsed_styles and prop in curr._parsed_styles["*"]:
                     res = curr._parsed_styles["*"][prop]
-                    self._style_cache[cache_key] = res
                     return res
             curr = curr._parent
-            if curr_p_chain: curr_p_chain.pop()
 
         # 3. Global stylesheet resolution (Application-wide)
         app_style = QApplication._global_style
         if app_style:
-            res = find_in_stylesheet(app_style, mro_names, parent_chain)
+            res = app_style.lookup(prop, type_names, ancestors, pseudo, sub_element)
             if res:
-                self._style_cache[cache_key] = res
                 return res
 
         # 4. Fallback: Inherit from parent global style for inheritable properties
-        if prop in inheritable and self._parent:
+        if prop in _INHERITABLE and self._parent:
             res = self._parent._get_style_property(prop, pseudo, sub_element)
-            self._style_cache[cache_key] = res
             return res
 
-        self._style_cache[cache_key] = None
         return None
     def show(self):
         self._visible = True
+        self._geometry_changed()
+        self.updateGeometry()
+        self._request_repaint()
         if not self._parent and not self._screen:
             self._screen = pygame.display.set_mode((self._rect.width, self._rect.height), pygame.RESIZABLE)
+        if not self._parent and QApplication._instance: QApplication._instance._active_window = self
         for child in self._children:
             from ..menus import QMenu
             if hasattr(child, 'show') and not isinstance(child, QMenu): child.show()
     def hide(self):
         self._visible = False
+        self._geometry_changed()
+        self.updateGeometry()
+        app = QApplication._instance
+        if app and app._focus_widget is not None and self.isAncestorOf(app._focus_widget):
+            app._set_focus_widget(None, Qt.FocusReason.OtherFocusReason)
+        self._request_repaint()
         for child in self._children:
             if hasattr(child, 'hide'): child.hide()
     def setVisible(self, v): (self.show() if v else self.hide())
     def isVisible(self): return self._visible
+    def raise_(self):
+        """Moves this widget to the top of its siblings; a window is also activated."""
+        app = QApplication._instance
+        siblings = self._parent._children if self._parent else (app._windows if app else [])
+        if self in siblings:
+            siblings.remove(self)
+            siblings.append(self)
+            self._geometry_changed()
+            self._request_repaint()
+        if not self._parent: self.activateWindow()
+    def activateWindow(self):
+        if QApplication._instance: QApplication._instance._active_window = self.window()
+    def isActiveWindow(self): return QApplication.activeWindow() is self.window()
     def close(self): self.hide()
-    def setLayout(self, layout): self._layout = layout; layout._parent = self
+    def setLayout(self, layout): self._layout = layout; layout._parent = self; self._invalidate_layout()
     def setParent(self, parent): self._set_parent(parent)
     def _set_parent(self, parent):
-        if self._parent and self in self._parent._children: self._parent._children.remove(self)
+        if self._parent and self in self._parent._children:
+            self._parent._children.remove(self)
+            if hasattr(self._parent, '_invalidate_layout'): self._parent._invalidate_layout()
         if not parent and QApplication._instance and self not in QApplication._instance._windows: 
             QApplication._instance._windows.append(self)
         elif parent and QApplication._instance and self in QApplication._instance._windows:
             QApplication._instance._windows.remove(self)
+        if parent is not self._parent: QApplication._invalidate_styles()
         self._parent = parent
         if parent and hasattr(parent, '_children'):
             if self not in parent._children:
                 parent._children.append(self)
+                if hasattr(parent, '_invalidate_layout'): parent._invalidate_layout()
+        self._geometry_changed()
     def _handle_event(self, event, offset):
         if not self.isVisible(): return False
         my_pos = offset + pygame.Vector2(self._rect.topleft)
+        # Use the sample position carried by the event; coalesced or replayed
+        # motion events may differ from the live cursor position
+        mouse_pos = getattr(event, 'pos', None) or pygame.mouse.get_pos()
         
         # Apply cursor if mouse is over this widget
         if event.type == pygame.MOUSEMOTION and hasattr(self, '_cursor') and self._cursor:
             mouse_rect = pygame.Rect(my_pos.x, my_pos.y, self._rect.width, self._rect.height)
-            if mouse_rect.collidepoint(pygame.mouse.get_pos()):
+            if mouse_rect.collidepoint(mouse_pos):
                 try: 
                     pygame.mouse.set_cursor(self._cursor)
                 except: 
@@ -315,7 +446,7 @@ class QWidget(QObject):
         if hasattr(self, '_menu_bar') and self._menu_bar:
             if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
                 menu_bar_rect = pygame.Rect(my_pos.x, my_pos.y, self._menu_bar._rect.width, self._menu_bar._rect.height)
-                if menu_bar_rect.collidepoint(pygame.mouse.get_pos()) or (hasattr(self._menu_bar, '_active_menu') and self._menu_bar._active_menu):
+                if menu_bar_rect.collidepoint(mouse_pos) or (hasattr(self._menu_bar, '_active_menu') and self._menu_bar._active_menu):
                     return self._menu_bar._handle_event(event, my_pos)
 
         # 1. Deliver to children first (highest z-order)
@@ -324,10 +455,14 @@ class QWidget(QObject):
                 return True
         
         # 2. Handle events for THIS widget
+        return self._handle_own_event(event, my_pos, mouse_pos)
+
+    def _handle_own_event(self, event, my_pos, mouse_pos):
+        """Handles an event for this widget alone, without visiting children."""
         if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
             mouse_rect = pygame.Rect(my_pos.x, my_pos.y, self._rect.width, self._rect.height)
-            if mouse_rect.collidepoint(pygame.mouse.get_pos()):
-                local_pos = pygame.Vector2(pygame.mouse.get_pos()) - my_pos
+            if mouse_rect.collidepoint(mouse_pos):
+                local_pos = pygame.Vector2(mouse_pos) - my_pos
                 btn = getattr(event, 'button', Qt.MouseButton.NoButton)
                 if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
                     if btn == 1: btn = Qt.MouseButton.LeftButton
@@ -358,8 +493,8 @@ class QWidget(QObject):
         
         if event.type == pygame.MOUSEWHEEL:
             mouse_rect = pygame.Rect(my_pos.x, my_pos.y, self._rect.width, self._rect.height)
-            if mouse_rect.collidepoint(pygame.mouse.get_pos()):
-                local_pos = pygame.Vector2(pygame.mouse.get_pos()) - my_pos
+            if mouse_rect.collidepoint(mouse_pos):
+                local_pos = pygame.Vector2(mouse_pos) - my_pos
                 px = getattr(event, 'precise_x', float(event.x))
                 py = getattr(event, 'precise_y', float(event.y))
                 w_event = QWheelEvent(local_pos, QPoint(int(px * 120), int(py * 120)), pygame.key.get_mods())
@@ -367,25 +502,10 @@ class QWidget(QObject):
                 if hasattr(self, 'wheelEvent'): self.wheelEvent(w_event)
                 return w_event.isAccepted()
         
-        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
-            # Try to dispatch key events if we have a handler. 
-            # In a real GUI, this goes to the focused widget. Here we just pass it to self if focused.
-            # But QGraphicsView handles it. We can just dispatch it if we have focus or if we are a view.
-            if getattr(self, '_focused', False) or self.__class__.__name__ == 'QGraphicsView' or self.__class__.__name__ == 'EditorCanvas':
-                from ..core import QKeyEvent
-                mods = getattr(event, 'mod', pygame.key.get_mods())
-                k_event = QKeyEvent(event.key, mods, getattr(event, 'unicode', ''))
-                k_event.ignore()
-                if event.type == pygame.KEYDOWN and hasattr(self, 'keyPressEvent'):
-                    self.keyPressEvent(k_event)
-                elif event.type == pygame.KEYUP and hasattr(self, 'keyReleaseEvent'):
-                    self.keyReleaseEvent(k_event)
-                if k_event.isAccepted(): return True
-        
         # Legacy scroll
         if event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5):
              mouse_rect = pygame.Rect(my_pos.x, my_pos.y, self._rect.width, self._rect.height)
-             if mouse_rect.collidepoint(pygame.mouse.get_pos()):
+             if mouse_rect.collidepoint(mouse_pos):
                 # We reuse mousePressEvent for legacy scroll handling in QScrollArea
                 # But we should actually trigger wheelEvent or accepted mousePress
                 return False # Let it bubble or be handled by specific logic
@@ -416,11 +536,34 @@ class QWidget(QObject):
                 return event.isAccepted()
         return False
 
+    def _draw_backing_store(self, offset):
+        """Blits the cached subtree, repainting it first if invalidated. Returns False when
+        this widget is not cached or is being painted into its own surface."""
+        if not self._backing_store_enabled or self._painting_backing_store: return False
+        app = QApplication._instance
+        if not app: return False
+        screen = self._get_screen()
+        if not screen: return True
+        size = self._rect.size
+        if self._backing_store is None or self._backing_store.get_size() != size:
+            self._backing_store = pygame.Surface((max(1, size[0]), max(1, size[1])), pygame.SRCALPHA)
+            self._backing_store_dirty = True
+        if self._backing_store_dirty:
+            self._backing_store.fill((0, 0, 0, 0))
+            # Paint with this widget at the surface origin
+            app._paint_targets.append(self._backing_store)
+            self._painting_backing_store = True
+            try: self._draw_recursive(-pygame.Vector2(self._rect.topleft))
+            finally:
+                self._painting_backing_store = False
+                app._paint_targets.pop()
+            self._backing_store_dirty = False
+        screen.blit(self._backing_store, offset + pygame.Vector2(self._rect.topleft))
+        return True
+
     def _draw_recursive(self, offset=pygame.Vector2(0,0)):
         if not self.isVisible(): return
-        if self._layout and hasattr(self._layout, 'arrange'): 
-            # Layout arranges items relative to this widget's origin (0,0)
-            self._layout.arrange(pygame.Rect(0, 0, self._rect.width, self._rect.height))
+        if self._draw_backing_store(offset): return
         my_pos = offset + pygame.Vector2(self._rect.topleft)
         self._draw(my_pos)
         for child in self._children: child._draw_recursive(my_pos)
@@ -428,8 +571,6 @@ class QWidget(QObject):
         screen = self._get_screen()
         if not screen: return
         
-        from ..gui import QColor
-        
         # Determine pseudo-state
         abs_pos = self.mapToGlobal(QPoint(0,0))
         abs_rect = pygame.Rect(abs_pos.x(), abs_pos.y(), self._rect.width, self._rect.height)
@@ -441,64 +582,29 @@ class QWidget(QObject):
         elif getattr(self, '_focused', False): pseudo = "focus"
         
         # Resolve Styles from QSS (global or local)
-        bg_color_str = self._get_style_property('background-color', pseudo)
-        border_radius_str = self._get_style_property('border-radius', pseudo)
-        border_str = self._get_style_property('border', pseudo)
+        final_bg = self._get_style_value('background-color', pseudo)
+        radius = self._get_style_value('border-radius', pseudo) or 0
+        border = self._get_style_value('border', pseudo)
         
         rect = pygame.Rect(pos.x, pos.y, self._rect.width, self._rect.height)
         
         # 1. Background
-        radius = 0
-        if border_radius_str:
-            try: radius = int(border_radius_str.replace('px', '').strip())
-            except: pass
-            
-        final_bg = None
-        if bg_color_str:
-            try: final_bg = QColor(bg_color_str).to_pygame()
-            except: pass
-        
         if final_bg:
-            pygame.draw.rect(screen, final_bg, rect, border_radius=radius)
+            # Fully transparent backgrounds (QLabel's default) paint nothing
+            if final_bg[3] > 0: pygame.draw.rect(screen, final_bg, rect, border_radius=radius)
         elif self.__class__.__name__ == 'QMainWindow':
             # Default QMainWindow bg handled in subclass or here
             pygame.draw.rect(screen, (230, 230, 235), rect)
             
         # 2. Border
-        if border_str:
-            border_color = (120, 120, 130)
-            border_width = 1
-            if 'solid' in border_str:
-                parts = border_str.split()
-                for p in parts:
-                    if p.endswith('px'): 
-                        try: border_width = int(p.replace('px', ''))
-                        except: pass
-                    elif p.startswith('#') or p in QColor.NAMED_COLORS:
-                        try: border_color = QColor(p).to_pygame()
-                        except: pass
-            pygame.draw.rect(screen, border_color, rect, border_width, border_radius=radius)
-            
-        # 2. Border
-        if border_str:
-            border_color = (120, 120, 130)
-            border_width = 1
-            if 'solid' in border_str:
-                parts = border_str.split()
-                for p in parts:
-                    if p.endswith('px'): 
-                        try: border_width = int(p.replace('px', ''))
-                        except: pass
-                    elif p.startswith('#') or p in QColor.NAMED_COLORS:
-                        try: border_color = QColor(p).to_pygame()
-                        except: pass
-            pygame.draw.rect(screen, border_color, rect, border_width, border_radius=radius)
+        if border and border.width > 0:
+            pygame.draw.rect(screen, border.color or (120, 120, 130), rect, border.width, border_radius=radius)
         # Removed hardcoded border fallback for legacy widgets to allow clean themes
 
         # 3. Frame Layout (Legacy frameShape support)
         from ..core import Qt
         frame_shape = getattr(self, '_frame_shape', 0)
-        if frame_shape != Qt.FrameShape.NoFrame and frame_shape != 0 and not border_str:
+        if frame_shape != Qt.FrameShape.NoFrame and frame_shape != 0 and not border:
             if frame_shape == Qt.FrameShape.Box:
                 pygame.draw.rect(screen, (100, 100, 100), rect, 1)
             elif frame_shape == Qt.FrameShape.Panel:
@@ -22,6 +22,8 @@ class DrawingBoard(QGraphicsView):
         
         self.drawing = False
         self.last_pos = None
+        # Strokes need every motion sample, not one per frame
+        self.setMouseMoveCompression(False)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -0,0 +1,18 @@
+"""
+Shared pytest setup for the unit suite.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+@pytest.fixture(autouse=True, scope='session')
+def _no_calibration_persistence():
+    """Keeps the font calibration table in memory so test runs never write to the user's
+    cache dir. Imported here rather than at module level: some suites mock pygame before
+    their first gameqt import, which happens during collection."""
+    from gameqt.utils import text_renderer
+    text_renderer.set_calibration_cache_path(None)
+    yield
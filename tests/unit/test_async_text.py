@@ -0,0 +1,130 @@
+"""
+Test suite for background text rasterization.
+"""
+import unittest
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import MagicMock, patch
+from gameqt.application import QApplication
+from gameqt.graphics import QGraphicsScene, QGraphicsView, QGraphicsTextItem
+from gameqt.utils import text_renderer
+from gameqt.utils.text_renderer import render_text, render_text_async, collect_async_text
+from gameqt.widgets import QWidget
+
+def wait_for_jobs(timeout=5.0):
+    end = time.time() + timeout
+    while any(not job.future.done() for job in text_renderer._pending.values()) and time.time() < end:
+        time.sleep(0.005)
+
+class TestRenderTextAsync(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        text_renderer.clear_render_cache()
+        text_renderer._sync_only.clear()
+        pygame.event.clear(text_renderer.TEXT_READY_EVENT)
+
+    def tearDown(self):
+        wait_for_jobs()
+        collect_async_text()
+
+    def test_placeholder_then_real_surface(self):
+        widget = MagicMock()
+        with patch.object(text_renderer.ImageDraw, 'Draw') as draw:
+            placeholder = render_text_async("Chapter 12", "Arial", 16, (0, 0, 0), widget=widget)
+            draw.assert_not_called()  # Nothing is rasterized on this thread
+        w, h, _, _ = text_renderer.get_text_metrics("Chapter 12", "Arial", 16)
+        self.assertEqual(placeholder.get_size(), (w + 2, h + 2))
+        wait_for_jobs()
+        self.assertTrue(pygame.event.get(text_renderer.TEXT_READY_EVENT))
+        self.assertTrue(collect_async_text())
+        widget.update.assert_called_once_with()
+        ready = render_text_async("Chapter 12", "Arial", 16, (0, 0, 0))
+        self.assertEqual(pygame.image.tostring(ready, 'RGBA'), pygame.image.tostring(render_text("Chapter 12", "Arial", 16, (0, 0, 0)), 'RGBA'))
+
+    def test_one_job_per_string(self):
+        first, second = MagicMock(), MagicMock()
+        render_text_async("Same", "Arial", 14, (0, 0, 0), widget=first)
+        render_text_async("Same", "Arial", 14, (255, 0, 0), widget=second)
+        self.assertEqual(len(text_renderer._pending), 1)
+        wait_for_jobs()
+        collect_async_text()
+        first.update.assert_called_once_with()
+        second.update.assert_called_once_with()
+
+    def test_nearest_cached_size_is_the_placeholder(self):
+        render_text("Zoomed", "Arial", 20, (0, 0, 0))
+        placeholder = render_text_async("Zoomed", "Arial", 21, (0, 0, 0))
+        self.assertTrue(any(placeholder.get_at((x, y)).a for x in range(placeholder.get_width()) for y in range(placeholder.get_height())))
+
+    def test_failed_job_falls_back_to_synchronous_rendering(self):
+        with patch.object(text_renderer, '_rasterize_mask', side_effect=RuntimeError("boom")):
+            render_text_async("Broken", "Arial", 15, (0, 0, 0))
+            wait_for_jobs()
+            collect_async_text()
+        surface = render_text_async("Broken", "Arial", 15, (0, 0, 0))
+        self.assertFalse(text_renderer._pending)
+        self.assertEqual(surface.get_size(), render_text("Broken", "Arial", 15, (0, 0, 0)).get_size())
+
+    def test_failed_keys_are_bounded_and_cleared(self):
+        with patch.object(text_renderer, 'SYNC_ONLY_SIZE', 3), \
+             patch.object(text_renderer, '_rasterize_mask', side_effect=RuntimeError("boom")):
+            for i in range(6): render_text_async(f"Broken {i}", "Arial", 15, (0, 0, 0))
+            wait_for_jobs()
+            collect_async_text()
+        self.assertEqual(list(text_renderer._sync_only), [(f"Broken {i}", "Arial", 15, False, False) for i in (3, 4, 5)])
+        text_renderer.clear_render_cache()
+        self.assertFalse(text_renderer._sync_only)
+
+    def test_worker_fonts_are_bounded_and_cleared(self):
+        fonts = [text_renderer.get_font_face("Arial", size).font for size in range(10, 20)]
+        with patch.object(text_renderer, 'WORKER_FONT_CACHE_SIZE', 4):
+            for font in fonts: text_renderer._worker_font(font)
+        self.assertEqual(len(text_renderer._worker_local.fonts), 4)
+        text_renderer.clear_render_cache()
+        text_renderer._worker_font(fonts[0])
+        self.assertEqual(len(text_renderer._worker_local.fonts), 1)
+
+class TestAsyncSceneText(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        text_renderer.clear_render_cache()
+        self.win = QWidget()
+        self.win.setGeometry(0, 0, 400, 300)
+        self.scene = QGraphicsScene()
+        for i in range(20):
+            item = QGraphicsTextItem(f"Async label {i}")
+            item.setPos(10, 14 * i)
+            self.scene.addItem(item)
+        self.view = QGraphicsView(self.scene, self.win)
+        self.view.setGeometry(0, 0, 400, 300)
+        self.view.setAsyncTextRendering(True)
+        self.win.show()
+
+    def tearDown(self):
+        wait_for_jobs()
+        collect_async_text()
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_first_frame_queues_text_and_app_repaints_when_ready(self):
+        self.win._draw_recursive()
+        self.assertEqual(len(text_renderer._pending), 20)
+        wait_for_jobs()
+        self.app._dirty = False
+        with patch.object(self.view, 'update') as update:
+            self.app._process_async_text()
+        self.assertTrue(update.called)
+        self.assertTrue(self.app._dirty)
+        self.assertFalse(text_renderer._pending)
+
+if __name__ == '__main__':
+    unittest.main()
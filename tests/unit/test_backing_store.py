@@ -0,0 +1,100 @@
+"""
+Test suite for opt-in per-widget backing-store surfaces.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from gameqt.application import QApplication
+from gameqt.widgets import QWidget, QLabel
+
+class Swatch(QWidget):
+    """Fills its rect with a solid color and counts paints."""
+    def __init__(self, color, parent=None):
+        super().__init__(parent)
+        self.color, self.paints = color, 0
+    def _draw(self, pos):
+        self.paints += 1
+        screen = self._get_screen()
+        pygame.draw.rect(screen, self.color, (pos.x, pos.y, self._rect.width, self._rect.height))
+
+class TestBackingStore(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.win = Swatch((0, 0, 0))
+        self.win.setGeometry(0, 0, 300, 200)
+        self.panel = Swatch((0, 0, 255), self.win)
+        self.panel.setGeometry(50, 40, 100, 80)
+        self.child = Swatch((255, 0, 0), self.panel)
+        self.child.setGeometry(10, 10, 20, 20)
+        self.win.show()
+        self.panel.setBackingStoreEnabled(True)
+        self.screen = self.win._get_screen()
+
+    def tearDown(self):
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_cached_subtree_is_painted_once_and_blitted(self):
+        self.win._draw_recursive()
+        self.win._draw_recursive()
+        self.assertEqual((self.panel.paints, self.child.paints), (1, 1))
+        self.assertEqual(self.win.paints, 2)
+        # Children paint at the right place even though they drew into the surface
+        self.assertEqual(self.screen.get_at((65, 55))[:3], (255, 0, 0))
+        self.assertEqual(self.screen.get_at((140, 110))[:3], (0, 0, 255))
+        self.assertEqual(self.screen.get_at((10, 10))[:3], (0, 0, 0))
+
+    def test_update_invalidates_cached_ancestor(self):
+        self.win._draw_recursive()
+        self.child.color = (0, 255, 0)
+        self.child.update()
+        self.win._draw_recursive()
+        self.assertEqual(self.child.paints, 2)
+        self.assertEqual(self.screen.get_at((65, 55))[:3], (0, 255, 0))
+
+    def test_geometry_and_style_changes_invalidate(self):
+        self.win._draw_recursive()
+        self.child.move(40, 40)
+        self.win._draw_recursive()
+        self.assertEqual(self.child.paints, 2)
+        self.assertEqual(self.screen.get_at((95, 85))[:3], (255, 0, 0))
+        self.panel.resize(120, 90)
+        self.win._draw_recursive()
+        self.assertEqual(self.panel._backing_store.get_size(), (120, 90))
+        self.panel.setStyleSheet("QWidget { color: red; }")
+        self.win._draw_recursive()
+        self.assertEqual(self.panel.paints, 4)
+
+    def test_pointer_input_invalidates_widget_under_cursor(self):
+        self.win._draw_recursive()
+        ev = pygame.event.Event(pygame.MOUSEMOTION, {'pos': (65, 55), 'rel': (0, 0), 'buttons': (0, 0, 0)})
+        self.app._dispatch_pointer_event(self.win, ev)
+        self.win._draw_recursive()
+        self.assertEqual(self.child.paints, 2)
+        # Setters call update(), so programmatic changes invalidate too
+        label = QLabel("a", self.panel)
+        label.show()
+        self.win._draw_recursive()
+        painted = self.panel.paints
+        label.setText("b")
+        self.win._draw_recursive()
+        self.assertEqual(self.panel.paints, painted + 1)
+
+    def test_disabled_by_default(self):
+        self.assertFalse(self.win.isBackingStoreEnabled())
+        self.panel.setBackingStoreEnabled(False)
+        self.win._draw_recursive()
+        self.win._draw_recursive()
+        self.assertEqual(self.child.paints, 2)
+        self.assertIsNone(self.panel._backing_store)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Test suite for computed styles shared between widgets.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from unittest.mock import patch
+from gameqt.application import QApplication
+from gameqt.widgets import QWidget, QPushButton, QLabel
+
+class TestComputedStyle(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.app.setStyleSheet("")
+        self.win = QWidget()
+        self.left, self.right = QWidget(self.win), QWidget(self.win)
+        self.buttons = [QPushButton(str(i), self.left) for i in range(50)]
+        self.other = QPushButton("x", self.right)
+
+    def tearDown(self):
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+        self.app.setStyleSheet("")
+
+    def test_identical_widgets_share_one_style(self):
+        styles = {id(b._computed_style()) for b in self.buttons}
+        self.assertEqual(len(styles), 1)
+        self.assertIs(self.other._computed_style(), self.buttons[0]._computed_style())
+        self.assertIsNot(QLabel("l", self.left)._computed_style(), self.buttons[0]._computed_style())
+
+    def test_values_are_resolved_once_per_context(self):
+        with patch.object(QPushButton, '_resolve_style_property', autospec=True,
+                          side_effect=QWidget._resolve_style_property) as resolve:
+            for b in self.buttons: b._get_style_property('background-color')
+        self.assertEqual(resolve.call_count, 1)
+        self.assertEqual(self.buttons[-1]._get_style_property('background-color'), '#e1e1e6')
+
+    def test_local_stylesheet_changes_only_its_subtree(self):
+        shared = self.other._computed_style()
+        self.left.setStyleSheet("QPushButton { background-color: #101010; }")
+        self.assertEqual(self.buttons[0]._get_style_property('background-color'), '#101010')
+        self.assertEqual(self.other._get_style_property('background-color'), '#e1e1e6')
+        self.assertIs(self.other._computed_style(), shared)
+
+    def test_app_stylesheet_bumps_generation_without_walking_widgets(self):
+        self.buttons[0]._get_style_property('color')
+        generation = QApplication._style_generation
+        with patch.object(QWidget, '_computed_style') as walk:
+            self.app.setStyleSheet("QPushButton { color: #abcdef; }")
+            walk.assert_not_called()
+        self.assertGreater(QApplication._style_generation, generation)
+        self.assertEqual(self.buttons[0]._get_style_property('color'), '#abcdef')
+
+    def test_reparenting_changes_context(self):
+        self.right.setStyleSheet("QPushButton { color: #222222; }")
+        button = self.buttons[0]
+        self.assertNotEqual(button._get_style_property('color'), '#222222')
+        button.setParent(self.right)
+        self.assertEqual(button._get_style_property('color'), '#222222')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Test suite for the QApplication event loop.
+Covers on-demand repainting (damage tracking), idle waiting and
+MOUSEMOTION coalescing.
+"""
+import unittest
+import sys
+import os
+import gc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from gameqt.application import QApplication
+from gameqt.core import Qt
+from gameqt.widgets import QWidget, QLabel
+
+class TestRepaintMode(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.app.setRepaintMode(QApplication.RepaintMode.OnDemand)
+        self.app._paint()
+
+    def tearDown(self):
+        self.app.setRepaintMode(QApplication.RepaintMode.Continuous)
+
+    def test_continuous_always_repaints(self):
+        self.app.setRepaintMode(QApplication.RepaintMode.Continuous)
+        self.app._paint()
+        self.assertTrue(self.app._needs_repaint())
+
+    def test_idle_does_not_repaint(self):
+        self.assertFalse(self.app._needs_repaint())
+
+    def test_update_marks_widget_dirty(self):
+        w = QWidget()
+        child = QLabel("child", w)
+        self.app._paint()
+        self.assertFalse(w._dirty)
+        
+        w.update()
+        self.assertTrue(w._dirty)
+        self.assertTrue(child._dirty)
+        self.assertTrue(self.app._needs_repaint())
+        
+        self.app._paint()
+        self.assertFalse(w._dirty)
+        self.assertFalse(self.app._needs_repaint())
+
+    def test_geometry_changes_mark_dirty(self):
+        w = QWidget()
+        self.app._paint()
+        w.resize(200, 100)
+        self.assertTrue(self.app._needs_repaint())
+        self.app._paint()
+        w.move(10, 10)
+        self.assertTrue(self.app._needs_repaint())
+
+    def test_scheduled_repaint(self):
+        self.app._schedule_repaint(0)
+        self.assertTrue(self.app._needs_repaint())
+        self.app._paint()
+        self.assertFalse(self.app._needs_repaint())
+
+class TestIdleWait(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        if not pygame.display.get_surface(): pygame.display.set_mode((100, 100))
+        self.app.setIdleMode(QApplication.IdleMode.Wait)
+        self.app._paint()
+        pygame.event.clear()
+
+    def tearDown(self):
+        self.app.setIdleMode(QApplication.IdleMode.Poll)
+        self.app.setRepaintMode(QApplication.RepaintMode.Continuous)
+
+    def test_wait_mode_enables_on_demand_repaint(self):
+        self.assertEqual(self.app.repaintMode(), QApplication.RepaintMode.OnDemand)
+
+    def test_wakes_at_deadline(self):
+        self.app._schedule_repaint(50)
+        start = pygame.time.get_ticks()
+        self.app._wait_for_events()
+        self.assertGreaterEqual(pygame.time.get_ticks() - start, 40)
+        self.assertTrue(self.app._needs_repaint())
+
+    def test_wakes_on_input(self):
+        self.app._schedule_repaint(5000)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode='a'))
+        start = pygame.time.get_ticks()
+        events = self.app._wait_for_events()
+        self.assertLess(pygame.time.get_ticks() - start, 1000)
+        self.assertTrue(any(e.type == pygame.KEYDOWN for e in events))
+
+    def test_does_not_block_when_dirty(self):
+        self.app._mark_dirty()
+        start = pygame.time.get_ticks()
+        self.app._wait_for_events()
+        self.assertLess(pygame.time.get_ticks() - start, 100)
+
+    def test_frame_rate_option(self):
+        self.app.setFrameRate(30)
+        self.assertEqual(self.app.frameRate(), 30)
+        self.app.setFrameRate(60)
+
+def _motion(pos, rel, buttons=(0, 0, 0)):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=buttons)
+
+class TestMouseMotionCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.app.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+
+    def test_run_is_merged(self):
+        events = [_motion((10, 10), (1, 1), (1, 0, 0)), _motion((12, 13), (2, 3), (1, 0, 0)), _motion((15, 13), (3, 0), (1, 0, 0))]
+        merged = self.app._coalesce_mouse_motion(events)
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(tuple(merged[0].pos), (15, 13))
+        self.assertEqual(tuple(merged[0].rel), (6, 4))
+        self.assertEqual(tuple(merged[0].buttons), (1, 0, 0))
+
+    def test_other_events_split_runs(self):
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(12, 12), button=1)
+        events = [_motion((10, 10), (1, 1)), _motion((12, 12), (2, 2)), click, _motion((14, 14), (2, 2))]
+        merged = self.app._coalesce_mouse_motion(events)
+        self.assertEqual([e.type for e in merged], [pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION])
+        self.assertEqual(tuple(merged[0].rel), (3, 3))
+
+    def test_disabled_by_attribute(self):
+        self.app.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, False)
+        events = [_motion((10, 10), (1, 1)), _motion((12, 12), (2, 2))]
+        self.assertEqual(len(self.app._coalesce_mouse_motion(events)), 2)
+
+    def test_widget_opt_out(self):
+        board = QWidget()
+        board.setGeometry(0, 0, 50, 50)
+        board.show()
+        board.setMouseMoveCompression(False)
+        self.assertFalse(board.mouseMoveCompression())
+        try:
+            inside = [_motion((10, 10), (1, 1)), _motion((12, 12), (2, 2))]
+            self.assertEqual(len(self.app._coalesce_mouse_motion(inside)), 2)
+            outside = [_motion((80, 80), (1, 1)), _motion((90, 90), (10, 10))]
+            self.assertEqual(len(self.app._coalesce_mouse_motion(outside)), 1)
+        finally:
+            board.setMouseMoveCompression(True)
+            board.hide()
+
+    def test_opt_out_does_not_keep_widgets_alive(self):
+        win = QWidget()
+        win.setGeometry(0, 0, 50, 50)
+        board = QWidget(win)
+        board.setGeometry(0, 0, 50, 50)
+        win.show()
+        board.setMouseMoveCompression(False)
+        try:
+            inside = [_motion((10, 10), (1, 1)), _motion((12, 12), (2, 2))]
+            win.hide()  # Hidden widgets are not scanned, so the run merges
+            self.assertEqual(len(self.app._coalesce_mouse_motion(inside)), 1)
+            win._children.remove(board)
+            self.app._dirty_widgets.clear()
+            del board
+            gc.collect()
+            self.assertEqual(len(self.app._raw_motion_widgets), 0)
+        finally:
+            if win in self.app._windows: self.app._windows.remove(win)
+
+if __name__ == '__main__':
+    unittest.main()
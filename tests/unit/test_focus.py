@@ -0,0 +1,182 @@
+"""
+Test suite for the QApplication focus manager and focus-routed key delivery.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from gameqt.application import QApplication
+from gameqt.core import Qt
+from gameqt.widgets import QWidget, QLineEdit, QMainWindow
+from gameqt.graphics import QGraphicsScene, QGraphicsView, QGraphicsRectItem
+
+def key(k, mod=0, text='', type=pygame.KEYDOWN):
+    return pygame.event.Event(type, {'key': k, 'mod': mod, 'unicode': text})
+
+def press(x, y):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'pos': (x, y), 'button': 1})
+
+class KeyRecorder(QWidget):
+    def __init__(self, log, parent=None, accept=False):
+        super().__init__(parent)
+        self._log, self._accept = log, accept
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+    def keyPressEvent(self, ev):
+        self._log.append((self, ev.key()))
+        if not self._accept: ev.ignore()
+    def focusInEvent(self, ev): self._log.append(('in', self, ev.reason()))
+    def focusOutEvent(self, ev): self._log.append(('out', self, ev.reason()))
+
+class TestFocus(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.app._set_focus_widget(None, Qt.FocusReason.OtherFocusReason)
+        for w in list(self.app._windows): w.hide()
+        self.log = []
+        self.win = KeyRecorder(self.log, accept=True)
+        self.win.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.win.setGeometry(0, 0, 400, 300)
+        self.a = KeyRecorder(self.log, self.win)
+        self.a.setGeometry(0, 0, 100, 30)
+        self.b = KeyRecorder(self.log, self.win)
+        self.b.setGeometry(0, 50, 100, 30)
+        self.c = KeyRecorder(self.log, self.win)
+        self.c.setGeometry(0, 100, 100, 30)
+        self.win.show()
+
+    def tearDown(self):
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_set_focus_sends_focus_events(self):
+        self.a.setFocus()
+        self.b.setFocus(Qt.FocusReason.MouseFocusReason)
+        self.assertIs(QApplication.focusWidget(), self.b)
+        self.assertTrue(self.b.hasFocus() and self.b._focused)
+        self.assertFalse(self.a._focused)
+        self.assertEqual(self.log[-2:], [('out', self.a, Qt.FocusReason.MouseFocusReason),
+                                         ('in', self.b, Qt.FocusReason.MouseFocusReason)])
+
+    def test_keys_go_to_focus_widget_and_bubble(self):
+        self.b.setFocus()
+        del self.log[:]
+        self.assertTrue(self.app._dispatch_key_event(key(pygame.K_x)))
+        # b ignores the key, so it bubbles to the window, which accepts it; siblings never see it
+        self.assertEqual(self.log, [(self.b, pygame.K_x), (self.win, pygame.K_x)])
+
+    def test_tab_chain_and_set_tab_order(self):
+        self.a.setFocus()
+        self.app._dispatch_key_event(key(pygame.K_TAB))
+        self.assertIs(self.app._focus_widget, self.b)
+        self.app._dispatch_key_event(key(pygame.K_TAB, pygame.KMOD_LSHIFT))
+        self.assertIs(self.app._focus_widget, self.a)
+        QWidget.setTabOrder(self.a, self.c)
+        self.app._dispatch_key_event(key(pygame.K_TAB))
+        self.assertIs(self.app._focus_widget, self.c)
+        self.app._dispatch_key_event(key(pygame.K_TAB, pygame.KMOD_SHIFT))
+        self.assertIs(self.app._focus_widget, self.a)
+        # Wraps around
+        self.c.setFocus()
+        self.c.focusNextChild()
+        self.assertIs(self.app._focus_widget, self.a)
+
+    def test_first_key_focuses_first_widget_in_chain(self):
+        self.app._dispatch_key_event(key(pygame.K_x))
+        self.assertIs(self.app._focus_widget, self.a)
+
+    def test_hiding_focus_widget_clears_focus(self):
+        self.b.setFocus()
+        self.b.hide()
+        self.assertIsNone(QApplication.focusWidget())
+
+    def test_click_to_focus(self):
+        self.app._dispatch_pointer_event(self.win, press(10, 60))
+        self.assertIs(self.app._focus_widget, self.b)
+        self.b.setFocusPolicy(Qt.FocusPolicy.TabFocus)
+        self.app._dispatch_pointer_event(self.win, press(10, 110))
+        self.assertIs(self.app._focus_widget, self.c)
+        # Clicking a widget that does not take click focus clears focus
+        self.app._dispatch_pointer_event(self.win, press(10, 60))
+        self.assertIsNone(self.app._focus_widget)
+
+    def test_unfocused_keys_go_to_the_active_window(self):
+        other = KeyRecorder(self.log, accept=True)
+        other.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        other.setGeometry(0, 0, 400, 300)
+        d = KeyRecorder(self.log, other)
+        d.setGeometry(0, 0, 100, 30)
+        try:
+            other.show()  # Shown last: active, though self.win comes first in _windows
+            self.assertIs(QApplication.activeWindow(), other)
+            self.app._dispatch_key_event(key(pygame.K_x))
+            self.assertIs(self.app._focus_widget, d)
+            self.app._set_focus_widget(None, Qt.FocusReason.OtherFocusReason)
+            self.win.raise_()
+            self.assertTrue(self.win.isActiveWindow())
+            self.assertIs(self.app._windows[-1], self.win)
+            self.app._dispatch_key_event(key(pygame.K_x))
+            self.assertIs(self.app._focus_widget, self.a)
+            self.app._set_focus_widget(None, Qt.FocusReason.OtherFocusReason)
+            self.app._dispatch_pointer_event(other, press(300, 200))  # Empty area: activates, no focus
+            self.assertIsNone(self.app._focus_widget)
+            self.assertTrue(other.isActiveWindow())
+            other.hide()
+            self.assertIs(QApplication.activeWindow(), self.win)
+        finally:
+            other.hide()
+            if other in self.app._windows: self.app._windows.remove(other)
+
+    def test_graphics_view_passes_unhandled_keys_up(self):
+        log = []
+        class Window(QMainWindow):
+            def keyPressEvent(self, ev): log.append(('window', ev.key()))
+        class Item(QGraphicsRectItem):
+            def keyPressEvent(self, ev): log.append(('item', ev.key()))
+        main = Window()
+        main.setGeometry(0, 0, 400, 300)
+        view = QGraphicsView(main)
+        main.setCentralWidget(view)
+        try:
+            main.show()
+            view.setFocus()
+            self.app._dispatch_key_event(key(pygame.K_r, text='r'), main)  # No scene
+            scene = QGraphicsScene()
+            view.setScene(scene)
+            self.app._dispatch_key_event(key(pygame.K_r, text='r'), main)  # No focus item
+            self.app._dispatch_key_event(key(pygame.K_r, type=pygame.KEYUP), main)
+            item = Item(0, 0, 10, 10)
+            scene.addItem(item)
+            item.setFocus()
+            self.app._dispatch_key_event(key(pygame.K_r, text='r'), main)  # The item accepts it
+            self.assertEqual(log, [('window', pygame.K_r), ('window', pygame.K_r), ('item', pygame.K_r)])
+            self.assertTrue(view.hasFocus())
+        finally:
+            main.hide()
+            if main in self.app._windows: self.app._windows.remove(main)
+
+    def test_line_edit_typing(self):
+        edit = QLineEdit(self.win)
+        edit.setGeometry(200, 0, 100, 30)
+        edit.show()
+        self.app._dispatch_pointer_event(self.win, press(210, 10))
+        self.assertTrue(edit.hasFocus())
+        self.assertTrue(edit._blink_timer.isActive())
+        for ch in "hi":
+            self.app._dispatch_key_event(key(ord(ch), text=ch))
+        self.assertEqual(edit.text(), "hi")
+        # Keys a line edit does not use bubble up to its parent
+        del self.log[:]
+        self.app._dispatch_key_event(key(pygame.K_F2))
+        self.assertEqual(self.log, [(self.win, pygame.K_F2)])
+        edit.clearFocus()
+        self.assertFalse(edit._blink_timer.isActive())
+
+if __name__ == '__main__':
+    unittest.main()
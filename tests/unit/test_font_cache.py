@@ -0,0 +1,77 @@
+"""
+Test suite for the shared LRU font cache in QFont.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.application import QApplication
+from gameqt.gui import QFont
+from gameqt.widgets import QWidget, QLabel, QPushButton, QLineEdit, QComboBox, QTabWidget
+
+class TestFontCache(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.limit = QFont.cacheLimit()
+        QFont.clearCache()
+
+    def tearDown(self):
+        QFont.setCacheLimit(self.limit)
+        QFont.clearCache()
+
+    def test_hits_and_misses(self):
+        a = QFont.sys_font(None, 14)
+        self.assertIs(QFont.sys_font(None, 14), a)
+        self.assertIsNot(QFont.sys_font(None, 14, bold=True), a)
+        self.assertEqual(QFont.cacheStats(), {'hits': 1, 'misses': 2, 'size': 2, 'limit': self.limit})
+
+    def test_least_recently_used_is_evicted(self):
+        QFont.setCacheLimit(2)
+        small = QFont.sys_font(None, 10)
+        QFont.sys_font(None, 11)
+        QFont.sys_font(None, 10)  # refresh 10, making 11 the oldest
+        QFont.sys_font(None, 12)
+        self.assertEqual(list(QFont._cache), [(None, 10, False, False), (None, 12, False, False)])
+        self.assertIs(QFont.sys_font(None, 10), small)
+        QFont.setCacheLimit(1)
+        self.assertEqual(QFont.cacheStats()['size'], 1)
+
+    def test_qfont_objects_share_cached_fonts(self):
+        font = QFont("Arial", 13)
+        font.setBold(True)
+        self.assertIs(font.get_sys_font(), QFont.sys_font(None, 13, True))
+
+class TestWidgetFonts(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.win = QWidget()
+        self.win.setGeometry(0, 0, 400, 300)
+        QLabel("Name", self.win)
+        QPushButton("OK", self.win)
+        QLineEdit("text", self.win)
+        combo = QComboBox(self.win)
+        combo.addItems(["one", "two"])
+        tabs = QTabWidget(self.win)
+        tabs.addTab(QWidget(), "Tab")
+        self.win.show()
+
+    def tearDown(self):
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_repaints_do_not_create_fonts(self):
+        self.win._draw_recursive()
+        with patch('pygame.font.SysFont', wraps=pygame.font.SysFont) as sys_font:
+            for _ in range(5): self.win._draw_recursive()
+        sys_font.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
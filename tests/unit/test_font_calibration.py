@@ -0,0 +1,85 @@
+"""
+Test suite for the persistent font calibration table.
+"""
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from unittest.mock import patch
+from PIL import ImageFont
+from gameqt.utils import text_renderer
+from gameqt.utils.text_renderer import get_calibrated_font
+
+@unittest.skipUnless(text_renderer._regular_font_path, "no TrueType font available")
+class TestFontCalibrationTable(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.font_path = shutil.copy(text_renderer._regular_font_path, self.tmp)
+        self.table_path = os.path.join(self.tmp, "cache", "font_calibration.json")
+        self.old_path = text_renderer.CALIBRATION_CACHE_PATH
+        text_renderer.set_calibration_cache_path(self.table_path)
+
+    def tearDown(self):
+        text_renderer.set_calibration_cache_path(self.old_path)
+        for key in [k for k in text_renderer._font_cache if k[0] == self.font_path]: del text_renderer._font_cache[key]
+        shutil.rmtree(self.tmp)
+
+    def restart(self):
+        """Simulates a new process: the in-memory caches are gone, the table file is not."""
+        text_renderer.save_calibration_table()
+        for key in [k for k in text_renderer._font_cache if k[0] == self.font_path]: del text_renderer._font_cache[key]
+        text_renderer.set_calibration_cache_path(self.table_path)
+
+    def test_calibration_is_saved_and_reused(self):
+        font = get_calibrated_font(self.font_path, 21)
+        self.assertFalse(os.path.exists(self.table_path))
+        self.restart()
+        with open(self.table_path) as f: table = json.load(f)
+        self.assertEqual(table[self.font_path]["sizes"], {"21": font.size})
+        with patch.object(ImageFont, 'truetype', wraps=ImageFont.truetype) as load:
+            again = get_calibrated_font(self.font_path, 21)
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(again.size, font.size)
+
+    def test_changed_font_file_is_recalibrated(self):
+        get_calibrated_font(self.font_path, 18)
+        self.restart()
+        stat = os.stat(self.font_path)
+        os.utime(self.font_path, (stat.st_atime, stat.st_mtime + 10))
+        with patch.object(ImageFont, 'truetype', wraps=ImageFont.truetype) as load:
+            get_calibrated_font(self.font_path, 18)
+        self.assertGreater(load.call_count, 1)
+
+    def test_table_is_loaded_lazily_and_tolerates_corruption(self):
+        os.makedirs(os.path.dirname(self.table_path))
+        with open(self.table_path, 'w') as f: f.write("{not json")
+        text_renderer.set_calibration_cache_path(self.table_path)
+        self.assertIsNone(text_renderer._calibration)
+        self.assertGreater(get_calibrated_font(self.font_path, 30).getmetrics()[0], 0)
+        self.assertIn(self.font_path, text_renderer._calibration)
+
+    def test_disabled_table_stays_in_memory(self):
+        text_renderer.set_calibration_cache_path(None)
+        get_calibrated_font(self.font_path, 25)
+        text_renderer.save_calibration_table()
+        self.assertFalse(os.path.exists(os.path.dirname(self.table_path)))
+
+    def test_default_path_follows_xdg_cache_home(self):
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self.tmp}):
+            self.assertEqual(text_renderer._default_calibration_cache_path(),
+                             os.path.join(self.tmp, "gameqt", "font_calibration.json"))
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": ""}):
+            self.assertEqual(text_renderer._default_calibration_cache_path(),
+                             os.path.join(os.path.expanduser("~"), ".cache", "gameqt", "font_calibration.json"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Test suite for cached text metrics and QFontMetrics.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.core import Qt
+from gameqt.gui import QFont, QFontMetrics
+from gameqt.utils import text_renderer
+from gameqt.utils.text_renderer import FontFace, get_font_face, get_text_metrics, render_text
+
+class TestTextMetricsCache(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        text_renderer._metrics_cache.clear()
+
+    def test_metrics_are_cached_per_text_and_face(self):
+        with patch.object(FontFace, 'line_width', autospec=True, side_effect=FontFace.line_width) as measure:
+            first = get_text_metrics("Zoom 150%", "Arial", 14)
+            self.assertEqual(get_text_metrics("Zoom 150%", "Arial", 14), first)
+            get_text_metrics("Zoom 150%", "Arial", 14, bold=True)
+        self.assertEqual(measure.call_count, 2)
+
+    def test_measuring_does_not_create_images(self):
+        get_font_face("Arial", 15)
+        with patch('PIL.Image.new') as new_image:
+            get_text_metrics("no pixels needed", "Arial", 15)
+        new_image.assert_not_called()
+
+    def test_advance_table_matches_pillow(self):
+        face = get_font_face("Arial", 16)
+        self.assertAlmostEqual(face.advance("Hello world"), face.font.getlength("Hello world"), delta=1)
+        self.assertIn("l", face._advances)
+
+    def test_render_uses_measured_size(self):
+        w, h, _, _ = get_text_metrics("Two\nlines", "Arial", 14)
+        self.assertEqual(render_text("Two\nlines", "Arial", 14, (0, 0, 0)).get_size(), (w + 2, h + 2))
+
+class TestQFontMetrics(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.metrics = QFontMetrics(QFont("Arial", 14))
+
+    def test_basic_metrics(self):
+        m = self.metrics
+        self.assertEqual(m.height(), m.ascent() + m.descent())
+        self.assertGreater(m.horizontalAdvance("Hello"), m.horizontalAdvance("Hell"))
+        rect = m.boundingRect("Hello")
+        self.assertEqual((rect.x(), rect.y(), rect.width(), rect.height()), (0, -m.ascent(), m.horizontalAdvance("Hello"), m.height()))
+
+    def test_elided_text(self):
+        m, text = self.metrics, "The quick brown fox jumps"
+        self.assertEqual(m.elidedText(text, Qt.TextElideMode.ElideRight, 1000), text)
+        right = m.elidedText(text, Qt.TextElideMode.ElideRight, 80)
+        self.assertTrue(right.startswith("The") and right.endswith("…"))
+        left = m.elidedText(text, Qt.TextElideMode.ElideLeft, 80)
+        self.assertTrue(left.startswith("…") and left.endswith("jumps"))
+        middle = m.elidedText(text, Qt.TextElideMode.ElideMiddle, 80)
+        self.assertTrue(middle.startswith("The") and middle.endswith("jumps") and "…" in middle)
+        for elided in (right, left, middle): self.assertLessEqual(m.horizontalAdvance(elided), 80)
+        self.assertEqual(m.elidedText(text, Qt.TextElideMode.ElideRight, 1), "")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Test suite for the glyph-atlas text backend.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.utils import text_renderer
+from gameqt.utils.text_renderer import render_text, get_glyph_atlas
+
+class TestGlyphAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        text_renderer.clear_render_cache()
+
+    def tearDown(self):
+        text_renderer.set_text_backend('pillow')
+
+    def test_glyphs_are_rasterized_once(self):
+        atlas = get_glyph_atlas("Arial", 16)
+        atlas.render("hello", (0, 0, 0))
+        with patch.object(atlas, '_rasterize', wraps=atlas._rasterize) as raster:
+            atlas.render("hello hell", (0, 0, 0))
+        self.assertEqual([c.args[0] for c in raster.call_args_list], [' '])
+        self.assertIs(get_glyph_atlas("Arial", 16), atlas)
+
+    def test_matches_pillow_layout(self):
+        text = "Status: AVWa 42\nline two"
+        pillow = render_text(text, "Arial", 18, (0, 0, 0))
+        text_renderer.set_text_backend('atlas')
+        atlas = render_text(text, "Arial", 18, (0, 0, 0))
+        self.assertIsNot(atlas, pillow)
+        self.assertLessEqual(abs(atlas.get_width() - pillow.get_width()), 2)
+        self.assertEqual(atlas.get_height(), pillow.get_height())
+
+    def test_kerning_applies_to_advances(self):
+        atlas = get_glyph_atlas("Arial", 40)
+        _, width = atlas.layout("AV")
+        self.assertAlmostEqual(width, atlas.font.getlength("AV"), places=3)
+
+    def test_rendered_text_is_tinted(self):
+        surf = get_glyph_atlas("Arial", 20).render("H", (200, 10, 50))
+        opaque = [surf.get_at((x, y)) for x in range(surf.get_width()) for y in range(surf.get_height())
+                  if surf.get_at((x, y)).a == 255]
+        self.assertTrue(opaque)
+        self.assertTrue(all(abs(c.r - 200) <= 1 and c.g <= 11 and abs(c.b - 50) <= 1 for c in opaque))
+
+    def test_overhanging_glyphs_are_not_clipped(self):
+        atlas = get_glyph_atlas("Arial", 40)
+        rect, dx, dy, advance = atlas.glyph('M')
+        atlas.glyphs['\ue000'] = (rect, dx + 6, dy - 4, advance)  # Past the right and top edges
+        def coverage(surf, area=None):
+            sub = surf.subsurface(area) if area else surf
+            return sum(sub.get_at((x, y)).a for x in range(sub.get_width()) for y in range(sub.get_height()))
+        for text in ('J', 'AJ', '\ue000', 'ab\ue000'):
+            expected = sum(coverage(atlas.surface, atlas.glyph(ch)[0]) for ch in text if atlas.glyph(ch)[0])
+            self.assertEqual(coverage(atlas.render(text)), expected, text)
+        self.assertEqual(atlas.render('AM').get_size(), (int(atlas.layout('AM')[1]) + 2, atlas.height + 2))  # No overhang: unchanged
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError): text_renderer.set_text_backend('cairo')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+Test suite for pointer dispatch through the per-window hit-test index.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.application import QApplication, QDropEvent
+from gameqt.core import QMimeData
+from gameqt.widgets import QWidget, QLineEdit, QScrollArea, QDialog
+
+class Recorder(QWidget):
+    def __init__(self, name, log, parent=None):
+        super().__init__(parent)
+        self._name, self._log = name, log
+    def mousePressEvent(self, ev): self._log.append((self._name, 'press', ev.pos().x(), ev.pos().y()))
+    def mouseMoveEvent(self, ev): self._log.append((self._name, 'move'))
+
+def press(x, y):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'pos': (x, y), 'button': 1})
+
+def motion(x, y):
+    return pygame.event.Event(pygame.MOUSEMOTION, {'pos': (x, y), 'rel': (0, 0), 'buttons': (0, 0, 0)})
+
+def release(x, y):
+    return pygame.event.Event(pygame.MOUSEBUTTONUP, {'pos': (x, y), 'button': 1})
+
+class TestHitTestIndex(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.log = []
+        self.win = Recorder('win', self.log)
+        self.win.setGeometry(0, 0, 400, 300)
+        self.panel = Recorder('panel', self.log, self.win)
+        self.panel.setGeometry(100, 100, 200, 100)
+        self.button = Recorder('button', self.log, self.panel)
+        self.button.setGeometry(10, 10, 50, 20)
+        self.win.show()
+
+    def tearDown(self):
+        self.win.hide()
+        self.win._set_parent(None)
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_press_goes_to_deepest_widget_in_local_coords(self):
+        self.assertTrue(self.app._dispatch_pointer_event(self.win, press(115, 115)))
+        self.assertEqual(self.log, [('button', 'press', 5, 5)])
+
+    def test_ignored_event_bubbles_to_ancestors(self):
+        self.app._dispatch_pointer_event(self.win, motion(115, 115))
+        self.assertEqual(self.log, [('button', 'move'), ('panel', 'move'), ('win', 'move')])
+
+    def test_topmost_sibling_wins(self):
+        overlay = Recorder('overlay', self.log, self.panel)
+        overlay.setGeometry(0, 0, 200, 100)
+        overlay.show()
+        self.app._dispatch_pointer_event(self.win, press(115, 115))
+        self.assertEqual(self.log[0][0], 'overlay')
+
+    def test_index_is_reused_until_geometry_changes(self):
+        index = self.app._hit_index(self.win)
+        self.app._dispatch_pointer_event(self.win, motion(5, 5))
+        self.assertIs(self.app._hit_index(self.win), index)
+        # Layouts reassign equal rects every frame; that must not invalidate the index
+        self.button._rect = pygame.Rect(10, 10, 50, 20)
+        self.assertIs(self.app._hit_index(self.win), index)
+        self.button.move(150, 50)
+        self.assertIsNot(self.app._hit_index(self.win), index)
+        self.app._dispatch_pointer_event(self.win, press(255, 155))
+        self.assertEqual(self.log[-1][0], 'button')
+
+    def test_dialog_minimum_size_refreshes_the_index(self):
+        dialog = QDialog()
+        dialog.setGeometry(0, 0, 100, 80)
+        child = Recorder('child', self.log, dialog)
+        child.setGeometry(150, 100, 40, 20)
+        try:
+            dialog.show()
+            self.app._dispatch_pointer_event(dialog, press(160, 110))
+            self.assertEqual(self.log, [])  # Clipped by the dialog
+            dialog.setMinimumSize(300, 200)
+            self.app._dispatch_pointer_event(dialog, press(160, 110))
+            self.assertEqual(self.log, [('child', 'press', 10, 10)])
+        finally:
+            dialog.hide()
+            if dialog in self.app._windows: self.app._windows.remove(dialog)
+
+    def test_hidden_widgets_and_clipping(self):
+        self.button.hide()
+        self.app._dispatch_pointer_event(self.win, press(115, 115))
+        self.assertEqual(self.log[-1][0], 'panel')
+        # Parts of a child outside its parent are not hit
+        self.button.show()
+        self.button.setGeometry(150, 10, 100, 20)
+        self.app._dispatch_pointer_event(self.win, press(320, 115))
+        self.assertEqual(self.log[-1][0], 'win')
+
+    def test_line_edit_loses_focus_on_outside_click(self):
+        edit = QLineEdit(self.win)
+        edit.setGeometry(10, 10, 80, 30)
+        edit.show()
+        self.app._dispatch_pointer_event(self.win, press(20, 20))
+        self.assertTrue(edit._focused)
+        self.app._dispatch_pointer_event(self.win, press(115, 115))
+        self.assertFalse(edit._focused)
+
+    def test_scroll_areas_away_from_the_cursor_see_nothing(self):
+        areas = []
+        for i in range(20):
+            area = QScrollArea(self.win)
+            area.setGeometry(310 + (i % 4) * 20, (i // 4) * 20, 15, 15)
+            area.show()
+            areas.append(area)
+        with patch.object(QScrollArea, '_handle_event', autospec=True, side_effect=QScrollArea._handle_event) as handler:
+            for event in (motion(115, 115), press(115, 115), release(115, 115)):
+                self.app._dispatch_pointer_event(self.win, event)
+        self.assertEqual(handler.call_count, 0)
+        self.assertEqual(self.log[-1][0], 'button')
+
+    def test_scrollbar_drag_grabs_the_pointer(self):
+        area = QScrollArea(self.win)
+        area.setGeometry(300, 0, 100, 100)
+        content = QWidget()
+        area.setWidget(content)
+        content.setGeometry(0, 0, 88, 1000)
+        area.show()
+        def at(event):
+            with patch('pygame.mouse.get_pos', return_value=event.pos):
+                return self.app._dispatch_pointer_event(self.win, event)
+        self.assertTrue(at(press(395, 5)))  # On the thumb
+        self.assertIs(self.app._pointer_grab, area)
+        self.assertTrue(at(motion(50, 40)))  # Far outside the area, still dragging
+        self.assertGreater(area._scroll_y, 0)
+        self.assertNotIn(('win', 'move'), self.log)
+        self.assertTrue(at(release(50, 40)))
+        self.assertIsNone(self.app._pointer_grab)
+        at(motion(50, 45))
+        self.assertEqual(self.log[-1], ('win', 'move'))
+
+    def test_drop_target_bubbles_to_accepting_ancestor(self):
+        self.panel.setAcceptDrops(True)
+        target, pos = self.app._find_drop_target(self.win, (115, 115))
+        self.assertIs(target, self.panel)
+        self.assertEqual((pos.x(), pos.y()), (15, 15))
+        got = []
+        self.panel.dropEvent = lambda ev: (got.append(ev), ev.accept())
+        self.assertTrue(self.app._dispatch_drop_event(self.win, QDropEvent((115, 115), QMimeData())))
+        self.assertEqual(len(got), 1)
+        self.assertFalse(self.app._dispatch_drop_event(self.win, QDropEvent((5, 5), QMimeData())))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Test suite for QGraphicsItem.setCacheMode.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.application import QApplication
+from gameqt.core import QSize
+from gameqt.gui import QBrush, QColor, QFont
+from gameqt.graphics import QGraphicsScene, QGraphicsView, QGraphicsItem, QGraphicsRectItem, QGraphicsTextItem
+from gameqt.widgets import QWidget
+
+CacheMode = QGraphicsItem.CacheMode
+
+class TestItemCache(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.win = QWidget()
+        self.win.setGeometry(0, 0, 400, 300)
+        self.scene = QGraphicsScene()
+        self.item = QGraphicsRectItem(0, 0, 40, 30)
+        self.item.setBrush(QBrush(QColor(200, 20, 20)))
+        self.item.setPos(50, 50)
+        self.scene.addItem(self.item)
+        self.view = QGraphicsView(self.scene, self.win)
+        self.view.setGeometry(0, 0, 400, 300)
+        self.win.show()
+
+    def tearDown(self):
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def frames(self, count=1):
+        with patch.object(QGraphicsRectItem, 'paint', autospec=True, side_effect=QGraphicsRectItem.paint) as paint:
+            for _ in range(count):
+                self.view.update()  # Full viewport repaint, not just damaged areas
+                self.win._draw_recursive()
+        return paint.call_count
+
+    def pixel(self, x, y):
+        return tuple(self.win._get_screen().get_at((x, y)))[:3]
+
+    def test_no_cache_paints_every_frame(self):
+        self.assertEqual(self.frames(3), 3)
+
+    def test_device_cache_reuses_raster_until_changed(self):
+        self.item.setCacheMode(CacheMode.DeviceCoordinateCache)
+        self.assertEqual(self.frames(3), 1)
+        self.assertEqual(self.pixel(70, 65), (200, 20, 20))
+        self.view.translate(15, 0)
+        self.item.setPos(60, 60)
+        self.assertEqual(self.frames(), 0)  # Panning and moving blit the same surface
+        self.assertEqual(self.pixel(70 + 25, 65 + 10), (200, 20, 20))
+        self.item.setBrush(QBrush(QColor(20, 200, 20)))
+        self.assertEqual(self.frames(2), 1)
+        self.assertEqual(self.pixel(95, 75), (20, 200, 20))
+        self.item.update()
+        self.assertEqual(self.frames(), 1)
+        self.view.scale(2, 2)
+        self.assertEqual(self.frames(2), 1)  # Re-rendered once for the new scale
+
+    def test_item_coordinate_cache_survives_zoom(self):
+        self.item.setCacheMode(CacheMode.ItemCoordinateCache)
+        self.assertEqual(self.frames(), 1)
+        self.view.scale(2, 2)
+        self.assertEqual(self.frames(2), 0)
+        self.assertEqual(self.pixel(140, 130), (200, 20, 20))
+        self.item.setCacheMode(CacheMode.ItemCoordinateCache, QSize(80, 60))
+        self.assertEqual(self.frames(), 1)
+        self.assertEqual(self.item._cache[1].get_size(), self.item._cache_base[3].get_size())  # Logical size matches the zoom
+
+    def test_cached_matches_uncached(self):
+        self.win._draw_recursive()
+        uncached = [self.pixel(x, y) for x in range(45, 95, 3) for y in range(45, 85, 3)]
+        self.item.setCacheMode(CacheMode.DeviceCoordinateCache)
+        self.win._draw_recursive()
+        self.assertEqual([self.pixel(x, y) for x in range(45, 95, 3) for y in range(45, 85, 3)], uncached)
+
+    def test_opacity_is_applied_at_blit(self):
+        self.item.setCacheMode(CacheMode.DeviceCoordinateCache)
+        self.item.setOpacity(0.5)
+        self.assertEqual(self.frames(), 1)
+        r, g, b = self.pixel(70, 65)
+        self.assertTrue(215 <= r <= 225 and 125 <= g <= 135)  # Half-way to the (240, 240, 240) background
+        self.item.setOpacity(1.0)
+        self.assertEqual(self.frames(), 0)
+        self.assertEqual(self.pixel(70, 65), (200, 20, 20))
+
+    def test_oversized_cache_paints_directly(self):
+        self.item.setRect(0, 0, 2000, 2000)
+        self.item.setPos(0, 0)
+        self.item.setCacheMode(CacheMode.DeviceCoordinateCache)
+        self.view.scale(30, 30)  # 60000 px square: far beyond MAX_CACHE_PIXELS
+        self.assertEqual(self.frames(2), 2)
+        self.assertIsNone(self.item._cache)
+        self.assertEqual(self.pixel(200, 150), (200, 20, 20))
+        self.view.scale(1 / 30, 1 / 30)
+        self.item.setCacheMode(CacheMode.ItemCoordinateCache, QSize(100000, 100000))
+        self.assertEqual(self.frames(2), 2)
+        self.assertIsNone(self.item._cache_base)
+        self.item.setCacheMode(CacheMode.ItemCoordinateCache)
+        self.assertEqual(self.frames(2), 1)  # Cached again once it fits
+        self.assertEqual(self.pixel(200, 150), (200, 20, 20))
+
+class TestTextItemGeometry(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+
+    def test_bounding_rect_follows_text_and_font(self):
+        item = QGraphicsTextItem("Short")
+        short = item.boundingRect()
+        item.setPlainText("A much longer label than before")
+        self.assertGreater(item.boundingRect().width(), short.width())
+        item.setFont(QFont("Arial", 30))
+        self.assertGreater(item.boundingRect().height(), short.height())
+
+    def test_setters_invalidate_the_cache(self):
+        item = QGraphicsTextItem("Label")
+        version = item._cache_version
+        item.setDefaultTextColor(QColor(255, 0, 0))
+        item.setPlainText("Other")
+        self.assertEqual(item._cache_version, version + 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Test suite for layout invalidation and the per-frame layout pass.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.application import QApplication
+from gameqt.widgets import QWidget, QLabel, QPushButton
+from gameqt.layouts import QVBoxLayout, QHBoxLayout
+
+def count_arrange(layout):
+    calls = []
+    original = layout.arrange
+    layout.arrange = lambda rect: (calls.append(rect), original(rect))
+    return calls
+
+class TestLayoutInvalidation(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.win = QWidget()
+        self.win.setGeometry(0, 0, 400, 300)
+        self.layout = QVBoxLayout(self.win)
+        self.label = QLabel("Name")
+        self.layout.addWidget(self.label)
+        self.panel = QWidget()
+        self.layout.addWidget(self.panel)
+        self.inner = QHBoxLayout(self.panel)
+        self.button = QPushButton("OK")
+        self.inner.addWidget(self.button)
+        self.win.show()
+        self.app._activate_layouts()
+        self.outer_calls = count_arrange(self.layout)
+        self.inner_calls = count_arrange(self.inner)
+
+    def tearDown(self):
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_clean_layouts_are_not_rearranged(self):
+        for _ in range(3):
+            self.app._activate_layouts()
+            self.win._draw_recursive()
+        self.assertEqual((self.outer_calls, self.inner_calls), ([], []))
+
+    def test_text_change_invalidates_parent_layout_only(self):
+        self.label.setText("A much longer name")
+        self.app._activate_layouts()
+        self.assertEqual(len(self.outer_calls), 1)
+        self.assertEqual(self.inner_calls, [])
+        self.app._activate_layouts()
+        self.assertEqual(len(self.outer_calls), 1)
+
+    def test_visibility_and_children_invalidate(self):
+        self.button.hide()
+        self.app._activate_layouts()
+        self.assertEqual(len(self.inner_calls), 1)
+        self.inner.addWidget(QPushButton("Cancel"))
+        self.app._activate_layouts()
+        self.assertEqual(len(self.inner_calls), 2)
+        self.inner.setSpacing(8)
+        self.app._activate_layouts()
+        self.assertEqual(len(self.inner_calls), 3)
+
+    def test_resize_cascades_to_nested_layouts_in_one_pass(self):
+        self.win.resize(600, 300)
+        self.assertEqual(len(self.outer_calls), 1)
+        self.app._activate_layouts()
+        # The outer layout already ran in resize(); the panel's new width re-arranges its layout
+        self.assertEqual((len(self.outer_calls), len(self.inner_calls)), (1, 1))
+        self.assertEqual(self.inner_calls[0].width, 600)
+
+    def test_style_change_invalidates(self):
+        self.label.setStyleSheet("QLabel { font-size: 20px; }")
+        self.app._activate_layouts()
+        self.assertEqual(len(self.outer_calls), 1)
+
+    def test_text_measurement_reuses_one_font(self):
+        row = QHBoxLayout(QWidget())
+        for text in ("a", "bb", "ccc"): row.addWidget(QLabel(text))
+        with patch('pygame.font.SysFont', wraps=pygame.font.SysFont) as sys_font:
+            for _ in range(5): row.arrange(pygame.Rect(0, 0, 300, 40))
+        self.assertLessEqual(sys_font.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
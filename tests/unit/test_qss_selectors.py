@@ -0,0 +1,91 @@
+"""
+Test suite for compiled QSS stylesheets and selector resolution.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from gameqt.application import QApplication
+from gameqt.utils import QSSParser
+from gameqt.widgets import QWidget, QPushButton, QLabel, QGroupBox
+
+class TestCompiledStyleSheet(unittest.TestCase):
+    def test_parse_compiles_indexed_rules(self):
+        styles = QSSParser.parse("""
+            QWidget { color: black; }
+            QGroupBox QPushButton:hover, QSplitter::handle { background-color: red; }
+        """)
+        # Still usable as a selector -> properties mapping
+        self.assertEqual(styles["QWidget"], {"color": "black"})
+        self.assertIn("QSplitter::handle", styles)
+        hover = styles._index[("QPushButton", None, "hover")][0]
+        self.assertEqual((hover.ancestors, hover.specificity), (("QGroupBox",), 3))
+        handle = styles._index[("QSplitter", "handle", None)][0]
+        self.assertEqual(handle.specificity, 2)
+
+    def test_flat_rules(self):
+        styles = QSSParser.parse("color: red; margin: 5px")
+        self.assertEqual(styles["*"], {"color": "red", "margin": "5px"})
+        self.assertEqual(styles.lookup("margin", ("QLabel",), []), "5px")
+        self.assertFalse(QSSParser.parse(""))
+
+    def test_lookup_prefers_specificity_then_order(self):
+        styles = QSSParser.parse("""
+            QPushButton { color: red; }
+            QWidget { color: blue; }
+            * { color: green; }
+            QGroupBox QPushButton { color: white; }
+        """)
+        button, widget, box = ("QPushButton", "QWidget", "QObject"), ("QWidget", "QObject"), frozenset(("QGroupBox", "QWidget"))
+        # Equal specificity: the later rule wins, as in Qt
+        self.assertEqual(styles.lookup("color", button, []), "blue")
+        self.assertEqual(styles.lookup("color", button, [frozenset(("QWidget",)), box]), "white")
+        self.assertEqual(styles.lookup("color", ("QObject",), []), "green")
+        self.assertEqual(styles.lookup("color", widget, [box]), "blue")
+
+    def test_pseudo_and_sub_element_must_match(self):
+        styles = QSSParser.parse("QPushButton { color: red; } QPushButton:hover { color: blue; }")
+        self.assertEqual(styles.lookup("color", ("QPushButton",), [], pseudo="hover"), "blue")
+        self.assertIsNone(styles.lookup("color", ("QPushButton",), [], pseudo="pressed"))
+        self.assertIsNone(styles.lookup("color", ("QPushButton",), [], sub_element="menu-indicator"))
+
+class TestWidgetStyleResolution(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.app.setStyleSheet("")
+        self.win = QWidget()
+        self.box = QGroupBox("Box", self.win)
+        self.button = QPushButton("OK", self.box)
+        self.label = QLabel("Name", self.win)
+
+    def tearDown(self):
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_default_style_subclass_rules_win(self):
+        self.assertEqual(self.button._get_style_property('background-color'), '#e1e1e6')
+        self.assertEqual(self.label._get_style_property('background-color'), 'transparent')
+        self.assertEqual(self.button._get_style_property('background-color', 'hover'), '#d2d2d7')
+
+    def test_descendant_selector_in_ancestor_stylesheet(self):
+        self.win.setStyleSheet("QGroupBox QPushButton { color: #ff0000; } QLabel { color: #00ff00; }")
+        self.assertEqual(self.button._get_style_property('color'), '#ff0000')
+        self.assertEqual(self.label._get_style_property('color'), '#00ff00')
+        # A stylesheet on the group box itself also sees it as an ancestor
+        self.win.setStyleSheet("")
+        self.box.setStyleSheet("QGroupBox QPushButton { color: #0000ff; }")
+        self.assertEqual(self.button._get_style_property('color'), '#0000ff')
+
+    def test_app_stylesheet_change_is_picked_up(self):
+        self.assertEqual(self.label._get_style_property('color'), '#1e1e23')
+        self.app.setStyleSheet("QLabel { color: #123456; }")
+        self.assertEqual(self.label._get_style_property('color'), '#123456')
+        self.app.setStyleSheet("")
+
+if __name__ == '__main__':
+    unittest.main()
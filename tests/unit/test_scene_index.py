@@ -0,0 +1,152 @@
+"""
+Test suite for the QGraphicsScene spatial index.
+"""
+import unittest
+import sys
+import os
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.application import QApplication
+from gameqt.core import Qt, QPointF, QRectF, QMouseEvent
+from gameqt.gui import QPixmap
+from gameqt.graphics import SceneIndex, QGraphicsScene, QGraphicsView, QGraphicsItem, QGraphicsRectItem, QGraphicsPixmapItem
+from gameqt.widgets import QWidget
+
+class TestSceneIndex(unittest.TestCase):
+    def test_query_matches_brute_force(self):
+        rng = random.Random(7)
+        index, rects = SceneIndex(64), {}
+        for i in range(500):
+            rect = (rng.uniform(-500, 500), rng.uniform(-500, 500), rng.uniform(0, 120), rng.uniform(0, 120))
+            rects[i] = rect
+            index.insert(i, rect)
+        rects[500] = (-5000, -5000, 10000, 10000)  # Large item, kept out of the grid
+        index.insert(500, rects[500])
+        self.assertIn(500, index._large)
+        for _ in range(50):
+            x, y, w, h = rng.uniform(-600, 600), rng.uniform(-600, 600), rng.uniform(1, 300), rng.uniform(1, 300)
+            expected = {i for i, (ix, iy, iw, ih) in rects.items() if not (ix + iw <= x or x + w <= ix or iy + ih <= y or y + h <= iy)}
+            self.assertEqual(set(index.query(x, y, w, h)), expected)
+        self.assertEqual(set(index.query(-1e6, -1e6, 2e6, 2e6)), set(rects))
+
+    def test_update_and_remove(self):
+        index = SceneIndex(100)
+        index.insert("a", (0, 0, 10, 10))
+        self.assertEqual(index.update("a", (450, 450, 10, 10)), (0, 0, 10, 10))
+        self.assertEqual(index.query_point(5, 5), [])
+        self.assertEqual(index.query_point(460, 460), ["a"])
+        self.assertEqual(index.remove("a"), (450, 450, 10, 10))
+        self.assertFalse(index._cells)
+        self.assertEqual(len(index), 0)
+
+class TestSceneIndexing(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.scene = QGraphicsScene()
+
+    def add_rect(self, x, y, w=10, h=10, z=0):
+        item = QGraphicsRectItem(0, 0, w, h)
+        item.setPos(x, y)
+        item.setZValue(z)
+        self.scene.addItem(item)
+        return item
+
+    def test_geometry_setters_reindex(self):
+        rect = self.add_rect(0, 0)
+        self.assertEqual(self.scene._items_at(QPointF(5, 5)), [rect])
+        rect.setPos(1000, 1000)
+        self.assertEqual(self.scene._items_at(QPointF(5, 5)), [])
+        rect.setRect(0, 0, 300, 300)
+        self.assertEqual(self.scene._items_at(QPointF(1250, 1250)), [rect])
+        pix = QGraphicsPixmapItem(QPixmap(20, 20))
+        pix.setPos(-100, -100)
+        self.scene.addItem(pix)
+        self.assertEqual(self.scene._items_at(QPointF(-90, -90)), [pix])
+        pix.setPixmap(QPixmap(200, 200))
+        self.assertEqual(self.scene._items_at(QPointF(50, 50)), [pix])
+        self.scene.removeItem(pix)
+        self.assertEqual(self.scene._items_at(QPointF(-90, -90)), [])
+        self.assertEqual(len(self.scene._index), 1)
+
+    def test_results_are_in_paint_order(self):
+        low, high, mid = self.add_rect(0, 0, z=-1), self.add_rect(5, 5, z=5), self.add_rect(2, 2)
+        late = self.add_rect(3, 3)
+        self.assertEqual(self.scene._items_in_rect(QRectF(0, 0, 20, 20)), self.scene.items())
+        self.assertEqual(self.scene._items_at(QPointF(6, 6)), [low, mid, late, high])
+        high.setVisible(False)
+        self.assertIs(self.scene.itemAt(QPointF(6, 6)), late)
+
+    def test_no_index_gives_the_same_answers(self):
+        items = [self.add_rect(20 * i, 0) for i in range(10)]
+        indexed = self.scene._items_in_rect(QRectF(35, 0, 50, 5))
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.assertEqual(self.scene._items_in_rect(QRectF(35, 0, 50, 5)), indexed)
+        self.assertEqual(indexed, items[2:5])
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self.assertEqual(self.scene._items_in_rect(QRectF(35, 0, 50, 5)), indexed)
+
+class TestIndexedView(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.scene = QGraphicsScene()
+        cls.scene.setSceneRect(QRectF(0, 0, 400, 300))
+        cls.items = []
+        for i in range(100000):
+            item = QGraphicsRectItem(0, 0, 8, 8)
+            item.setPos(10 * (i % 1000), 10 * (i // 1000))
+            cls.scene.addItem(item)
+            cls.items.append(item)
+
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.win = QWidget()
+        self.win.setGeometry(0, 0, 400, 300)
+        self.view = QGraphicsView(self.scene, self.win)
+        self.view.setGeometry(0, 0, 400, 300)
+        self.win.show()
+        self.cursor = patch('pygame.mouse.set_cursor')
+        self.cursor.start()
+
+    def tearDown(self):
+        self.cursor.stop()
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_large_scene_paints_only_visible_items(self):
+        self.win._draw_recursive()
+        self.view.update()
+        with patch.object(QGraphicsRectItem, 'paint', autospec=True) as paint:
+            self.win._draw_recursive()
+        self.assertLess(paint.call_count, 2000)
+        self.assertIn(self.items[0], [c.args[0] for c in paint.call_args_list])
+
+    def test_click_and_drag_hit_test(self):
+        target = self.items[1001]  # At scene (10, 10)
+        target.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable | QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
+        self.view.mousePressEvent(QMouseEvent(QPointF(14, 14), Qt.MouseButton.LeftButton))
+        self.assertTrue(target._selected)
+        with patch('pygame.mouse.get_pressed', return_value=(True, False, False)):
+            self.view.mouseMoveEvent(QMouseEvent(QPointF(14, 119), Qt.MouseButton.LeftButton))
+        self.view.mouseReleaseEvent(QMouseEvent(QPointF(14, 119), Qt.MouseButton.LeftButton))
+        self.assertIs(self.scene.itemAt(QPointF(13, 119)), target)
+        target.setPos(10, 10)
+
+    def test_rubber_band_selects_through_the_index(self):
+        self.scene.clearSelection()
+        self.view.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
+        self.view.mousePressEvent(QMouseEvent(QPointF(1, 1), Qt.MouseButton.LeftButton))
+        self.view.mouseMoveEvent(QMouseEvent(QPointF(25, 25), Qt.MouseButton.LeftButton))
+        self.view.mouseReleaseEvent(QMouseEvent(QPointF(25, 25), Qt.MouseButton.LeftButton))
+        self.assertEqual(set(self.scene.selectedItems()), {self.items[i] for i in (0, 1, 2, 1000, 1001, 1002, 2000, 2001, 2002)})
+        self.scene.clearSelection()
+
+if __name__ == '__main__':
+    unittest.main()
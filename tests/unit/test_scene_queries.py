@@ -0,0 +1,99 @@
+"""
+Test suite for QGraphicsScene region queries: items(area), itemAt() and collidingItems().
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from unittest.mock import patch
+from gameqt.core import Qt, QPointF, QRectF
+from gameqt.graphics import QGraphicsScene, QGraphicsRectItem, QGraphicsEllipseItem
+
+Mode = Qt.ItemSelectionMode
+
+class TestRegionQueries(unittest.TestCase):
+    def setUp(self):
+        self.scene = QGraphicsScene()
+        self.back = self.add(QGraphicsRectItem(0, 0, 100, 100), 0, 0, z=-1)
+        self.circle = self.add(QGraphicsEllipseItem(0, 0, 100, 100), 0, 0)
+        self.small = self.add(QGraphicsRectItem(0, 0, 10, 10), 200, 200)
+
+    def add(self, item, x, y, z=0):
+        item.setPos(x, y)
+        item.setZValue(z)
+        self.scene.addItem(item)
+        return item
+
+    def test_items_without_arguments_keep_paint_order(self):
+        self.assertEqual(self.scene.items(), [self.back, self.circle, self.small])
+
+    def test_items_at_point_use_the_shape(self):
+        self.assertEqual(self.scene.items(QPointF(50, 50)), [self.circle, self.back])
+        self.assertEqual(self.scene.items(QPointF(50, 50), order=Qt.SortOrder.AscendingOrder), [self.back, self.circle])
+        self.assertEqual(self.scene.items(QPointF(3, 3)), [self.back])  # Corner is outside the circle
+        self.assertEqual(self.scene.items(QPointF(3, 3), Mode.IntersectsItemBoundingRect), [self.circle, self.back])
+
+    def test_items_in_rect_by_mode(self):
+        corner = QRectF(0, 0, 12, 12)
+        self.assertEqual(self.scene.items(corner), [self.back])
+        self.assertEqual(self.scene.items(corner, Mode.IntersectsItemBoundingRect), [self.circle, self.back])
+        everything = QRectF(-10, -10, 150, 150)
+        self.assertEqual(self.scene.items(everything, Mode.ContainsItemShape), [self.circle, self.back])
+        self.assertEqual(self.scene.items(QRectF(-10, -10, 100, 150), Mode.ContainsItemBoundingRect), [])
+        self.assertEqual(self.scene.items(QRectF(210, 210, -15, -15)), [self.small])  # Normalized
+
+    def test_hidden_items_are_skipped(self):
+        self.circle.setVisible(False)
+        self.assertEqual(self.scene.items(QPointF(50, 50)), [self.back])
+        self.assertIs(self.scene.itemAt(QPointF(50, 50)), self.back)
+
+    def test_item_at(self):
+        self.assertIs(self.scene.itemAt(QPointF(50, 50), None), self.circle)
+        self.assertIs(self.scene.itemAt(QPointF(3, 3)), self.back)
+        self.assertIsNone(self.scene.itemAt(QPointF(150, 150)))
+
+    def test_queries_touch_only_nearby_items(self):
+        for i in range(2000):
+            self.add(QGraphicsRectItem(0, 0, 5, 5), 1000 + 10 * (i % 50), 1000 + 10 * (i // 50))
+        with patch.object(QGraphicsRectItem, '_matches_rect', autospec=True, side_effect=QGraphicsRectItem._matches_rect) as test:
+            self.assertEqual(self.scene.items(QRectF(195, 195, 20, 20)), [self.small])
+        self.assertEqual(test.call_count, 1)
+
+class TestCollidingItems(unittest.TestCase):
+    def setUp(self):
+        self.scene = QGraphicsScene()
+
+    def add(self, item, x, y):
+        item.setPos(x, y)
+        self.scene.addItem(item)
+        return item
+
+    def test_rect_and_ellipse_collisions(self):
+        circle = self.add(QGraphicsEllipseItem(0, 0, 100, 100), 0, 0)
+        in_corner = self.add(QGraphicsRectItem(0, 0, 10, 10), 0, 0)
+        overlapping = self.add(QGraphicsRectItem(0, 0, 20, 20), 90, 40)
+        inside = self.add(QGraphicsRectItem(0, 0, 10, 10), 45, 45)
+        self.add(QGraphicsRectItem(0, 0, 10, 10), 300, 300)
+        self.assertEqual(circle.collidingItems(), [inside, overlapping])
+        self.assertEqual(self.scene.collidingItems(circle, Mode.IntersectsItemBoundingRect), [inside, overlapping, in_corner])
+        self.assertEqual(self.scene.collidingItems(circle, Mode.ContainsItemShape), [inside])
+        self.assertEqual(self.scene.collidingItems(in_corner), [])
+
+    def test_ellipse_pairs(self):
+        a = self.add(QGraphicsEllipseItem(0, 0, 100, 100), 0, 0)
+        touching = self.add(QGraphicsEllipseItem(0, 0, 100, 100), 90, 0)
+        diagonal = self.add(QGraphicsEllipseItem(0, 0, 100, 100), 90, 90)  # Bounding rects overlap, circles do not
+        self.assertEqual(a.collidingItems(), [touching])
+        self.assertIn(diagonal, a.collidingItems(Mode.IntersectsItemBoundingRect))
+
+    def test_unattached_item(self):
+        self.assertEqual(QGraphicsRectItem(0, 0, 5, 5).collidingItems(), [])
+
+if __name__ == '__main__':
+    unittest.main()
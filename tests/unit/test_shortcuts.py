@@ -0,0 +1,120 @@
+"""
+Test suite for the QApplication shortcut keymap.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from gameqt.application import QApplication
+from gameqt.core import Qt, QShortcut, QKeyEvent
+from gameqt.gui.qkeysequence import QKeySequence
+from gameqt.widgets import QWidget, QLineEdit
+from gameqt.menus import QAction
+
+def key(k, mod=0, text=''):
+    return pygame.event.Event(pygame.KEYDOWN, {'key': k, 'mod': mod, 'unicode': text})
+
+class TestShortcuts(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.app._keymap.clear(); self.app._keymap_prefixes.clear(); self.app._pending_chord = ()
+        self.win = QWidget(); self.win.show()
+
+    def test_single_chord_and_side_specific_modifier(self):
+        fired = []
+        sc = QShortcut(QKeySequence("Ctrl+S"), self.win)
+        sc.activated.connect(lambda: fired.append(1))
+        # Left ctrl alone sets only KMOD_LCTRL; it must still match "Ctrl"
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_s, pygame.KMOD_LCTRL)))
+        self.assertFalse(self.app._dispatch_shortcut(key(pygame.K_s)))
+        self.assertFalse(self.app._dispatch_shortcut(key(pygame.K_s, pygame.KMOD_CTRL | pygame.KMOD_SHIFT)))
+        self.assertEqual(fired, [1])
+
+    def test_multi_chord(self):
+        fired = []
+        sc = QShortcut("Ctrl+K, Ctrl+C", self.win)
+        sc.activated.connect(lambda: fired.append(1))
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_k, pygame.KMOD_CTRL)))
+        self.assertEqual(fired, [])
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_LSHIFT, pygame.KMOD_LSHIFT)) is False)
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_c, pygame.KMOD_CTRL)))
+        self.assertEqual(fired, [1])
+        # A non-matching second key abandons the chord
+        self.app._dispatch_shortcut(key(pygame.K_k, pygame.KMOD_CTRL))
+        self.assertFalse(self.app._dispatch_shortcut(key(pygame.K_x)))
+        self.assertEqual(self.app._pending_chord, ())
+
+    def test_context_and_enabled(self):
+        fired = []
+        child = QWidget(self.win)
+        sc = QShortcut("F5", child)
+        sc.setContext(Qt.ShortcutContext.WidgetShortcut)
+        sc.activated.connect(lambda: fired.append(1))
+        self.assertFalse(self.app._dispatch_shortcut(key(pygame.K_F5)))
+        child.setFocus()
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_F5)))
+        sc.setEnabled(False)
+        self.assertFalse(self.app._dispatch_shortcut(key(pygame.K_F5)))
+        self.assertEqual(fired, [1])
+
+    def test_window_context_requires_visible_window(self):
+        fired = []
+        QShortcut("Ctrl+Q", self.win).activated.connect(lambda: fired.append(1))
+        self.win.hide()
+        self.assertFalse(self.app._dispatch_shortcut(key(pygame.K_q, pygame.KMOD_CTRL)))
+        self.win.show()
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_q, pygame.KMOD_CTRL)))
+        self.assertEqual(fired, [1])
+
+    def test_set_key_rebinds(self):
+        sc = QShortcut("Ctrl+A", self.win)
+        sc.setKey("Ctrl+B")
+        self.assertNotIn(((pygame.K_a, pygame.KMOD_CTRL),), self.app._keymap)
+        self.assertIn(((pygame.K_b, pygame.KMOD_CTRL),), self.app._keymap)
+
+    def test_action_shortcut_triggers(self):
+        fired = []
+        action = QAction("Toggle", self.win)
+        action.setCheckable(True)
+        action.triggered.connect(lambda *a: fired.append(1))
+        action.setShortcut("Ctrl+T")
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_t, pygame.KMOD_RCTRL)))
+        self.assertEqual(fired, [1])
+        self.assertTrue(action.isChecked())
+        action.setEnabled(False)
+        self.assertFalse(self.app._dispatch_shortcut(key(pygame.K_t, pygame.KMOD_CTRL)))
+
+    def test_focused_line_edit_keeps_editing_keys(self):
+        fired = []
+        for seq in ("Ctrl+C", "Del", "Backspace", "E", "Ctrl+S"):
+            action = QAction(seq, self.win)
+            action.setShortcut(seq)
+            action.triggered.connect(lambda *a, seq=seq: fired.append(seq))
+        edit = QLineEdit("abc", self.win)
+        edit.show()
+        edit.setFocus()
+        for event in (key(pygame.K_c, pygame.KMOD_LCTRL), key(pygame.K_BACKSPACE), key(pygame.K_e, text='e')):
+            self.assertFalse(self.app._dispatch_shortcut(event))
+            self.app._dispatch_key_event(event, self.win)
+        self.assertEqual(edit.text(), "abe")
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_s, pygame.KMOD_CTRL)))  # Not an editing key
+        edit.setReadOnly(True)
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_DELETE)))
+        edit.clearFocus()
+        self.assertTrue(self.app._dispatch_shortcut(key(pygame.K_e, text='e')))
+        self.assertEqual(fired, ["Ctrl+S", "Del", "E"])
+
+    def test_key_event_matches_standard_key(self):
+        self.assertTrue(QKeyEvent(pygame.K_c, pygame.KMOD_LMETA).matches(QKeySequence.StandardKey.Copy))
+        self.assertTrue(QKeyEvent(pygame.K_v, pygame.KMOD_LCTRL).matches(QKeySequence.StandardKey.Paste))
+        self.assertFalse(QKeyEvent(pygame.K_v, pygame.KMOD_CTRL | pygame.KMOD_SHIFT).matches(QKeySequence.StandardKey.Paste))
+
+if __name__ == '__main__':
+    unittest.main()
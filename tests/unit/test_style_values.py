@@ -0,0 +1,70 @@
+"""
+Test suite for typed, pre-parsed QSS property values.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from unittest.mock import patch
+from gameqt.application import QApplication
+from gameqt.gui import QColor, QFont
+from gameqt.utils import QSSParser
+from gameqt.utils.qss_parser import BorderSpec
+from gameqt.widgets import QWidget, QLabel, QPushButton
+
+class TestTypedValues(unittest.TestCase):
+    def test_conversions(self):
+        typed = QSSParser.typed_value
+        self.assertEqual(typed('background-color', '#e1e1e6'), (225, 225, 230, 255))
+        self.assertEqual(typed('color', 'transparent'), (0, 0, 0, 0))
+        self.assertEqual(typed('border-radius', '4px'), 4)
+        self.assertEqual(typed('font-size', '10pt'), 13)
+        self.assertEqual(typed('padding', '4px 8px'), 4)
+        self.assertEqual(typed('border', '2px dashed red'), BorderSpec(2, 'dashed', (255, 0, 0, 255)))
+        self.assertEqual(typed('border-bottom', '1px solid'), BorderSpec(1, 'solid', None))
+        self.assertEqual(typed('border', 'none').width, 0)
+        self.assertIs(typed('font-weight', 'bold'), True)
+        self.assertIs(typed('font-weight', 'normal'), False)
+        self.assertEqual(typed('font-family', "'segoe ui', 'roboto', sans-serif"), 'segoe ui,roboto,sans-serif')
+        self.assertEqual(typed('text-align', 'left'), 'left')
+        self.assertIsNone(typed('color', None))
+
+    def test_named_transparent_color(self):
+        self.assertEqual(QColor('transparent').to_pygame(), (0, 0, 0, 0))
+
+class TestWidgetStyleValues(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.app.setStyleSheet("")
+        self.win = QWidget()
+
+    def tearDown(self):
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def test_values_are_converted_once_per_computed_style(self):
+        buttons = [QPushButton(str(i), self.win) for i in range(20)]
+        with patch.object(QSSParser, 'typed_value', wraps=QSSParser.typed_value) as typed:
+            for _ in range(3):
+                for b in buttons: b._get_style_value('border')
+        self.assertEqual(typed.call_count, 1)
+        self.assertEqual(buttons[0]._get_style_value('border'), BorderSpec(1, 'solid', (160, 160, 170, 255)))
+
+    def test_font_reads_typed_properties(self):
+        label = QLabel("Title", self.win)
+        label.setStyleSheet("font-size: 20px; font-weight: bold; font-family: 'DejaVu Sans', sans-serif")
+        font = label.font()
+        self.assertEqual((font.pointSize(), font.bold(), font.family()), (20, True, 'dejavu sans,sans-serif'))
+
+    def test_explicit_font_wins_over_stylesheet(self):
+        label = QLabel("Title", self.win)
+        label.setFont(QFont("Custom", 24))
+        self.assertEqual((label.font().family(), label.font().pointSize()), ("Custom", 24))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Test suite for quantized text sizes while a QGraphicsView zooms.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.application import QApplication
+from gameqt.core import QPoint, QPointF, QWheelEvent
+from gameqt.gui import QPainter, QFont
+from gameqt.gui.qpainter import lod_font_size
+from gameqt.graphics import QGraphicsScene, QGraphicsView, QGraphicsTextItem
+from gameqt.utils import text_renderer
+from gameqt.widgets import QWidget
+
+class TestLodFontSize(unittest.TestCase):
+    def test_buckets(self):
+        self.assertEqual([lod_font_size(s) for s in (1, 4, 12, 16, 17, 100)], [4, 4, 16, 16, 23, 128])
+        sizes = {lod_font_size(12 * 1.15 ** i) for i in range(20)}
+        self.assertLessEqual(len(sizes), 8)  # 20 zoom steps
+        self.assertTrue(all(lod_font_size(s) >= s for s in (5.5, 9.9, 33.3)))
+
+    def test_painter_scales_bucket_raster(self):
+        device = pygame.Surface((400, 100))
+        painter = QPainter(device)
+        painter.setFont(QFont("Arial", 15))
+        painter._text_lod = True
+        with patch.object(text_renderer, 'render_text', wraps=text_renderer.render_text) as render:
+            surface = painter._text_surface("Zoom", 1.0)
+        self.assertEqual(render.call_args.args[2], lod_font_size(15))
+        exact = text_renderer.render_text("Zoom", "Arial", 15, (0, 0, 0, 255))
+        self.assertLessEqual(abs(surface.get_height() - exact.get_height()), 2)
+
+class TestZoomGesture(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.win = QWidget()
+        self.win.setGeometry(0, 0, 400, 300)
+        self.scene = QGraphicsScene()
+        for i in range(5):
+            item = QGraphicsTextItem(f"Label {i}")
+            item.setPos(10, 20 * i)
+            self.scene.addItem(item)
+        self.view = QGraphicsView(self.scene, self.win)
+        self.view.setGeometry(0, 0, 400, 300)
+        self.win.show()
+
+    def tearDown(self):
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def zoom(self, steps):
+        for _ in range(steps):
+            ev = QWheelEvent(QPointF(50, 50), QPoint(0, 120), pygame.KMOD_CTRL)
+            self.view.wheelEvent(ev)
+            self.win._draw_recursive()
+
+    def test_zooming_uses_few_sizes_then_settles(self):
+        with patch.object(text_renderer, 'render_text', wraps=text_renderer.render_text) as render:
+            self.zoom(12)
+            zoom_sizes = {c.args[2] for c in render.call_args_list}
+            self.assertTrue(self.view._zooming)
+            render.reset_mock()
+            self.view._zoom_settle_timer.stop()
+            self.view._end_zoom_gesture()
+            self.win._draw_recursive()
+            settled = {c.args[2] for c in render.call_args_list}
+        self.assertLessEqual(len(zoom_sizes), 6)  # 12 distinct sizes without LOD
+        self.assertEqual(settled, {int(12 * self.view._view_transform._m[4])})
+
+    def test_settle_timer_ends_gesture(self):
+        self.zoom(1)
+        self.assertTrue(self.view._zoom_settle_timer.isActive())
+        end = pygame.time.get_ticks() + QGraphicsView.ZOOM_SETTLE_MS + 50
+        while pygame.time.get_ticks() < end:
+            self.app._process_timers()
+            pygame.time.wait(5)
+        self.app._process_timers()
+        self.assertFalse(self.view._zooming)
+
+if __name__ == '__main__':
+    unittest.main()
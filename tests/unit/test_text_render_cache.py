@@ -0,0 +1,77 @@
+"""
+Test suite for the memory-budgeted text surface cache.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.gui import QFont
+from gameqt.utils import text_renderer
+from gameqt.utils.text_renderer import SurfaceCache, render_text
+
+class TestSurfaceCache(unittest.TestCase):
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = SurfaceCache(3 * 400)
+        for key in "abc": cache.put(key, pygame.Surface((10, 10)))
+        self.assertEqual(cache.bytes, 1200)
+        cache.get("a")
+        cache.put("d", pygame.Surface((10, 10)))
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual((cache.bytes, cache.evictions), (1200, 1))
+
+    def test_oversized_surfaces_are_not_cached(self):
+        cache = SurfaceCache(1000)
+        cache.put("small", pygame.Surface((5, 5)))
+        cache.put("big", pygame.Surface((100, 100)))
+        self.assertEqual((len(cache), cache.bytes), (1, 100))
+
+    def test_shrinking_budget_evicts(self):
+        cache = SurfaceCache(10000)
+        for i in range(5): cache.put(i, pygame.Surface((10, 10)))
+        cache.set_budget(800)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(0))
+        self.assertEqual(cache.stats()['misses'], 1)
+
+class TestRenderTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.budget = text_renderer.render_cache_budget()
+        text_renderer.clear_render_cache()
+
+    def tearDown(self):
+        text_renderer.set_render_cache_budget(self.budget)
+        text_renderer.clear_render_cache()
+
+    def test_repeated_text_hits(self):
+        first = render_text("Zoom 100%", "Arial", 14, (0, 0, 0))
+        self.assertIs(render_text("Zoom 100%", "Arial", 14, (0, 0, 0)), first)
+        stats = text_renderer.render_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 1, 1))
+
+    def test_changing_text_stays_within_budget(self):
+        one = render_text("x: 0", "Arial", 14, (0, 0, 0))
+        budget = one.get_width() * one.get_height() * 4 * 10
+        text_renderer.set_render_cache_budget(budget)
+        for i in range(500): render_text(f"x: {i % 10}{i}", "Arial", 14, (0, 0, 0))
+        stats = text_renderer.render_cache_stats()
+        self.assertLessEqual(stats['bytes'], budget)
+        self.assertGreater(stats['evictions'], 0)
+
+    def test_fallback_leaves_shared_font_unstyled(self):
+        plain = QFont.sys_font(None, 14)
+        with patch.object(text_renderer, 'has_emoji', side_effect=RuntimeError):
+            render_text("Bold", "Arial", 14, (0, 0, 0), bold=True, italic=True)
+        self.assertFalse(plain.get_bold() or plain.get_italic())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Test suite for mask-based text colorization.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.gui import QPainter, QPen, QColor, QFont
+from gameqt.utils import text_renderer
+from gameqt.utils.text_renderer import render_text, render_text_mask
+
+def count_rasterizations():
+    return patch.object(text_renderer.ImageDraw, 'Draw', wraps=text_renderer.ImageDraw.Draw)
+
+class TestTextTint(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        text_renderer.clear_render_cache()
+
+    def test_colors_share_one_rasterization(self):
+        colors = [(255, 0, 0), (0, 128, 0), (0, 0, 255), (30, 30, 35), (0, 0, 0, 128)]
+        with count_rasterizations() as draw:
+            surfaces = [render_text("Layer 1", "Arial", 16, c) for c in colors]
+        self.assertEqual(draw.call_count, 1)
+        self.assertEqual({s.get_size() for s in surfaces}, {render_text_mask("Layer 1", "Arial", 16).get_size()})
+
+    def test_tinted_pixels_take_the_color(self):
+        surf = render_text("M", "Arial", 24, (10, 120, 240, 128))
+        alphas = [surf.get_at((x, y)) for x in range(surf.get_width()) for y in range(surf.get_height())]
+        solid = [c for c in alphas if c.a >= 127]
+        self.assertTrue(solid)
+        self.assertTrue(all(abs(c.r - 10) <= 1 and abs(c.g - 120) <= 1 and abs(c.b - 240) <= 1 for c in solid))
+        self.assertLessEqual(max(c.a for c in alphas), 128)
+
+    def test_mask_is_white_coverage(self):
+        mask = render_text_mask("Hi", "Arial", 20)
+        covered = [mask.get_at((x, y)) for x in range(mask.get_width()) for y in range(mask.get_height()) if mask.get_at((x, y)).a]
+        self.assertTrue(covered)
+        self.assertTrue(all(c[:3] == (255, 255, 255) for c in covered))
+
+    def test_masks_are_kept_out_of_the_render_cache(self):
+        render_text("Kept apart", "Arial", 16, (0, 0, 0))
+        render_text("Kept apart", "Arial", 16, (255, 0, 0))
+        stats, masks = text_renderer.render_cache_stats(), text_renderer.mask_cache_stats()
+        self.assertEqual((stats['entries'], stats['misses']), (2, 2))
+        self.assertEqual((masks['entries'], masks['misses'], masks['hits']), (1, 1, 1))
+        text_renderer.set_mask_cache_budget(0)
+        self.assertEqual(text_renderer.mask_cache_stats()['bytes'], 0)
+        self.assertEqual(text_renderer.render_cache_stats()['entries'], 2)
+        text_renderer.set_mask_cache_budget(text_renderer.MASK_CACHE_BUDGET)
+
+class TestPainterFade(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        text_renderer.clear_render_cache()
+        self.device = pygame.Surface((200, 50))
+
+    def test_fading_text_is_not_rerendered(self):
+        painter = QPainter(self.device)
+        painter.setPen(QPen(QColor(200, 30, 30)))
+        with count_rasterizations() as draw:
+            for step in range(1, 11):
+                painter.setOpacity(step / 10)
+                painter.drawText(5, 5, "Fading")
+        self.assertEqual(draw.call_count, 1)
+        self.assertEqual(text_renderer.render_cache_stats()['entries'], 1)  # One tint
+        self.assertEqual(text_renderer.mask_cache_stats()['entries'], 1)
+
+    def test_opacity_applies_once_and_does_not_leak(self):
+        painter = QPainter(self.device)
+        painter.setPen(QPen(QColor(255, 255, 255)))
+        painter.setFont(QFont("Arial", 40))
+        self.device.fill((0, 0, 0))
+        painter.setOpacity(0.5)
+        painter.drawText(0, 0, "I")
+        brightest = max(self.device.get_at((x, y)).r for x in range(40) for y in range(50))
+        self.assertTrue(110 <= brightest <= 140)
+        self.assertEqual(render_text("I", "Arial", 40, (255, 255, 255, 255)).get_alpha(), 255)
+
+if __name__ == '__main__':
+    unittest.main()
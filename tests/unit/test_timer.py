@@ -0,0 +1,99 @@
+"""
+Test suite for QTimer and the QApplication timer scheduler.
+"""
+import unittest
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from gameqt.application import QApplication
+from gameqt.core import QTimer
+from gameqt.widgets import QStatusBar
+
+class TestQTimer(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.app._timer_heap.clear()
+
+    def _run_for(self, ms):
+        end = pygame.time.get_ticks() + ms
+        while pygame.time.get_ticks() < end:
+            self.app._process_timers()
+            pygame.time.wait(1)
+        self.app._process_timers()
+
+    def test_single_shot(self):
+        fired = []
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: fired.append(1))
+        timer.start(10)
+        self.assertTrue(timer.isActive())
+        self._run_for(40)
+        self.assertEqual(fired, [1])
+        self.assertFalse(timer.isActive())
+
+    def test_static_single_shot(self):
+        fired = []
+        QTimer.singleShot(5, lambda: fired.append(1))
+        self._run_for(30)
+        self.assertEqual(fired, [1])
+
+    def test_repeating(self):
+        fired = []
+        timer = QTimer()
+        timer.timeout.connect(lambda: fired.append(1))
+        timer.start(10)
+        self._run_for(55)
+        timer.stop()
+        self.assertGreaterEqual(len(fired), 3)
+        count = len(fired)
+        self._run_for(25)
+        self.assertEqual(len(fired), count)
+
+    def test_stop_before_due(self):
+        fired = []
+        timer = QTimer()
+        timer.timeout.connect(lambda: fired.append(1))
+        timer.start(10)
+        timer.stop()
+        self._run_for(30)
+        self.assertEqual(fired, [])
+        self.assertEqual(timer.remainingTime(), -1)
+
+    def test_due_timers_fire_in_one_batch(self):
+        order = []
+        a, b = QTimer(), QTimer()
+        for name, t in (('a', a), ('b', b)):
+            t.setSingleShot(True)
+            t.timeout.connect(lambda n=name: order.append(n))
+        a.start(0); b.start(0)
+        pygame.time.wait(2)
+        self.app._process_timers()
+        self.assertEqual(order, ['a', 'b'])
+
+    def test_next_deadline_feeds_idle_wait(self):
+        self.app._repaint_deadline = None
+        timer = QTimer()
+        timer.start(1000)
+        deadline = self.app._next_deadline()
+        self.assertIsNotNone(deadline)
+        self.assertLessEqual(deadline - pygame.time.get_ticks(), 1000)
+        timer.stop()
+        self.assertIsNone(self.app._next_deadline())
+
+    def test_status_bar_message_timeout(self):
+        bar = QStatusBar()
+        bar.showMessage("Saved", 10)
+        self.assertEqual(bar.currentMessage(), "Saved")
+        self._run_for(40)
+        self.assertEqual(bar.currentMessage(), "")
+
+if __name__ == '__main__':
+    unittest.main()
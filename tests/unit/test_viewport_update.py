@@ -0,0 +1,150 @@
+"""
+Test suite for QGraphicsView dirty-region viewport updates.
+"""
+import unittest
+import sys
+import os
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import pygame
+from unittest.mock import patch
+from gameqt.application import QApplication
+from gameqt.gui import QBrush, QColor
+from gameqt.graphics import QGraphicsScene, QGraphicsView, QGraphicsItem, QGraphicsRectItem, QGraphicsEllipseItem
+from gameqt.widgets import QWidget
+
+Mode = QGraphicsView.ViewportUpdateMode
+
+class TestViewportUpdates(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication(sys.argv)
+        self.win = QWidget()
+        self.win.setGeometry(0, 0, 400, 300)
+        self.scene = QGraphicsScene()
+        self.grid = []
+        for i in range(400):
+            item = QGraphicsRectItem(0, 0, 12, 12)
+            item.setBrush(QBrush(QColor(40, 90, 200)))
+            item.setPos(20 * (i % 20), 15 * (i // 20))
+            self.grid.append(item)
+        self.scene.addItems(self.grid)
+        self.mover = QGraphicsRectItem(0, 0, 10, 10)
+        self.mover.setBrush(QBrush(QColor(220, 30, 30)))
+        self.mover.setZValue(1)
+        self.mover.setPos(3, 3)
+        self.scene.addItem(self.mover)
+        self.view = QGraphicsView(self.scene, self.win)
+        self.view.setGeometry(0, 0, 400, 300)
+        self.win.show()
+        self.win._draw_recursive()
+
+    def tearDown(self):
+        self.win.hide()
+        if self.win in self.app._windows: self.app._windows.remove(self.win)
+
+    def frame(self):
+        """Draws one frame; returns how many items were painted."""
+        with patch.object(QGraphicsRectItem, 'paint', autospec=True, side_effect=QGraphicsRectItem.paint) as paint:
+            self.win._draw_recursive()
+        return paint.call_count
+
+    def assert_matches_full_repaint(self):
+        partial = pygame.image.tostring(self.view._viewport_surface, 'RGB')
+        self.view.update()
+        self.frame()
+        self.assertEqual(partial, pygame.image.tostring(self.view._viewport_surface, 'RGB'))
+
+    def test_unchanged_scene_paints_nothing(self):
+        self.assertEqual(self.frame(), 0)
+        self.assertEqual(self.win._get_screen().get_at((8, 8))[:3], (220, 30, 30))
+
+    def test_moving_one_item_repaints_its_neighbourhood(self):
+        self.app._dirty_widgets.clear()
+        self.mover.setPos(203, 153)
+        self.assertIn(self.view, self.app._dirty_widgets)
+        painted = self.frame()
+        self.assertLess(painted, 20)  # Old and new areas, not 400 items
+        screen = self.win._get_screen()
+        self.assertEqual(screen.get_at((8, 8))[:3], (40, 90, 200))
+        self.assertEqual(screen.get_at((208, 158))[:3], (220, 30, 30))
+        self.assert_matches_full_repaint()
+
+    def test_appearance_visibility_and_removal_are_damage(self):
+        self.mover.setBrush(QBrush(QColor(0, 160, 0)))
+        self.assertLess(self.frame(), 10)
+        self.assertEqual(self.win._get_screen().get_at((8, 8))[:3], (0, 160, 0))
+        self.grid[21].setVisible(False)
+        self.frame()
+        self.assert_matches_full_repaint()
+        self.scene.removeItem(self.mover)
+        self.frame()
+        self.assertEqual(self.win._get_screen().get_at((8, 8))[:3], (40, 90, 200))
+        self.assert_matches_full_repaint()
+
+    def test_bounding_rect_mode_repaints_one_region(self):
+        self.view.setViewportUpdateMode(Mode.BoundingRectViewportUpdate)
+        self.frame()
+        self.mover.setPos(303, 183)
+        self.assertGreater(self.frame(), 150)  # Everything between the old and new position
+        self.assert_matches_full_repaint()
+
+    def test_full_mode_repaints_everything(self):
+        self.view.setViewportUpdateMode(Mode.FullViewportUpdate)
+        self.frame()
+        self.mover.setPos(50, 50)
+        self.assertEqual(self.frame(), 401)
+
+    def test_no_update_mode_waits_for_update(self):
+        self.view.setViewportUpdateMode(Mode.NoViewportUpdate)
+        self.frame()
+        self.app._dirty_widgets.clear()
+        self.mover.setPos(203, 153)
+        self.assertNotIn(self.view, self.app._dirty_widgets)
+        self.assertEqual(self.frame(), 0)
+        self.assertEqual(self.win._get_screen().get_at((8, 8))[:3], (220, 30, 30))  # Stale until update()
+        self.view.update()
+        self.assertEqual(self.frame(), 401)
+        self.assertEqual(self.win._get_screen().get_at((208, 158))[:3], (220, 30, 30))
+
+    def test_pan_and_zoom_repaint_everything_visible(self):
+        self.view.translate(-10, 0)
+        self.assertGreater(self.frame(), 300)
+        self.view.scale(2, 2)
+        self.assertGreater(self.frame(), 50)
+        self.assertEqual(self.frame(), 0)
+
+    def test_fractional_positions_match_full_repaint(self):
+        rng = random.Random(5)
+        items = []
+        for i in range(150):
+            item = (QGraphicsRectItem if i % 2 else QGraphicsEllipseItem)(0, 0, rng.uniform(5, 30), rng.uniform(5, 30))
+            item.setBrush(QBrush(QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256))))
+            item.setPos(rng.uniform(-20, 400), rng.uniform(-20, 300))
+            if i % 10 == 0: item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+            items.append(item)
+        self.scene.addItems(items)
+        for scale in (1.0, 1.7):
+            self.view.scale(scale, scale)
+            self.frame()
+            for _ in range(5):
+                for item in rng.sample(items, 3):
+                    item.setPos(item.pos().x() + rng.uniform(-13, 13), item.pos().y() + rng.uniform(-13, 13))
+                self.frame()
+                self.assert_matches_full_repaint()
+
+    def test_many_damage_rects_merge(self):
+        for item in self.grid[:5]: item.update()
+        self.scene._flush_changes()
+        self.assertEqual(len(self.view._damage_regions(400, 300)), 5)
+        for item in self.grid[::7]: item.update()
+        self.scene._flush_changes()
+        self.assertEqual(len(self.view._damage_regions(400, 300)), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Test suite for incremental z-order maintenance in QGraphicsScene.
+"""
+import unittest
+import sys
+import os
+import random
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from unittest.mock import patch
+from gameqt.graphics import QGraphicsScene, QGraphicsRectItem
+
+def make_item(z=0):
+    item = QGraphicsRectItem(0, 0, 10, 10)
+    item.setZValue(z)
+    return item
+
+def reference_order(scene):
+    """What the old full re-sort produced: stable sort of insertion order by z."""
+    return sorted(scene.items_list, key=lambda i: i.zValue())
+
+class TestZOrder(unittest.TestCase):
+    def setUp(self):
+        self.scene = QGraphicsScene()
+
+    def test_equal_z_keeps_insertion_order(self):
+        items = [make_item() for _ in range(5)]
+        for item in items: self.scene.addItem(item)
+        self.assertEqual(self.scene.items(), items)
+        items[1].setZValue(1)
+        items[1].setZValue(0)  # Back to its old place, not to the end
+        self.assertEqual(self.scene.items(), items)
+
+    def test_bring_to_front_does_not_resort(self):
+        items = [make_item(i % 7) for i in range(200)]
+        for item in items: self.scene.addItem(item)
+        with patch('gameqt.graphics.sorted', create=True, side_effect=AssertionError("full sort")):
+            top = max(i.zValue() for i in self.scene.items())
+            items[3].setZValue(top + 1)
+            self.assertIs(self.scene.items()[-1], items[3])
+            self.scene.removeItem(items[50])
+            self.scene.addItem(make_item(2))
+        self.assertEqual(self.scene.items(), reference_order(self.scene))
+
+    def test_random_operations_match_full_sort(self):
+        rng = random.Random(3)
+        live = []
+        for _ in range(2000):
+            op = rng.random()
+            if op < 0.4 or not live:
+                item = make_item(rng.randint(-3, 3))
+                self.scene.addItem(item)
+                live.append(item)
+            elif op < 0.8:
+                rng.choice(live).setZValue(rng.choice([-3, 0, 1.5, 3]))
+            else:
+                item = live.pop(rng.randrange(len(live)))
+                self.scene.removeItem(item)
+                item.setZValue(9)  # Detached items no longer touch the scene
+        self.assertEqual(self.scene.items(), reference_order(self.scene))
+        self.assertEqual(self.scene._z_keys, [(i.zValue(), i._scene_seq) for i in self.scene.items()])
+
+    def test_add_items_merges_in_order(self):
+        first = [make_item(z) for z in (0, 2, 4)]
+        self.scene.addItems(first)
+        batch = [make_item(z) for z in (3, 0, 5, 2, 0)]
+        self.scene.addItems(batch + [first[0]])  # Already in the scene: ignored
+        self.assertEqual(len(self.scene.items()), 8)
+        self.assertEqual(self.scene.items(), reference_order(self.scene))
+        self.assertEqual([i.zValue() for i in self.scene.items()], [0, 0, 0, 2, 2, 3, 4, 5])
+
+    def test_items_is_a_snapshot(self):
+        items = [make_item() for _ in range(6)]
+        self.scene.addItems(items)
+        for item in self.scene.items(): self.scene.removeItem(item)
+        self.assertEqual(self.scene.items(), [])
+
+    def test_moving_between_scenes_and_clear(self):
+        item = make_item()
+        other = QGraphicsScene()
+        self.scene.addItem(item)
+        self.scene.addItem(item)
+        self.assertEqual(self.scene.items(), [item])
+        other.addItem(item)
+        self.assertEqual(self.scene.items(), [])
+        self.assertIs(item.scene(), other)
+        other.clear()
+        self.assertIsNone(item.scene())
+
+if __name__ == '__main__':
+    unittest.main()